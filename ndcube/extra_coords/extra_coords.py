@@ -12,8 +12,8 @@ from astropy.wcs.wcsapi import BaseHighLevelWCS
 from astropy.wcs.wcsapi.high_level_wcs_wrapper import HighLevelWCSWrapper
 from astropy.wcs.wcsapi.wrappers.sliced_wcs import SlicedLowLevelWCS, sanitize_slices
 
-from ndcube.utils.wcs import convert_between_array_and_pixel_axes
-from ndcube.wcs.wrappers import CompoundLowLevelWCS, ResampledLowLevelWCS
+from ndcube.utils.wcs import convert_between_array_and_pixel_axes, resample_wcs
+from ndcube.wcs.wrappers import CompoundLowLevelWCS
 
 from .table_coord import (BaseTableCoordinate, MultipleTableCoordinate, QuantityTableCoordinate,
                           SkyCoordTableCoordinate, TimeTableCoordinate)
@@ -149,6 +149,16 @@ class ExtraCoords(ExtraCoordsABC):
         # We need a reference to the parent NDCube
         self._ndcube = ndcube
 
+    def __copy__(self):
+        # Copy the containers of the coordinates but share the coordinates themselves,
+        # so coordinates can be added to the copy without copying any lookup tables.
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new._lookup_tables = list(self._lookup_tables)
+        new._dropped_tables = list(self._dropped_tables)
+        new._ndcube = None
+        return new
+
     @classmethod
     def from_lookup_tables(cls, names, pixel_dimensions, lookup_tables, physical_types=None):
         """
@@ -226,6 +236,17 @@ class ExtraCoords(ExtraCoordsABC):
         # Sort the LUTs so that the mapping and the wcs are ordered in pixel dim order
         self._lookup_tables = list(sorted(self._lookup_tables,
                                           key=lambda x: x[0] if isinstance(x[0], Integral) else x[0][0]))
+        self._clear_ndcube_cache()
+
+    def _clear_ndcube_cache(self):
+        """
+        Clear the coordinates cached by the parent cube as they may now be stale.
+        """
+        cache = getattr(self._ndcube, "_world_coords_cache", None)
+        if cache is not None:
+            cache.clear()
+        if getattr(self._ndcube, "_derived_coords_cache", None) is not None:
+            self._ndcube._derived_coords_cache = None
 
     @property
     def _name_lut_map(self):
@@ -276,6 +297,7 @@ class ExtraCoords(ExtraCoordsABC):
                 )
 
         self._mapping = mapping
+        self._clear_ndcube_cache()
 
     @property
     def wcs(self):
@@ -311,6 +333,7 @@ class ExtraCoords(ExtraCoordsABC):
                 )
 
         self._wcs = wcs
+        self._clear_ndcube_cache()
 
     @property
     def is_empty(self):
@@ -379,7 +402,11 @@ class ExtraCoords(ExtraCoordsABC):
         if len(item) == self.wcs.pixel_n_dim and all(isinstance(i, Integral) for i in item):
             return type(self)()
 
-        subwcs = self.wcs[item]
+        if hasattr(self.wcs, "__getitem__"):
+            subwcs = self.wcs[item]
+        else:
+            # Slicing a sliced WCS composes the slices into a single wrapper.
+            subwcs = HighLevelWCSWrapper(SlicedLowLevelWCS(self.wcs.low_level_wcs, item))
 
         new_mapping = [self.mapping[i] for i, subitem in enumerate(item) if not isinstance(subitem, Integral)]
 
@@ -421,7 +448,7 @@ class ExtraCoords(ExtraCoordsABC):
 
         return dict()
 
-    def resample(self, factor, offset=0, ndcube=None, **kwargs):
+    def resample(self, factor, offset=0, ndcube=None, rounding=None, **kwargs):
         """
         Resample all extra coords by given factors in array-index-space.
 
@@ -443,6 +470,12 @@ class ExtraCoords(ExtraCoordsABC):
         ndcube: `~ndcube.NDCube`
             The NDCube instance with which the output ExtraCoords object is associated.
 
+        rounding: `str`, optional
+            How to handle array axes whose length is not a multiple of the factor.
+            If ``"floor"``, underlying elements which do not fill a whole resampled
+            element are discarded. If ``"ceil"`` or `None` (default), they are
+            included as a partial element.
+
         kwargs
             All remaining kwargs are passed to `numpy.interp`.
 
@@ -476,10 +509,14 @@ class ExtraCoords(ExtraCoordsABC):
             raise ValueError(
                 "offset must be scalar or an iterable with length equal to number of cube "
                 f"dimensions: len(offset) = {len(offset)}; No. cube dimensions = {ndim}.")
+        if rounding not in (None, "floor", "ceil"):
+            raise ValueError(f"rounding must be None, 'floor' or 'ceil', not {rounding!r}.")
         # If ExtraCoords object built on WCS, resample using WCS insfrastructure
         if self._wcs is not None:
-            new_ec.wcs = HighLevelWCSWrapper(ResampledLowLevelWCS(self._wcs.low_level_wcs,
-                                                                  factor, offset))
+            new_ec.wcs = HighLevelWCSWrapper(resample_wcs(self._wcs.low_level_wcs,
+                                                          factor, offset, rounding=rounding))
+            if self._mapping:
+                new_ec.mapping = self._mapping
             return new_ec
         # Else interpolate the lookup table coordinates.
         factor = np.asarray(factor)
@@ -487,6 +524,8 @@ class ExtraCoords(ExtraCoordsABC):
         for c, d, f in zip(offset, cube_shape, factor):
             x = np.arange(c, d+f, f)
             x = x[x <= d-1]
+            if rounding == "floor":
+                x = x[:int(np.floor((d - c) / f))]
             new_grids.append(x)
         new_grids = np.array(new_grids, dtype=object)
         for array_axes, coord in self._lookup_tables:
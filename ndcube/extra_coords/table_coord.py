@@ -102,6 +102,225 @@ class InverseLength1Tabular(Length1Tabular):
         return super().evaluate(x)
 
 
+class LinearTabular1D(_Tabular):
+    """A 1-D Tabular model which linearly interpolates a lookup table with numpy.
+
+    This gives the same results as a linear `~astropy.modeling.models.Tabular1D`
+    which does not raise bounds errors. However, it is much faster as it locates
+    the inputs in the table with `numpy.searchsorted`, or directly if the points
+    are the integers from zero, rather than through `scipy.interpolate.interpn`.
+    The points must be ascending.
+    """
+    _separable = True
+
+    n_inputs = 1
+    n_outputs = 1
+
+    lookup_table = np.zeros([2])
+
+    def __init__(self, points=None, lookup_table=None, method='linear', bounds_error=False,
+                 fill_value=np.nan, **kwargs):
+        if method != 'linear' or bounds_error or fill_value is None:
+            raise ValueError("LinearTabular1D only supports linear interpolation "
+                             "with a fill value and no bounds errors.")
+        super().__init__(points=points, lookup_table=lookup_table, method=method,
+                         bounds_error=bounds_error, fill_value=fill_value, **kwargs)
+        points = self.points[0]
+        if len(points) < 2:
+            raise ValueError("lookup_table must have at least 2 elements.")
+        if not np.all(np.diff(points) > 0):
+            raise ValueError("points must be strictly ascending.")
+        self._points_unit = getattr(points, "unit", None)
+        self._points_values = np.asarray(u.Quantity(points).value, dtype=float)
+        self._table_unit = getattr(self.lookup_table, "unit", None)
+        self._table_values = np.asarray(u.Quantity(self.lookup_table).value)
+        # If the points are 0, 1, 2, ... the table index of an input is its integer part.
+        self._integer_points = np.array_equal(self._points_values, np.arange(len(points)))
+        # gWCS requests the inverse on every call so it is cached.
+        self._cached_inverse = None
+
+    def evaluate(self, x):
+        # When calling evaluate with a bounding box, astropy strips the units.
+        if self._points_unit is not None:
+            x = u.Quantity(x, unit=self._points_unit, copy=False).value
+        x = np.asarray(x, dtype=float)
+        shape = x.shape
+        x = x.ravel()
+        points = self._points_values
+        table = self._table_values
+        # Find the index of the lower point of the interval containing each input,
+        # and the fractional distance of the input along that interval.
+        if self._integer_points:
+            # fmin and fmax replace NaN indices so that NaN inputs give NaN outputs.
+            idx = np.floor(x)
+            np.fmin(idx, len(points) - 2, out=idx)
+            np.fmax(idx, 0, out=idx)
+            t = x - idx
+            idx = idx.astype(np.intp)
+        else:
+            idx = np.searchsorted(points, x)
+            np.subtract(idx, 1, out=idx)
+            np.minimum(idx, len(points) - 2, out=idx)
+            np.maximum(idx, 0, out=idx)
+            lower = points[idx]
+            t = (x - lower) / (points[idx + 1] - lower)
+        # Evaluate in the same way as scipy so that the results are identical.
+        result = table[idx] * (1 - t)
+        result += table[idx + 1] * t
+        result[(x < points[0]) | (x > points[-1])] = self.fill_value
+        result = result.reshape(shape)
+        if self._table_unit is not None:
+            result = result * self._table_unit
+        return result
+
+    @property
+    def inverse(self):
+        if self._cached_inverse is not None:
+            return self._cached_inverse
+        # If the lookup table is descending instead of ascending, both
+        # points and lookup_table need to be reversed in the inverse transform.
+        if np.all(np.diff(self._table_values) > 0):
+            points = self.lookup_table
+            lookup_table = self.points[0]
+        elif np.all(np.diff(self._table_values) < 0):
+            points = self.lookup_table[::-1]
+            lookup_table = self.points[0][::-1]
+        else:
+            # equal-valued or double-valued lookup_table
+            raise NotImplementedError
+        self._cached_inverse = type(self)(points=points, lookup_table=lookup_table,
+                                          method=self.method, bounds_error=self.bounds_error,
+                                          fill_value=self.fill_value)
+        return self._cached_inverse
+
+
+class AffineTabular1D(_Tabular):
+    """A 1-D Tabular model of a regularly spaced lookup table.
+
+    Only the first and last points and lookup table values, and the number of
+    elements, are stored. Inputs are converted with the linear transform through
+    these end values, so creating, evaluating and inverting the model do not
+    depend on the size of the table. The ``points`` and ``lookup_table`` are
+    regenerated with `numpy.linspace` when accessed.
+
+    Parameters
+    ----------
+    points_bounds: `astropy.units.Quantity`
+        The first and last points.
+    lookup_table_bounds: `astropy.units.Quantity`
+        The first and last values of the lookup table.
+    size: `int`
+        The number of elements in the lookup table.
+
+    Other parameters are defined by the parent class.
+    Only linear interpolation with a fill value and no bounds errors is supported.
+    """
+    _separable = True
+
+    n_inputs = 1
+    n_outputs = 1
+
+    def __init__(self, points_bounds, lookup_table_bounds, size, method='linear',
+                 bounds_error=False, fill_value=np.nan, **kwargs):
+        if method != 'linear' or bounds_error or fill_value is None:
+            raise ValueError("AffineTabular1D only supports linear interpolation "
+                             "with a fill value and no bounds errors.")
+        if size < 2:
+            raise ValueError("size must be at least 2.")
+        # The parent class initializer is bypassed as it requires the full lookup table.
+        super(_Tabular, self).__init__(**kwargs)
+        self.outputs = ("y",)
+        self._points_unit = getattr(points_bounds, "unit", None)
+        self._points_bounds = np.asarray(u.Quantity(points_bounds).value, dtype=float)
+        self._table_unit = getattr(lookup_table_bounds, "unit", None)
+        self._table_bounds = np.asarray(u.Quantity(lookup_table_bounds).value, dtype=float)
+        if self._points_bounds[0] == self._points_bounds[1]:
+            raise ValueError("points_bounds must not be equal.")
+        if isinstance(fill_value, u.Quantity):
+            fill_value = fill_value.to_value(self._table_unit)
+        self._size = int(size)
+        self.method = method
+        self.bounds_error = bounds_error
+        self.fill_value = fill_value
+        # gWCS requests the inverse on every call so it is cached.
+        self._cached_inverse = None
+
+    @staticmethod
+    def _linspace(bounds, size, unit):
+        values = np.linspace(bounds[0], bounds[1], size)
+        return values if unit is None else values * unit
+
+    @property
+    def points(self):
+        return (self._linspace(self._points_bounds, self._size, self._points_unit),)
+
+    @property
+    def lookup_table(self):
+        return self._linspace(self._table_bounds, self._size, self._table_unit)
+
+    @property
+    def input_units(self):
+        if self._points_unit is None:
+            return None
+        return {x: self._points_unit for x in self.inputs}
+
+    @property
+    def return_units(self):
+        if self._table_unit is None:
+            return None
+        return {self.outputs[0]: self._table_unit}
+
+    def evaluate(self, x):
+        # When calling evaluate with a bounding box, astropy strips the units.
+        if self._points_unit is not None:
+            x = u.Quantity(x, unit=self._points_unit, copy=False).value
+        x = np.asarray(x, dtype=float)
+        x0, x1 = self._points_bounds
+        y0, y1 = self._table_bounds
+        result = y0 + (x - x0) * ((y1 - y0) / (x1 - x0))
+        result = np.where((x < min(x0, x1)) | (x > max(x0, x1)), self.fill_value, result)
+        if self._table_unit is not None:
+            result = result * self._table_unit
+        return result
+
+    @property
+    def inverse(self):
+        if self._cached_inverse is not None:
+            return self._cached_inverse
+        if self._table_bounds[0] == self._table_bounds[1]:
+            # equal-valued lookup_table
+            raise NotImplementedError
+        table_bounds = self._table_bounds
+        if self._table_unit is not None:
+            table_bounds = table_bounds * self._table_unit
+        points_bounds = self._points_bounds
+        if self._points_unit is not None:
+            points_bounds = points_bounds * self._points_unit
+        self._cached_inverse = type(self)(table_bounds, points_bounds, self._size,
+                                          method=self.method, bounds_error=self.bounds_error,
+                                          fill_value=self.fill_value)
+        return self._cached_inverse
+
+
+def _is_regularly_spaced(values, rtol=1e-9):
+    """
+    Determine whether a 1-D array is regularly spaced.
+
+    The array is regularly spaced if each element differs from the corresponding
+    element of the `numpy.linspace` between its first and last elements by no more
+    than ``rtol`` times the spacing. Arrays with fewer than two elements, or whose
+    first and last elements are equal, are not regularly spaced.
+    """
+    values = u.Quantity(values).value
+    if values.ndim != 1 or len(values) < 2:
+        return False
+    step = (values[-1] - values[0]) / (len(values) - 1)
+    if not np.isfinite(step) or step == 0:
+        return False
+    expected = np.linspace(values[0], values[-1], len(values))
+    return bool(np.all(np.abs(values - expected) <= rtol * abs(step)))
+
+
 def _generate_generic_frame(naxes, unit, names=None, physical_types=None):
     """
     Generate a simple frame, where all axes have the same type and unit.
@@ -127,14 +346,29 @@ def _generate_generic_frame(naxes, unit, names=None, physical_types=None):
                               axes_names=names, name=name, axis_physical_types=physical_types)
 
 
-def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, **kwargs):
+def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, regular=False,
+                      **kwargs):
     """
     Generate a Tabular model class and instance.
+
+    If ``regular`` is `True`, the caller has determined that ``lookup_table`` is
+    regularly spaced and, where possible, an `AffineTabular1D` is generated.
     """
     if not isinstance(lookup_table, u.Quantity):
         raise TypeError("lookup_table must be a Quantity.")  # pragma: no cover
 
     ndim = lookup_table.ndim
+    kwargs = {'bounds_error': False,
+              'fill_value': np.nan,
+              'method': interpolation,
+              **kwargs}
+    linear_1d = (ndim == 1 and kwargs['method'] == 'linear'
+                 and not kwargs['bounds_error'] and kwargs['fill_value'] is not None)
+
+    if regular and linear_1d and len(lookup_table) > 1:
+        return _generate_affine_tabular(lookup_table[[0, -1]], len(lookup_table),
+                                        points_unit=points_unit, **kwargs)
+
     TabularND = tabular_model(ndim, name=f"Tabular{ndim}D")
 
     # The integer location is at the centre of the pixel.
@@ -142,13 +376,11 @@ def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, *
     if len(points) == 1:
         points = points[0]
 
-    kwargs = {'bounds_error': False,
-              'fill_value': np.nan,
-              'method': interpolation,
-              **kwargs}
-
     if len(lookup_table) == 1:
         t = Length1Tabular(points, lookup_table, **kwargs)
+    elif linear_1d:
+        t = LinearTabular1D(points, lookup_table, **kwargs)
+        t.bounding_box = None
     else:
         t = TabularND(points, lookup_table, **kwargs)
 
@@ -159,13 +391,28 @@ def _generate_tabular(lookup_table, interpolation='linear', points_unit=u.pix, *
     return t
 
 
-def _generate_compound_model(*lookup_tables, mesh=True):
+def _generate_affine_tabular(lookup_table_bounds, size, points_unit=u.pix, **kwargs):
+    """
+    Generate an AffineTabular1D from the first and last values of a regularly spaced table.
+    """
+    # The integer location is at the centre of the pixel.
+    points_bounds = [0, size - 1] * points_unit
+    t = AffineTabular1D(points_bounds, lookup_table_bounds, size, **kwargs)
+    t.bounding_box = None
+    return t
+
+
+def _generate_compound_model(*lookup_tables, mesh=True, regular=None):
     """
     Takes a set of quantities and returns a ND compound model.
+
+    ``regular`` optionally gives whether each quantity is regularly spaced.
     """
-    model = _generate_tabular(lookup_tables[0])
-    for lt in lookup_tables[1:]:
-        model = model & _generate_tabular(lt)
+    if regular is None:
+        regular = [False] * len(lookup_tables)
+    model = _generate_tabular(lookup_tables[0], regular=regular[0])
+    for lt, reg in zip(lookup_tables[1:], regular[1:]):
+        model = model & _generate_tabular(lt, regular=reg)
 
     if mesh:
         return model
@@ -175,11 +422,11 @@ def _generate_compound_model(*lookup_tables, mesh=True):
     return models.Mapping(mapping) | model
 
 
-def _model_from_quantity(lookup_tables, mesh=False):
+def _model_from_quantity(lookup_tables, mesh=False, regular=None):
     if len(lookup_tables) > 1:
-        return _generate_compound_model(*lookup_tables, mesh=mesh)
+        return _generate_compound_model(*lookup_tables, mesh=mesh, regular=regular)
 
-    return _generate_tabular(lookup_tables[0])
+    return _generate_tabular(lookup_tables[0], regular=bool(regular and regular[0]))
 
 
 class BaseTableCoordinate(abc.ABC):
@@ -324,6 +571,8 @@ class QuantityTableCoordinate(BaseTableCoordinate):
         self.unit = tables[0].unit
 
         super().__init__(*tables, mesh=True, names=names, physical_types=physical_types)
+        # Whether each table is regularly spaced. None means not yet determined.
+        self._regular = [None] * ndim
 
     def _slice_table(self, i, table, item, new_components, whole_slice):
         """
@@ -352,6 +601,8 @@ class QuantityTableCoordinate(BaseTableCoordinate):
             return
 
         new_components["tables"].append(table[item])
+        # Slicing a regularly spaced table with a slice leaves it regularly spaced.
+        new_components["regular"].append(self._regular[i] if isinstance(item, slice) else None)
         if self.names:
             new_components["names"].append(self.names[i])
         if self.physical_types:
@@ -374,8 +625,17 @@ class QuantityTableCoordinate(BaseTableCoordinate):
 
         ret_table = type(self)(*new_components["tables"], names=names, physical_types=physical_types)
         ret_table._dropped_world_dimensions = new_components["dropped_world_dimensions"]
+        ret_table._regular = new_components["regular"]
         return ret_table
 
+    def _regular_tables(self):
+        """
+        Whether each table is regularly spaced, determining it if not already known.
+        """
+        self._regular = [_is_regularly_spaced(t) if regular is None else regular
+                         for regular, t in zip(self._regular, self.table)]
+        return self._regular
+
     @property
     def n_inputs(self):
         return len(self.table)
@@ -395,7 +655,7 @@ class QuantityTableCoordinate(BaseTableCoordinate):
         """
         Generate the Astropy Model for this LookupTable.
         """
-        return _model_from_quantity(self.table, True)
+        return _model_from_quantity(self.table, True, regular=self._regular_tables())
 
     @property
     def ndim(self):
@@ -448,12 +708,17 @@ class QuantityTableCoordinate(BaseTableCoordinate):
                 f"A new array grid must be given for each array axis/table, i.e. {ndim}")
         if any(new_grid.shape != new_array_grids[0].shape for new_grid in new_array_grids):
             raise ValueError("New array grids must all be same shape.")
-        # Build array grids for non-interpolated table.
-        old_array_grids = tuple(np.arange(d) for d in self.shape)
         # Iterate through tables and interpolate each.
-        new_tables = [
-            np.interp(new_grid, old_grid, t.value, **kwargs) * t.unit
-            for new_grid, old_grid, t in zip(new_array_grids, old_array_grids, self.table)]
+        new_tables = []
+        for new_grid, t, regular in zip(new_array_grids, self.table, self._regular_tables()):
+            if regular and not kwargs and len(t) > 1:
+                # Regularly spaced tables are evaluated directly from their
+                # first value and spacing, clipped to the table like numpy.interp.
+                new_grid = np.clip(new_grid, 0, len(t) - 1)
+                new_tables.append(t[0] + (t[-1] - t[0]) / (len(t) - 1) * new_grid)
+            else:
+                old_grid = np.arange(len(t))
+                new_tables.append(np.interp(new_grid, old_grid, t.value, **kwargs) * t.unit)
         # Rebuild return interpolated coord.
         new_coord = type(self)(*new_tables, names=self.names, physical_types=self.physical_types)
         new_coord._dropped_world_dimensions = self._dropped_world_dimensions
@@ -717,15 +982,31 @@ class TimeTableCoordinate(BaseTableCoordinate):
         super().__init__(*tables, mesh=False, names=names, physical_types=physical_types)
         self.table = self.table[0]
         self.reference_time = reference_time or self.table[0]
+        # Whether the table is regularly spaced. None means not yet determined.
+        self._regular = None
 
     def __getitem__(self, item):
         if not (isinstance(item, (slice, Integral)) or len(item) == 1):
             raise ValueError("Can not slice with incorrect length")
 
-        return type(self)(self.table[item],
-                          names=self.names,
-                          physical_types=self.physical_types,
-                          reference_time=self.reference_time)
+        new_coord = type(self)(self.table[item],
+                               names=self.names,
+                               physical_types=self.physical_types,
+                               reference_time=self.reference_time)
+        if isinstance(item, tuple):
+            item = item[0]
+        # Slicing a regularly spaced table with a slice leaves it regularly spaced.
+        if isinstance(item, slice):
+            new_coord._regular = self._regular
+        return new_coord
+
+    def _is_regular(self):
+        """
+        Whether the table is regularly spaced, determining it if not already known.
+        """
+        if self._regular is None:
+            self._regular = _is_regularly_spaced((self.table - self.reference_time).to(u.s))
+        return self._regular
 
     @property
     def n_inputs(self):
@@ -750,6 +1031,10 @@ class TimeTableCoordinate(BaseTableCoordinate):
         Generate the Astropy Model for this LookupTable.
         """
         time = self.table
+        if self._is_regular() and len(time) > 1:
+            # Only the first and last times are needed to model a regularly spaced table.
+            deltas = (time[[0, -1]] - self.reference_time).to(u.s)
+            return _generate_affine_tabular(deltas, len(time))
         deltas = (time - self.reference_time).to(u.s)
 
         return _model_from_quantity((deltas,), mesh=False)
@@ -7,6 +7,7 @@ import pytest
 from astropy.coordinates import SkyCoord
 from astropy.time import Time, TimeDelta
 from astropy.wcs import WCS
+from astropy.wcs.wcsapi import SlicedLowLevelWCS
 
 from ndcube import NDCube
 from ndcube.extra_coords.extra_coords import ExtraCoords
@@ -530,6 +531,18 @@ def test_resample_scalar_factor(time_lut, wave_lut, ndcube_4d_ln_lt_l_t):
                        expected_wave.value)
 
 
+@pytest.mark.parametrize(("rounding", "expected_wave"),
+                         [(None, [10, 13, 16, 19]), ("ceil", [10, 13, 16, 19]), ("floor", [10, 13, 16])])
+def test_resample_rounding(wave_lut, ndcube_4d_ln_lt_l_t, rounding, expected_wave):
+    cube = ndcube_4d_ln_lt_l_t[:4, 0]
+    ec = ExtraCoords(ndcube=cube)
+    ec.add("wave", 1, wave_lut)
+
+    output = ec.resample((1, 3, 1), ndcube=cube, rounding=rounding)
+
+    assert u.allclose(output._lookup_tables[0][1].table[0], expected_wave * u.nm)
+
+
 def test_resample_errors(time_lut, wave_lut, ndcube_4d_ln_lt_l_t):
     # Build ExtraCoord to test.
     cube = ndcube_4d_ln_lt_l_t[:4, 0]  # Slice cube to dimensions needed for our extra coords.
@@ -561,6 +574,20 @@ def test_resample_wcs(wcs_1d_l):
     assert all(output.wcs.low_level_wcs._offset == np.asarray(offset))
 
 
+def test_slice_resampled_wcs(wcs_1d_l):
+    ec = ExtraCoords()
+    ec.wcs = wcs_1d_l
+    ec.mapping = (0,)
+    resampled_ec = ec.resample([2])
+    output = resampled_ec[1:][2:]
+
+    # Slicing twice composes into a single slice of the resampled WCS.
+    assert isinstance(output.wcs.low_level_wcs, SlicedLowLevelWCS)
+    assert output.wcs.low_level_wcs._wcs is resampled_ec.wcs.low_level_wcs
+    assert output.mapping == [0]
+    assert u.allclose(output.wcs.pixel_to_world(0), resampled_ec.wcs.pixel_to_world(3))
+
+
 def test_length1_extra_coord(wave_lut):
     # This test hits a bug that existed in gwcs less than 0.16.1
     pytest.importorskip("gwcs", minversion="0.16.1")
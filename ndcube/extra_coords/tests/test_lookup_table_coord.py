@@ -3,9 +3,11 @@ import gwcs.coordinate_frames as cf
 import numpy as np
 import pytest
 from astropy.coordinates import SkyCoord
+from astropy.modeling.models import Tabular1D
 from astropy.time import Time
 
-from ndcube.extra_coords.table_coord import (MultipleTableCoordinate, QuantityTableCoordinate,
+from ndcube.extra_coords.table_coord import (AffineTabular1D, LinearTabular1D,
+                                             MultipleTableCoordinate, QuantityTableCoordinate,
                                              SkyCoordTableCoordinate, TimeTableCoordinate)
 
 
@@ -122,6 +124,107 @@ def test_exceptions():
     assert "All arguments must be BaseTableCoordinate" in str(ei)
 
 
+@pytest.mark.parametrize("points", (np.arange(20) * u.pix, np.geomspace(1, 100, 20) * u.pix))
+@pytest.mark.parametrize("lookup_table", (np.cumsum(np.linspace(1, 3, 20)) * u.nm,
+                                          -np.cumsum(np.linspace(1, 3, 20)) * u.nm))
+def test_linear_tabular_1d(points, lookup_table):
+    kwargs = {"bounds_error": False, "fill_value": np.nan}
+    model = LinearTabular1D(points, lookup_table, **kwargs)
+    expected_model = Tabular1D(points, lookup_table, **kwargs)
+    x = np.concatenate([np.linspace(-5, 105, 1003), [np.nan], points.value]).reshape(-1, 2) * u.pix
+    output = model(x)
+    expected = expected_model(x)
+    assert output.unit == expected.unit
+    assert output.shape == expected.shape
+    np.testing.assert_array_equal(output.value, expected.value)
+    assert u.allclose(model(points[3]), lookup_table[3])
+
+    world = np.linspace(lookup_table.min() - 1 * u.nm, lookup_table.max() + 1 * u.nm, 1001)
+    output = model.inverse(world)
+    expected = expected_model.inverse(world)
+    assert isinstance(model.inverse, LinearTabular1D)
+    np.testing.assert_array_equal(output.value, expected.value)
+
+
+def test_linear_tabular_1d_model():
+    model = QuantityTableCoordinate(np.geomspace(1, 100, 10) * u.km).model
+    assert isinstance(model, LinearTabular1D)
+    with pytest.raises(NotImplementedError):
+        LinearTabular1D(lookup_table=[0, 1, 1] * u.m).inverse
+    with pytest.raises(ValueError, match="only supports linear"):
+        LinearTabular1D(lookup_table=[0, 1, 2] * u.m, method="nearest")
+    with pytest.raises(ValueError, match="strictly ascending"):
+        LinearTabular1D([2, 1, 0] * u.pix, [0, 1, 2] * u.m)
+
+
+@pytest.mark.parametrize("lookup_table", (np.linspace(500, 600, 20) * u.nm,
+                                          np.linspace(600, 500, 20) * u.nm))
+def test_affine_tabular_1d(lookup_table):
+    points = np.arange(20) * u.pix
+    kwargs = {"bounds_error": False, "fill_value": np.nan}
+    model = AffineTabular1D(points[[0, -1]], lookup_table[[0, -1]], 20, **kwargs)
+    expected_model = Tabular1D(points, lookup_table, **kwargs)
+    assert u.allclose(model.points[0], points)
+    assert u.allclose(model.lookup_table, lookup_table)
+    x = np.concatenate([np.linspace(-5, 25, 1003), [np.nan], points.value]).reshape(-1, 2) * u.pix
+    output = model(x)
+    expected = expected_model(x)
+    assert output.unit == expected.unit
+    assert output.shape == expected.shape
+    np.testing.assert_allclose(output.value, expected.value, rtol=1e-12)
+    assert u.allclose(model(points[-1]), lookup_table[-1])
+
+    world = np.linspace(lookup_table.min() - 1 * u.nm, lookup_table.max() + 1 * u.nm, 1001)
+    output = model.inverse(world)
+    expected = expected_model.inverse(world)
+    assert isinstance(model.inverse, AffineTabular1D)
+    np.testing.assert_allclose(output.value, expected.value, rtol=1e-12, atol=1e-12)
+    assert u.allclose(model.inverse(lookup_table[[0, -1]]), points[[0, -1]])
+
+
+def test_affine_tabular_1d_model():
+    lookup_table = np.linspace(500, 600, 21) * u.nm
+    lookup_table[5] += 1e-10 * u.nm
+    coord = QuantityTableCoordinate(lookup_table)
+    assert isinstance(coord.model, AffineTabular1D)
+    assert coord._regular == [True]
+    # Slices of a regularly spaced table are known to be regularly spaced.
+    sliced = coord[2:15:3]
+    assert sliced._regular == [True]
+    assert isinstance(sliced.model, AffineTabular1D)
+    assert u.allclose(sliced.model(np.arange(5) * u.pix), lookup_table[2:15:3])
+    assert coord[(np.array([0, 1, 5]),)]._regular == [None]
+
+    lookup_table[5] += 1e-6 * u.nm
+    assert isinstance(QuantityTableCoordinate(lookup_table).model, LinearTabular1D)
+    with pytest.raises(ValueError, match="only supports linear"):
+        AffineTabular1D([0, 1] * u.pix, [0, 1] * u.m, 2, method="nearest")
+    with pytest.raises(ValueError, match="at least 2"):
+        AffineTabular1D([0, 0] * u.pix, [0, 0] * u.m, 1)
+
+
+def test_affine_time_table_model():
+    times = Time("2000-01-01T00:00:00") + np.arange(0, 1000, 10) * u.s
+    coord = TimeTableCoordinate(times)
+    model = coord.model
+    assert isinstance(model, AffineTabular1D)
+    assert u.allclose(model(np.arange(100) * u.pix), np.arange(0, 1000, 10) * u.s)
+    assert u.allclose(model.inverse(985 * u.s), 98.5 * u.pix)
+    assert np.isnan(model.inverse(995 * u.s))
+    assert coord[10:]._regular
+    assert u.allclose(coord[10:].model(0 * u.pix), 100 * u.s)
+    assert isinstance(TimeTableCoordinate(times[[0, 1, 3]]).model, LinearTabular1D)
+
+
+def test_interpolate_regular(lut_1d_distance):
+    new_array_grids = np.array([-1, 0.5, 3.25, 9, 12])
+    new_coord = lut_1d_distance.interpolate(new_array_grids)
+    assert u.allclose(new_coord.table[0], [0, 0.5, 3.25, 9, 9] * u.km)
+    irregular = QuantityTableCoordinate(np.geomspace(1, 100, 10) * u.km)
+    expected = np.interp(new_array_grids, np.arange(10), irregular.table[0].value) * u.km
+    assert u.allclose(irregular.interpolate(new_array_grids).table[0], expected)
+
+
 def test_1d_distance(lut_1d_distance):
     assert lut_1d_distance.model.n_inputs == 1
     assert lut_1d_distance.model.n_outputs == 1
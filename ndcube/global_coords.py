@@ -86,6 +86,16 @@ class GlobalCoords(GlobalCoordsABC):
         super().__init__()
         self._ndcube = ndcube
         self._internal_coords = OrderedDict()
+        self._all_coords_cache = None
+
+    def __copy__(self):
+        # Copy the mapping of coordinates but share the coordinate objects.
+        new = type(self).__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new._internal_coords = OrderedDict(self._internal_coords)
+        new._ndcube = None
+        new._all_coords_cache = None
+        return new
 
     @staticmethod
     def _convert_dropped_to_internal(dropped_dimensions):
@@ -154,11 +164,31 @@ class GlobalCoords(GlobalCoordsABC):
     @property
     def _all_coords(self):
         """
-        A dynamic dictionary of all global coordinates, stored here or derived
+        A dictionary of all global coordinates, stored here or derived
         from the ndcube object.
         """
         if self._ndcube is None:
             return self._internal_coords
+        return self._cached_all_coords()[0]
+
+    def _cached_all_coords(self):
+        """
+        Return all global coordinates and the names of the coordinates of each physical type.
+
+        Deriving coordinates from the ndcube is expensive so the results are cached until
+        the wcs or extra coords of the ndcube are replaced, or the stored coordinates change.
+        The stored coordinates are compared by identity as they can be shared between cubes.
+        """
+        extra_coords = self._ndcube._existing_extra_coords
+        state = (self._ndcube.wcs, extra_coords, tuple(self._internal_coords.items()))
+        cache = self._all_coords_cache
+        if cache is not None:
+            old_state = cache[0]
+            if (state[0] is old_state[0] and state[1] is old_state[1]
+                    and len(state[2]) == len(old_state[2])
+                    and all(new[0] == old[0] and new[1] is old[1]
+                            for new, old in zip(state[2], old_state[2]))):
+                return cache[1], cache[2]
 
         all_coords = {**self._internal_coords}
 
@@ -168,11 +198,17 @@ class GlobalCoords(GlobalCoordsABC):
                 wcs_dropped = self._convert_dropped_to_internal(dropped_world)
                 all_coords.update(wcs_dropped)
 
-        ec_dropped = self._ndcube.extra_coords.dropped_world_dimensions
-        if "value" in ec_dropped:
-            all_coords.update(self._convert_dropped_to_internal(ec_dropped))
+        if extra_coords is not None:
+            ec_dropped = extra_coords.dropped_world_dimensions
+            if "value" in ec_dropped:
+                all_coords.update(self._convert_dropped_to_internal(ec_dropped))
+
+        physical_type_index = defaultdict(list)
+        for name, (physical_type, _) in all_coords.items():
+            physical_type_index[physical_type].append(name)
 
-        return all_coords
+        self._all_coords_cache = (state, all_coords, dict(physical_type_index))
+        return all_coords, self._all_coords_cache[2]
 
     def add(self, name, physical_type, coord):
         # Docstring in GlobalCoordsABC
@@ -209,17 +245,24 @@ class GlobalCoords(GlobalCoordsABC):
             A new object storing just the coordinates with the given physical type.
         """
         gc = GlobalCoords()
-        gc._internal_coords = dict(filter(lambda x: x[1][0] == physical_type, self._all_coords.items()))
+        if self._ndcube is None:
+            gc._internal_coords = dict(filter(lambda x: x[1][0] == physical_type,
+                                              self._internal_coords.items()))
+        else:
+            all_coords, physical_type_index = self._cached_all_coords()
+            gc._internal_coords = {name: all_coords[name]
+                                   for name in physical_type_index.get(physical_type, ())}
         return gc
 
     def __getitem__(self, item):
         # Docstring in GlobalCoordsABC
-        if item not in self._all_coords:
-            for key, value in self._all_coords.items():
+        all_coords = self._all_coords
+        if item not in all_coords:
+            for key, value in all_coords.items():
                 if isinstance(key, tuple) and item in key:
                     return value[1]
 
-        return self._all_coords[item][1]
+        return all_coords[item][1]
 
     def __iter__(self):
         # Docstring in GlobalCoordsABC
@@ -1,3 +1,5 @@
+import numbers
+from copy import copy
 
 from astropy.nddata.mixins.ndslicing import NDSlicingMixin
 from astropy.wcs.wcsapi.wrappers.sliced_wcs import sanitize_slices
@@ -5,6 +7,41 @@ from astropy.wcs.wcsapi.wrappers.sliced_wcs import sanitize_slices
 __all__ = ['NDCubeSlicingMixin']
 
 
+class PendingSlices:
+    """
+    An attribute of a sliced cube whose slicing is deferred until it is first accessed.
+
+    Parameters
+    ----------
+    value: `object`
+        The unsliced attribute of the original cube.
+
+    items: `tuple`
+        The items with which ``value`` is to be sliced, in the order they were applied.
+    """
+
+    __slots__ = ("value", "items")
+
+    def __init__(self, value, items):
+        self.value = value
+        self.items = tuple(items)
+
+    def then(self, item):
+        """
+        Return the pending slicing of the attribute followed by slicing with ``item``.
+        """
+        return type(self)(self.value, self.items + (item,))
+
+    def apply(self, slice_func):
+        """
+        Slice the attribute with each pending item using ``slice_func(value, item)``.
+        """
+        value = self.value
+        for item in self.items:
+            value = slice_func(value, item)
+        return value
+
+
 class NDCubeSlicingMixin(NDSlicingMixin):
     # Inherit docstring from parent class
     __doc__ = NDSlicingMixin.__doc__
@@ -14,15 +51,51 @@ class NDCubeSlicingMixin(NDSlicingMixin):
         Override the parent class method to explicitly catch `None` indices.
 
         This method calls ``_slice`` and then constructs a new object
-        using the kwargs returned by ``_slice``.
+        using the kwargs returned by ``_slice``. The WCS and extra coords of
+        the new object are only sliced when they are first accessed, so
+        slices whose coordinates are never used cost little more than
+        slicing their arrays.
         """
         if item is None or (isinstance(item, tuple) and None in item):
             raise IndexError("None indices not supported")
 
-        item = tuple(sanitize_slices(item, len(self.dimensions)))
-        sliced_cube = super().__getitem__(item)
+        item = tuple(sanitize_slices(item, self.data.ndim))
+        # Abort slicing if the data is a single scalar.
+        if self.data.shape == ():
+            raise TypeError("scalars cannot be sliced.")
 
-        sliced_cube._global_coords._internal_coords = self.global_coords._internal_coords
-        sliced_cube._extra_coords = self.extra_coords[item]
+        # The sliced components are already valid, so skip the validation of __init__.
+        sliced_cube = self._new_instance(**self._slice(item),
+                                         extra_coords=self._slice_extra_coords(item))
+        # Global coords are shared with the original cube, if it has any.
+        if getattr(self, "__global_coords", None) is not None:
+            sliced_cube._global_coords._internal_coords = self._global_coords._internal_coords
 
         return sliced_cube
+
+    def _slice_wcs(self, item):
+        wcs = self._wcs
+        if wcs is None:
+            return None
+        # Raise the errors of slicing the WCS now, rather than when it is first accessed.
+        # Steps are rejected by sanitize_slices in __getitem__.
+        if all(isinstance(i, numbers.Integral) for i in item):
+            self._handle_wcs_slicing_error(
+                ValueError("Cannot slice WCS: the resulting WCS should have at least one "
+                           "pixel and one world dimension."), item)
+        if isinstance(wcs, PendingSlices):
+            return wcs.then(item)
+        return PendingSlices(wcs, (item,))
+
+    def _slice_extra_coords(self, item):
+        extra_coords = getattr(self, "__extra_coords", None)
+        if extra_coords is None:
+            return None
+        if isinstance(extra_coords, PendingSlices):
+            return extra_coords.then(item)
+        # Empty extra coords are not sliced, leaving the slice to create its own when accessed.
+        if extra_coords.is_empty and not extra_coords._dropped_tables:
+            return None
+        # Copy the containers so that later changes to this cube's extra coords
+        # are not reflected in the slice.
+        return PendingSlices(copy(extra_coords), (item,))
@@ -1,10 +1,15 @@
 import abc
+import operator
 import textwrap
 import warnings
-from copy import deepcopy
+import itertools
+from copy import copy, deepcopy
+from types import SimpleNamespace
 from typing import Any, Tuple, Union, Iterable, Optional
+from functools import partial
 from collections import namedtuple
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 import astropy.nddata
 import astropy.units as u
@@ -19,25 +24,29 @@ except ImportError:
 
 from astropy.wcs import WCS
 from astropy.wcs.utils import _split_matrix
-from astropy.wcs.wcsapi import BaseHighLevelWCS, HighLevelWCSWrapper
+from astropy.wcs.wcsapi import BaseHighLevelWCS, HighLevelWCSWrapper, SlicedLowLevelWCS
 
 from ndcube import utils
 from ndcube.extra_coords.extra_coords import ExtraCoords, ExtraCoordsABC
 from ndcube.global_coords import GlobalCoords, GlobalCoordsABC
 from ndcube.mixins import NDCubeSlicingMixin
+from ndcube.mixins.ndslicing import PendingSlices
+from ndcube.ndcollection import NDCollection
 from ndcube.ndcube_sequence import NDCubeSequence
 from ndcube.utils.wcs_high_level_conversion import values_to_high_level_objects
 from ndcube.visualization import PlotterDescriptor
-from ndcube.wcs.wrappers import CompoundLowLevelWCS, ResampledLowLevelWCS
+from ndcube.wcs.wrappers import CompoundLowLevelWCS
 
 __all__ = ['NDCubeABC', 'NDCubeLinkedDescriptor']
 
 # Create mapping to masked array types based on data array type for use in analysis methods.
 ARRAY_MASK_MAP = {}
 ARRAY_MASK_MAP[np.ndarray] = np.ma.masked_array
+_DASK_ARRAY = None
 try:
     import dask.array
     ARRAY_MASK_MAP[dask.array.core.Array] = dask.array.ma.masked_array
+    _DASK_ARRAY = dask.array.core.Array
 except ImportError:
     pass
 
@@ -91,7 +100,10 @@ class NDCubeABC(astropy.nddata.NDDataBase):
     def axis_world_coords(self,
                           *axes: Union[int, str],
                           pixel_corners: bool = False,
-                          wcs: Optional[Union[BaseHighLevelWCS, ExtraCoordsABC]] = None
+                          wcs: Optional[Union[BaseHighLevelWCS, ExtraCoordsABC]] = None,
+                          broadcast: bool = False,
+                          n_workers: Optional[int] = None,
+                          dtype: Optional[np.dtype] = None
                           ) -> Iterable[Any]:
         """
         Returns objects representing the world coordinates of pixel centers for a desired axes.
@@ -113,6 +125,24 @@ class NDCubeABC(astropy.nddata.NDDataBase):
             ``self.wcs``, ``self.extra_coords``, or ``self.combined_wcs`` combining both
             the WCS and extra coords.
             Default=self.wcs
+        broadcast: `bool`, optional
+            If `True`, the coordinates underlying each returned object are read-only views
+            broadcast to the shape of the data array, so every object has the same
+            dimensionality as the data. Array axes on which a coordinate does not depend
+            are not stored in memory. Default is `False`, in which case objects only
+            span the array axes on which they depend.
+        n_workers: `int`, optional
+            If greater than 1, the coordinates are calculated in blocks by a pool of this
+            many threads. This speeds up WCS transforms which release the GIL, such as those
+            of `astropy.wcs.WCS`, on large arrays. The results are identical to those
+            calculated serially. Default is `None`, i.e. calculate in the calling thread.
+        dtype: `numpy.dtype`, optional
+            The data type to which the coordinate values are cast before the high level
+            objects are built, e.g. ``numpy.float32`` to halve their memory. The coordinates
+            are always calculated in double precision. Some high level objects, e.g.
+            `~astropy.time.Time`, store their values in double precision regardless.
+            Default is `None`, i.e. the data type returned by the WCS.
+
         Returns
         -------
         axes_coords: iterable
@@ -124,6 +154,7 @@ class NDCubeABC(astropy.nddata.NDDataBase):
             their corresponding array dimensions, unless ``pixel_corners=True``
             in which case the length along each axis will be 1 greater than
             the number of pixels.
+
         Examples
         --------
         >>> NDCube.axis_world_coords('lat', 'lon') # doctest: +SKIP
@@ -135,7 +166,10 @@ class NDCubeABC(astropy.nddata.NDDataBase):
     def axis_world_coords_values(self,
                                  *axes: Union[int, str],
                                  pixel_corners: bool = False,
-                                 wcs: Optional[Union[BaseHighLevelWCS, ExtraCoordsABC]] = None
+                                 wcs: Optional[Union[BaseHighLevelWCS, ExtraCoordsABC]] = None,
+                                 broadcast: bool = False,
+                                 n_workers: Optional[int] = None,
+                                 dtype: Optional[np.dtype] = None
                                  ) -> Iterable[u.Quantity]:
         """
         Returns the world coordinate values of all pixels for desired axes.
@@ -163,6 +197,22 @@ class NDCubeABC(astropy.nddata.NDDataBase):
             the WCS and extra coords.
             Defaults to the ``.wcs`` property.
 
+        broadcast: `bool`, optional
+            If `True`, each returned `~astropy.units.Quantity` is a read-only view
+            broadcast to the shape of the data array. Array axes on which a coordinate
+            does not depend are not stored in memory. Default is `False`, in which case
+            each coordinate only spans the array axes on which it depends.
+
+        n_workers: `int`, optional
+            If greater than 1, the coordinates are calculated in blocks by a pool of this
+            many threads. See :meth:`ndcube.NDCube.axis_world_coords`.
+            Default is `None`, i.e. calculate in the calling thread.
+
+        dtype: `numpy.dtype`, optional
+            The data type of the returned coordinates, e.g. ``numpy.float32`` to halve
+            their memory. The coordinates are always calculated in double precision
+            before being cast. Default is `None`, i.e. the data type returned by the WCS.
+
         Returns
         -------
         axes_coords: `tuple` of `~astropy.units.Quantity`
@@ -170,7 +220,8 @@ class NDCubeABC(astropy.nddata.NDDataBase):
             The returned units are determined by the WCS object.
             The dimensionality of these objects should match that of
             their corresponding array dimensions, unless ``pixel_corners=True``
-            in which case the length along each axis will be 1 greater than the number of pixels.
+            in which case the length along each axis will be 1 greater than the number of pixels,
+            or ``broadcast=True`` in which case they match the shape of the data array.
 
         Examples
         --------
@@ -298,13 +349,19 @@ class NDCubeLinkedDescriptor:
         if obj is None:
             return
 
-        if getattr(obj, self._attribute_name, None) is None and self._default_type is not None:
+        value = getattr(obj, self._attribute_name, None)
+        if value is None and self._default_type is not None:
             self.__set__(obj, self._default_type)
+        elif isinstance(value, PendingSlices):
+            self.__set__(obj, value.apply(operator.getitem))
 
         return getattr(obj, self._attribute_name)
 
     def __set__(self, obj, value):
-        if isinstance(value, self._default_type):
+        if isinstance(value, PendingSlices):
+            # Slicing is deferred until the value is first accessed.
+            pass
+        elif isinstance(value, self._default_type):
             value._ndcube = obj
         elif issubclass(value, self._default_type):
             value = value(obj)
@@ -316,6 +373,257 @@ class NDCubeLinkedDescriptor:
         setattr(obj, self._attribute_name, value)
 
 
+def _coord_values_tuple(world_axis_physical_types, coords):
+    """
+    Return coordinate values in array order in a namedtuple named by their physical types.
+    """
+    # First replace characters in physical types forbidden for namedtuple identifiers.
+    identifiers = []
+    for physical_type in world_axis_physical_types[::-1]:
+        identifier = physical_type.replace(":", "_")
+        identifier = identifier.replace(".", "_")
+        identifier = identifier.replace("-", "__")
+        identifiers.append(identifier)
+    CoordValues = namedtuple("CoordValues", identifiers)
+    return CoordValues(*coords[::-1])
+
+
+def _pixel_to_world_values(wcs, pixel_arrays, n_workers=None):
+    """
+    Convert same-shape pixel arrays to world values, optionally using a pool of threads.
+
+    If ``n_workers`` is greater than 1, the pixel arrays are split into blocks
+    along their longest axis which are evaluated in parallel and recombined.
+    This is effective for WCS transforms which release the GIL, such as those of
+    `astropy.wcs.WCS`.
+    """
+    shape = pixel_arrays[0].shape
+    if n_workers is None or n_workers == 1 or not shape or max(shape) < 2:
+        world = wcs.pixel_to_world_values(*pixel_arrays)
+        # TODO: this isinstance check is to mitigate https://github.com/spacetelescope/gwcs/pull/332
+        if wcs.world_n_dim == 1 and not isinstance(world, tuple):
+            world = [world]
+        return world
+
+    axis = int(np.argmax(shape))
+    edges = np.linspace(0, shape[axis], min(n_workers, shape[axis]) + 1).astype(int)
+    blocks = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        item = [slice(None)] * len(shape)
+        item[axis] = slice(start, stop)
+        blocks.append([array[tuple(item)] for array in pixel_arrays])
+    with ThreadPoolExecutor(max_workers=len(blocks)) as executor:
+        results = list(executor.map(lambda block: _pixel_to_world_values(wcs, block), blocks))
+    return [np.concatenate(world, axis=axis) for world in zip(*results)]
+
+
+def _reduce_bins(array, axes, reduction="sum", where=None, dtype=None):
+    """
+    Reduce an array over the given axes, only including elements where ``where`` is `True`.
+
+    ``reduction`` can be ``"sum"``, ``"min"`` or ``"max"``.
+    The axes are reduced one at a time starting with the outermost, which for
+    arrays reshaped for rebinning is much faster than reducing them all at once.
+    Min and max of bins with no included elements are the extreme values of the dtype.
+    """
+    axes = sorted(axes)
+    remaining_axes = axes
+    kwargs = {} if dtype is None else {"dtype": dtype}
+    if where is not None:
+        if reduction == "sum":
+            initial = 0
+        elif np.issubdtype(array.dtype, np.inexact):
+            initial = np.inf if reduction == "min" else -np.inf
+        elif array.dtype == bool:
+            initial = reduction == "min"
+        else:
+            info = np.iinfo(array.dtype)
+            initial = info.max if reduction == "min" else info.min
+        if isinstance(array, np.ndarray):
+            array = getattr(array, reduction)(axis=axes[0], where=where, initial=initial,
+                                              keepdims=True, **kwargs)
+            remaining_axes = axes[1:]
+        else:
+            # Other array types, e.g. dask, may not support the where argument.
+            array = np.where(where, array, initial)
+    for axis in remaining_axes:
+        array = getattr(array, reduction)(axis=axis, keepdims=True, **kwargs)
+    return array.squeeze(axis=tuple(axes))
+
+
+def _bin_reshape(shape, bin_shape):
+    """
+    Return the shape to which an array is reshaped so odd dimensions represent the
+    pixels in each bin, and the bin axes of that shape.
+    """
+    reshape = np.empty(2 * len(shape), dtype=int)
+    reshape[0::2] = np.asarray(shape) // bin_shape
+    reshape[1::2] = bin_shape
+    return tuple(reshape), tuple(range(len(reshape) - 1, 0, -2))
+
+
+def _apply_to_bins(func, bin_shape, *arrays):
+    """
+    Call ``func`` with the arrays reshaped so odd dimensions represent the pixels in each bin.
+
+    The bin axes are passed as the ``axis`` keyword argument.
+    """
+    reshape, axes = _bin_reshape(arrays[0].shape, bin_shape)
+    return func(*(array.reshape(reshape) for array in arrays), axis=axes)
+
+
+def _map_bins(func, bin_shape, *arrays):
+    """
+    Apply a function to the bins of arrays of the same shape.
+
+    See `_apply_to_bins`. If any of the arrays is a dask array, they are all rechunked
+    so that no bin spans more than one chunk and ``func`` is applied lazily to each
+    chunk. This avoids reshaping the dask arrays, which can merge chunks or
+    require data to be loaded into memory. If ``func`` returns an
+    `~astropy.nddata.NDUncertainty`, an uncertainty of the same type holding
+    a dask array is returned.
+    """
+    bin_shape = tuple(int(b) for b in bin_shape)
+    if _DASK_ARRAY is None or not any(isinstance(array, _DASK_ARRAY) for array in arrays):
+        return _apply_to_bins(func, bin_shape, *arrays)
+    template = next(array for array in arrays if isinstance(array, _DASK_ARRAY))
+    chunks = tuple(max(size // b, 1) * b for size, b in zip(template.chunksize, bin_shape))
+    arrays = [array.rechunk(chunks) if isinstance(array, _DASK_ARRAY)
+              else dask.array.from_array(array, chunks=chunks) for array in arrays]
+    new_chunks = tuple(tuple(c // b for c in axis_chunks)
+                       for axis_chunks, b in zip(arrays[0].chunks, bin_shape))
+    # Apply the function to a single bin to determine the type of its output.
+    with warnings.catch_warnings(), np.errstate(all="ignore"):
+        warnings.simplefilter("ignore")
+        sample = _apply_to_bins(func, bin_shape, *(
+            np.zeros(bin_shape, dtype=array.dtype) if array.dtype == bool
+            else np.ones(bin_shape, dtype=array.dtype) for array in arrays))
+    uncertainty_type = None
+    if isinstance(sample, astropy.nddata.NDUncertainty):
+        uncertainty_type = type(sample)
+        sample = sample.array
+
+    def apply_to_block(*blocks):
+        result = _apply_to_bins(func, bin_shape, *blocks)
+        return result if uncertainty_type is None else result.array
+
+    meta = np.empty((0,) * len(bin_shape), dtype=np.asarray(sample).dtype)
+    result = dask.array.map_blocks(apply_to_block, *arrays, chunks=new_chunks, meta=meta)
+    return result if uncertainty_type is None else uncertainty_type(result)
+
+
+def _reduce_masked_bins(data, unmasked, axis, operation):
+    """
+    Calculate the sums or means of the unmasked pixels in bins of reshaped arrays.
+
+    This is much faster than reducing masked arrays and gives the same results,
+    including for fully masked bins.
+    """
+    new_data = _reduce_bins(data, axis, where=unmasked)
+    if operation in {np.mean, np.nanmean}:
+        n_unmasked = _reduce_bins(unmasked, axis, dtype=np.intp)
+        # Keep the precision of floating point data as in unmasked reductions.
+        dtype = new_data.dtype if np.issubdtype(new_data.dtype, np.inexact) else np.float64
+        new_data = (new_data / np.clip(n_unmasked, 1, None)).astype(dtype, copy=False)
+        # Means of fully masked bins are 0, except nanmeans which are NaN.
+        if operation is np.nanmean:
+            new_data = np.where(n_unmasked == 0, np.nan, new_data)
+    return new_data
+
+
+def _reduce_masked_array_bins(data, mask, axis, operation):
+    """
+    Apply an operation to the bins of reshaped arrays, excluding masked pixels using a masked array.
+    """
+    return np.ma.getdata(operation(np.ma.masked_array(data, mask), axis=axis))
+
+
+def _propagate_bin_uncertainties(uncertainty, data, mask=None, *, axis, propagate,
+                                 uncertainty_type, **kwargs):
+    """
+    Propagate the uncertainties of the bins of reshaped arrays.
+
+    The bin axes are flattened into the first axis, as required by ``propagate``,
+    e.g. `~ndcube.utils.cube.propagate_rebin_uncertainties`.
+    """
+    bin_axes = sorted(axis)
+    flat_shape = [-1] + [data.shape[i] for i in range(0, data.ndim, 2)]
+
+    def flatten(array):
+        flat_array = np.moveaxis(array, bin_axes, range(len(bin_axes))).reshape(flat_shape)
+        # The propagation may modify its inputs, so do not pass views of the cube's arrays.
+        return flat_array.copy() if np.may_share_memory(flat_array, array) else flat_array
+
+    return propagate(uncertainty_type(flatten(uncertainty)), flatten(data),
+                     None if mask is None else flatten(mask), **kwargs)
+
+
+def _slice_wcs(wcs, item):
+    """
+    Slice a high level WCS with an array item.
+    """
+    return HighLevelWCSWrapper(SlicedLowLevelWCS(wcs.low_level_wcs, item))
+
+
+def _broadcast_astype(array, dtype):
+    """
+    Cast a broadcast array to a data type, only copying the elements stored in memory.
+    """
+    stored = array[tuple(slice(None, 1) if stride == 0 else slice(None) for stride in array.strides)]
+    return np.broadcast_to(stored.astype(dtype), array.shape, subok=True)
+
+
+def _copy_if_writeable(array):
+    """
+    Return a copy of a writeable numpy array, or other objects unchanged.
+
+    Read-only arrays cannot be modified in place by their owner or by the
+    receiver, so they can safely be shared rather than copied.
+    """
+    if isinstance(array, np.ndarray) and array.flags.writeable:
+        return array.copy()
+    return array
+
+
+def _pad_to_shape(array, shape, constant_value=0, edge=False):
+    """
+    Pad an array at the end of each axis up to the given shape.
+
+    The pad pixels are set to ``constant_value`` or, if ``edge`` is `True`, to the
+    values at the end of each axis, as with `numpy.pad`. numpy arrays are copied
+    into a single new array. Other array types, e.g. dask arrays, use `numpy.pad`.
+    """
+    pad_width = tuple((0, n - d) for n, d in zip(shape, array.shape))
+    if not isinstance(array, np.ndarray):
+        if edge:
+            return np.pad(array, pad_width, mode="edge")
+        return np.pad(array, pad_width, constant_values=constant_value)
+    padded = np.empty(shape, dtype=array.dtype)
+    padded[tuple(slice(0, d) for d in array.shape)] = array
+    # Fill the pad pixels axis by axis, including the corners of earlier axes' pads.
+    for axis, d in enumerate(array.shape):
+        before = (slice(None),) * axis
+        if edge:
+            padded[before + (slice(d, None),)] = padded[before + (slice(d - 1, d),)]
+        else:
+            padded[before + (slice(d, None),)] = constant_value
+    return padded
+
+
+def _broadcast_to_pixel_shape(array, pixel_axes, pixel_shape):
+    """
+    Broadcast an array spanning some pixel axes to a read-only view of the full pixel grid.
+
+    ``array`` is in pixel order and its axes correspond to ``pixel_axes`` of the grid.
+    """
+    pixel_axes = np.asarray(pixel_axes)
+    array = np.transpose(np.asanyarray(array), np.argsort(pixel_axes))
+    new_shape = [1] * len(pixel_shape)
+    for axis, length in zip(np.sort(pixel_axes), array.shape):
+        new_shape[axis] = length
+    return np.broadcast_to(array.reshape(new_shape), pixel_shape)
+
+
 class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
     """
     Class representing N-D data described by a single array and set of WCS transformations.
@@ -376,20 +684,81 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
         if self.wcs is None:
             raise TypeError("The WCS argument can not be None.")
 
-        # Get existing extra_coords if initializing from an NDCube
-        if hasattr(data, "extra_coords"):
-            extra_coords = data.extra_coords
+        # Get existing extra_coords and global_coords if initializing from an NDCube.
+        # Those an NDCube has never created are left to be created when first accessed.
+        if isinstance(data, NDCubeBase):
+            extra_coords = data._existing_extra_coords
+            global_coords = data._existing_global_coords
+        else:
+            extra_coords = getattr(data, "extra_coords", None)
+            global_coords = getattr(data, "global_coords", None)
+
+        if extra_coords is not None:
             if copy:
                 extra_coords = deepcopy(extra_coords)
             self._extra_coords = extra_coords
 
-        # Get existing global_coords if initializing from an NDCube
-        if hasattr(data, "global_coords"):
-            global_coords = data._global_coords
+        if global_coords is not None:
             if copy:
                 global_coords = deepcopy(global_coords)
             self._global_coords = global_coords
 
+        self._world_coords_cache = utils.cube.WorldCoordsCache()
+        self._world_coords_cache_state = None
+        self._derived_coords_cache = None
+
+    @classmethod
+    def _new_instance(cls, data, wcs, uncertainty=None, mask=None, meta=None, unit=None,
+                      extra_coords=None, global_coords=None):
+        """
+        Instantiate a new instance of this class from already validated components.
+
+        This is used internally, e.g. by slicing and arithmetic, to skip the
+        validation of ``__init__`` for components derived from an existing cube.
+        Subclasses which override ``__init__`` are instantiated through it.
+        """
+        if cls.__init__ is not NDCubeBase.__init__:
+            if isinstance(wcs, PendingSlices):
+                wcs = wcs.apply(_slice_wcs)
+            new_cube = cls(data, wcs=wcs, uncertainty=uncertainty, mask=mask, meta=meta, unit=unit)
+        else:
+            new_cube = cls.__new__(cls)
+            new_cube._data = data
+            new_cube._mask = mask
+            if not isinstance(wcs, (BaseHighLevelWCS, PendingSlices)):
+                wcs = HighLevelWCSWrapper(wcs)
+            new_cube._wcs = wcs
+            astropy.nddata.NDData.meta.__set__(new_cube, meta)
+            new_cube._unit = unit
+            new_cube._psf = None
+            new_cube._uncertainty = None
+            if uncertainty is not None:
+                # The setter links the uncertainty to its new parent.
+                new_cube.uncertainty = uncertainty
+            new_cube._world_coords_cache = utils.cube.WorldCoordsCache()
+            new_cube._world_coords_cache_state = None
+            new_cube._derived_coords_cache = None
+        if extra_coords is not None:
+            new_cube._extra_coords = extra_coords
+        if global_coords is not None:
+            new_cube._global_coords = global_coords
+        return new_cube
+
+    @property
+    def wcs(self):
+        # Docstring inherited from NDData.
+        # The WCS of a slice is only sliced when first accessed.
+        if isinstance(self._wcs, PendingSlices):
+            try:
+                self._wcs = self._wcs.apply(_slice_wcs)
+            except Exception as err:
+                self._handle_wcs_slicing_error(err, self._wcs.items[-1])
+        return self._wcs
+
+    @wcs.setter
+    def wcs(self, wcs):
+        astropy.nddata.NDData.wcs.fset(self, wcs)
+
     @property
     def extra_coords(self):
         # Docstring in NDCubeABC.
@@ -400,16 +769,73 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
         # Docstring in NDCubeABC.
         return self._global_coords
 
+    @property
+    def _existing_extra_coords(self):
+        """
+        The extra coords of this cube, or `None` if they have not been created yet.
+
+        Unlike ``extra_coords``, this does not create an empty `~ndcube.ExtraCoords`.
+        """
+        if getattr(self, "__extra_coords", None) is None:
+            return None
+        return self._extra_coords
+
+    @property
+    def _existing_global_coords(self):
+        """
+        The global coords of this cube, or `None` if they have not been created yet.
+
+        Unlike ``global_coords``, this does not create an empty `~ndcube.GlobalCoords`.
+        """
+        return getattr(self, "__global_coords", None)
+
+    @property
+    def world_coords_cache(self):
+        """
+        The cache of world coordinates calculated by :meth:`~ndcube.NDCube.axis_world_coords`.
+
+        The cache is shared with :meth:`~ndcube.NDCube.axis_world_coords_values` and is
+        invalidated when the ``wcs``, ``extra_coords`` or data shape of this cube change.
+        Its size limit can be changed via its ``max_bytes`` attribute and its hit and
+        miss statistics are given by its ``info()`` method.
+        """
+        state = (self.data.shape, self.wcs, self._existing_extra_coords)
+        if (self._world_coords_cache_state is None
+                or any(new is not old for new, old in zip(state[1:], self._world_coords_cache_state[1:]))
+                or state[0] != self._world_coords_cache_state[0]):
+            self._world_coords_cache.clear()
+            self._world_coords_cache_state = state
+        return self._world_coords_cache
+
+    @property
+    def _derived_coords(self):
+        """
+        The cache of properties derived from the ``wcs`` and ``extra_coords`` of this cube.
+
+        The cache is cleared when either is replaced or the extra coords are changed.
+        """
+        state = (self.wcs, self._existing_extra_coords)
+        # The cache is replaced rather than cleared so that it is never shared with copies of this cube.
+        if (self._derived_coords_cache is None
+                or any(new is not old for new, old in zip(state, self._derived_coords_cache[0]))):
+            self._derived_coords_cache = (state, {})
+        return self._derived_coords_cache[1]
+
     @property
     def combined_wcs(self):
         # Docstring in NDCubeABC.
-        if not self.extra_coords.wcs:
-            return self.wcs
-
-        mapping = list(range(self.wcs.pixel_n_dim)) + list(self.extra_coords.mapping)
-        return HighLevelWCSWrapper(
-            CompoundLowLevelWCS(self.wcs.low_level_wcs, self._extra_coords.wcs, mapping=mapping)
-        )
+        cache = self._derived_coords
+        if "combined_wcs" not in cache:
+            extra_coords = self._existing_extra_coords
+            if extra_coords is None or not extra_coords.wcs:
+                combined_wcs = self.wcs
+            else:
+                mapping = list(range(self.wcs.pixel_n_dim)) + list(extra_coords.mapping)
+                combined_wcs = HighLevelWCSWrapper(
+                    CompoundLowLevelWCS(self.wcs.low_level_wcs, extra_coords.wcs, mapping=mapping)
+                )
+            cache["combined_wcs"] = combined_wcs
+        return cache["combined_wcs"]
 
     @property
     def dimensions(self):
@@ -418,21 +844,38 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
     @property
     def array_axis_physical_types(self):
         # Docstring in NDCubeABC.
-        wcs = self.combined_wcs
-        world_axis_physical_types = np.array(wcs.world_axis_physical_types)
-        axis_correlation_matrix = wcs.axis_correlation_matrix
-        return [tuple(world_axis_physical_types[axis_correlation_matrix[:, i]])
+        cache = self._derived_coords
+        if "array_axis_physical_types" not in cache:
+            wcs = self.combined_wcs
+            world_axis_physical_types = np.array(wcs.world_axis_physical_types)
+            axis_correlation_matrix = wcs.axis_correlation_matrix
+            cache["array_axis_physical_types"] = [
+                tuple(world_axis_physical_types[axis_correlation_matrix[:, i]])
                 for i in range(axis_correlation_matrix.shape[1])][::-1]
+        # Return a copy so that the cached list cannot be altered.
+        return list(cache["array_axis_physical_types"])
+
+    def _generate_world_coords(self, pixel_corners, wcs, needed_axes=None, broadcast=False,
+                               n_workers=None):
+        """
+        Calculate the world coordinate values of the pixel grid.
+
+        Only the coupled groups of pixel and world axes (as given by
+        `astropy.wcs.utils._split_matrix`) which contain at least one of
+        ``needed_axes`` are evaluated. The values of all other world axes
+        are returned as `None`.
 
-    def _generate_world_coords(self, pixel_corners, wcs):
-        # TODO: We can improve this by not always generating all coordinates
-        # To make our lives easier here we generate all the coordinates for all
-        # pixels and then choose the ones we want to return to the user based
-        # on the axes argument. We could be smarter by integrating this logic
-        # into the main loop, this would potentially reduce the number of calls
-        # to pixel_to_world_values
+        If ``broadcast`` is `True` each world coordinate is returned as a
+        read-only view broadcast to the shape of the data array (plus one
+        along each axis if ``pixel_corners`` is `True`) rather than only
+        spanning the array axes on which it depends.
 
-        # Create meshgrid of all pixel coordinates.
+        If ``n_workers`` is greater than 1, the world coordinates of each
+        group are calculated in blocks by a pool of that many threads.
+        """
+        if n_workers is not None and (not isinstance(n_workers, (int, np.integer)) or n_workers < 1):
+            raise ValueError("n_workers must be a positive integer or None.")
+        # Create the pixel coordinates along each axis.
         # If user, wants pixel_corners, set pixel values to pixel pixel_corners.
         # Else make pixel centers.
         pixel_shape = self.data.shape[::-1]
@@ -441,16 +884,40 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
             ranges = [np.arange(i) - 0.5 for i in pixel_shape]
         else:
             ranges = [np.arange(i) for i in pixel_shape]
+        # The pixel axes of the data array corresponding to each pixel axis of the WCS.
+        mapping = list(range(len(pixel_shape)))
+
+        # Coordinates calculated with the extra coords are cached against the ExtraCoords
+        # object as its WCS is regenerated each time it is accessed.
+        # Only the cube's own extra coords are cached as it is only these whose changes are tracked.
+        cache_wcs = wcs
+        cache = self.world_coords_cache
+        if isinstance(wcs, ExtraCoords) and wcs is not self._existing_extra_coords:
+            cache = None
 
         # Limit the pixel dimensions to the ones present in the ExtraCoords
         if isinstance(wcs, ExtraCoords):
             ranges = [ranges[i] for i in wcs.mapping]
+            mapping = list(wcs.mapping)
             wcs = wcs.wcs
             if wcs is None:
                 return []
 
+        if needed_axes is None:
+            needed_axes = range(wcs.world_n_dim)
+        needed_axes = set(needed_axes)
+
         world_coords = [None] * wcs.world_n_dim
         for (pixel_axes_indices, world_axes_indices) in _split_matrix(wcs.axis_correlation_matrix):
+            # Skip this set of coupled dimensions if none of its world axes have been requested.
+            if needed_axes.isdisjoint(world_axes_indices):
+                continue
+            cache_key = (pixel_corners, broadcast, tuple(world_axes_indices))
+            cached = cache.get(cache_key, cache_wcs) if cache is not None else None
+            if cached is not None:
+                for idx, coord in zip(world_axes_indices, cached):
+                    world_coords[idx] = coord
+                continue
             # First construct a range of pixel indices for this set of coupled dimensions
             sub_range = [ranges[idx] for idx in pixel_axes_indices]
             # Then get a set of non correlated dimensions
@@ -458,92 +925,196 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
             # And inject 0s for those coordinates
             for idx in non_corr_axes:
                 sub_range.insert(idx, 0)
-            # Generate a grid of broadcastable pixel indices for all pixel dimensions
-            grid = np.meshgrid(*sub_range, indexing='ij')
+            # Generate a grid of broadcastable pixel indices for all pixel dimensions.
+            # Broadcast views of a sparse grid are used so the full grid is never allocated.
+            grid = np.broadcast_arrays(*np.meshgrid(*sub_range, indexing='ij', sparse=True))
             # Convert to world coordinates
-            world = wcs.pixel_to_world_values(*grid)
-            # TODO: this isinstance check is to mitigate https://github.com/spacetelescope/gwcs/pull/332
-            if wcs.world_n_dim == 1 and not isinstance(world, tuple):
-                world = [world]
+            world = _pixel_to_world_values(wcs, grid, n_workers=n_workers)
             # Extract the world coordinates of interest and remove any non-correlated axes
             # Transpose the world coordinates so they match array ordering not pixel
             for idx in world_axes_indices:
                 array_slice = np.zeros((wcs.pixel_n_dim,), dtype=object)
                 array_slice[wcs.axis_correlation_matrix[idx]] = slice(None)
-                tmp_world = world[idx][tuple(array_slice)].T
-                world_coords[idx] = tmp_world
-
-        for i, (coord, unit) in enumerate(zip(world_coords, wcs.world_axis_units)):
-            world_coords[i] = coord << u.Unit(unit)
+                tmp_world = world[idx][tuple(array_slice)]
+                if broadcast:
+                    tmp_world = _broadcast_to_pixel_shape(
+                        tmp_world, np.array(mapping)[wcs.axis_correlation_matrix[idx]],
+                        pixel_shape)
+                world_coords[idx] = tmp_world.T << u.Unit(wcs.world_axis_units[idx])
+            if cache is not None:
+                cache.put(cache_key, cache_wcs, [world_coords[idx] for idx in world_axes_indices])
 
         return world_coords
 
     @utils.cube.sanitize_wcs
-    def axis_world_coords(self, *axes, pixel_corners=False, wcs=None):
+    def axis_world_coords(self, *axes, pixel_corners=False, wcs=None, broadcast=False,
+                          n_workers=None, dtype=None):
 
         # Docstring in NDCubeABC.
         if isinstance(wcs, BaseHighLevelWCS):
             wcs = wcs.low_level_wcs
 
-        axes_coords = self._generate_world_coords(pixel_corners, wcs)
-
-        if isinstance(wcs, ExtraCoords):
-            wcs = wcs.wcs
-            if not wcs:
-                return tuple()
-
-        axes_coords = values_to_high_level_objects(*axes_coords, low_level_wcs=wcs)
+        low_level_wcs = wcs.wcs if isinstance(wcs, ExtraCoords) else wcs
+        if low_level_wcs is None:
+            return tuple()
 
-        if not axes:
-            return tuple(axes_coords)
-
-        object_names = np.array([wao_comp[0] for wao_comp in wcs.world_axis_object_components])
+        components = low_level_wcs.world_axis_object_components
+        object_names = np.array([wao_comp[0] for wao_comp in components])
         unique_obj_names = utils.misc.unique_sorted(object_names)
         world_axes_for_obj = [np.where(object_names == name)[0] for name in unique_obj_names]
 
-        # Create a mapping from world index in the WCS to object index in axes_coords
-        world_index_to_object_index = {}
-        for object_index, world_axes in enumerate(world_axes_for_obj):
-            for world_index in world_axes:
-                world_index_to_object_index[world_index] = object_index
+        if axes:
+            # Create a mapping from world index in the WCS to object index in axes_coords
+            world_index_to_object_index = {}
+            for object_index, world_axes in enumerate(world_axes_for_obj):
+                for world_index in world_axes:
+                    world_index_to_object_index[world_index] = object_index
+
+            world_indices = utils.wcs.calculate_world_indices_from_axes(low_level_wcs, axes)
+            object_indices = utils.misc.unique_sorted(
+                [world_index_to_object_index[world_index] for world_index in world_indices]
+            )
+        else:
+            object_indices = range(len(unique_obj_names))
+
+        # Only the world axes making up the requested objects need to be calculated.
+        world_indices = np.concatenate([world_axes_for_obj[i] for i in object_indices])
+        axes_coords = self._generate_world_coords(pixel_corners, wcs, needed_axes=world_indices,
+                                                  broadcast=broadcast, n_workers=n_workers)
+
+        axes_coords = [axes_coords[i] for i in world_indices]
+        if dtype is not None:
+            axes_coords = [_broadcast_astype(coord, dtype) if broadcast else coord.astype(dtype)
+                           for coord in axes_coords]
 
-        world_indices = utils.wcs.calculate_world_indices_from_axes(wcs, axes)
-        object_indices = utils.misc.unique_sorted(
-            [world_index_to_object_index[world_index] for world_index in world_indices]
-        )
+        # Build the high level objects from only the calculated world axes by
+        # describing them with the corresponding subset of the object components.
+        object_wcs = SimpleNamespace(
+            world_axis_object_components=[components[i] for i in world_indices],
+            world_axis_object_classes=low_level_wcs.world_axis_object_classes,
+            serialized_classes=low_level_wcs.serialized_classes)
+        axes_coords = values_to_high_level_objects(*axes_coords, low_level_wcs=object_wcs)
 
-        return tuple(axes_coords[i] for i in object_indices)
+        return tuple(axes_coords)
 
     @utils.cube.sanitize_wcs
-    def axis_world_coords_values(self, *axes, pixel_corners=False, wcs=None):
+    def axis_world_coords_values(self, *axes, pixel_corners=False, wcs=None, broadcast=False,
+                                 n_workers=None, dtype=None):
         # Docstring in NDCubeABC.
         if isinstance(wcs, BaseHighLevelWCS):
             wcs = wcs.low_level_wcs
 
-        axes_coords = self._generate_world_coords(pixel_corners, wcs)
+        low_level_wcs = wcs.wcs if isinstance(wcs, ExtraCoords) else wcs
 
-        if isinstance(wcs, ExtraCoords):
-            wcs = wcs.wcs
-
-        world_axis_physical_types = wcs.world_axis_physical_types
+        world_axis_physical_types = low_level_wcs.world_axis_physical_types
 
         # If user has supplied axes, extract only the
         # world coords that correspond to those axes.
         if axes:
-            world_indices = utils.wcs.calculate_world_indices_from_axes(wcs, axes)
-            axes_coords = [axes_coords[i] for i in world_indices]
+            world_indices = utils.wcs.calculate_world_indices_from_axes(low_level_wcs, axes)
             world_axis_physical_types = tuple(np.array(world_axis_physical_types)[world_indices])
+        else:
+            world_indices = np.arange(low_level_wcs.world_n_dim)
+
+        axes_coords = self._generate_world_coords(pixel_corners, wcs, needed_axes=world_indices,
+                                                  broadcast=broadcast, n_workers=n_workers)
+        # Coordinates held by the cache are read-only, so copy only those to stop the
+        # cache being altered by the caller. Freshly calculated coordinates which were
+        # not cached are returned as they are. Broadcast coordinates are read-only views anyway.
+        if broadcast:
+            axes_coords = [axes_coords[i] if dtype is None else _broadcast_astype(axes_coords[i], dtype)
+                           for i in world_indices]
+        else:
+            axes_coords = [axes_coords[i].astype(axes_coords[i].dtype if dtype is None else dtype,
+                                                 copy=not axes_coords[i].flags.writeable)
+                           for i in world_indices]
 
         # Return in array order.
-        # First replace characters in physical types forbidden for namedtuple identifiers.
-        identifiers = []
-        for physical_type in world_axis_physical_types[::-1]:
-            identifier = physical_type.replace(":", "_")
-            identifier = identifier.replace(".", "_")
-            identifier = identifier.replace("-", "__")
-            identifiers.append(identifier)
-        CoordValues = namedtuple("CoordValues", identifiers)
-        return CoordValues(*axes_coords[::-1])
+        return _coord_values_tuple(world_axis_physical_types, axes_coords)
+
+    @utils.cube.sanitize_wcs
+    def iter_world_coords(self, chunk_shape, *axes, wcs=None, dtype=None):
+        """
+        Iterate over the world coordinate values of all pixels, one chunk of the array at a time.
+
+        Unlike :meth:`~ndcube.NDCube.axis_world_coords_values`, the coordinates of only
+        one chunk are held in memory at a time, so this can be used to stream through
+        the coordinates of cubes which are too large to calculate all at once.
+
+        Parameters
+        ----------
+        chunk_shape: `int` or `tuple` of `int`
+            The shape of the chunks in array order. If an `int` is given it is used
+            for all array axes. `None` or ``-1`` for an axis means the whole axis.
+            Chunks at the end of an axis are smaller if the axis length is
+            not a multiple of the chunk length.
+        axes: `int` or `str`, or multiple `int` or `str`, optional
+            Axis number in numpy ordering or unique substring of
+            `ndcube.NDCube.wcs.world_axis_physical_types <astropy.wcs.wcsapi.BaseWCSWrapper>`
+            of axes for which real world coordinates are desired.
+            Not specifying axes inputs causes results for all axes to be returned.
+        wcs: `~astropy.wcs.wcsapi.BaseHighLevelWCS` or `~ndcube.ExtraCoordsABC`, optional
+            The WCS object to be used to calculate the world coordinates.
+            Defaults to the ``.wcs`` property.
+        dtype: `numpy.dtype`, optional
+            The data type of the yielded coordinates.
+            See :meth:`~ndcube.NDCube.axis_world_coords_values`.
+
+        Yields
+        ------
+        item: `tuple` of `slice`
+            The slice of the data array covered by the chunk.
+        coords: `tuple` of `~astropy.units.Quantity`
+            The world coordinate values of the pixels in the chunk, in the same
+            order as returned by :meth:`~ndcube.NDCube.axis_world_coords_values`.
+            Each has the shape of the chunk.
+
+        Examples
+        --------
+        >>> for item, coords in cube.iter_world_coords((1, 100, 100)):  # doctest: +SKIP
+        ...     result[item] = my_analysis(cube.data[item], *coords)
+        """
+        if isinstance(wcs, BaseHighLevelWCS):
+            wcs = wcs.low_level_wcs
+        mapping = list(range(self.data.ndim))
+        if isinstance(wcs, ExtraCoords):
+            mapping = list(wcs.mapping)
+            wcs = wcs.wcs
+            if wcs is None:
+                return
+
+        world_axis_physical_types = wcs.world_axis_physical_types
+        if axes:
+            world_indices = utils.wcs.calculate_world_indices_from_axes(wcs, axes)
+            world_axis_physical_types = tuple(np.array(world_axis_physical_types)[world_indices])
+        else:
+            world_indices = np.arange(wcs.world_n_dim)
+
+        array_shape = self.data.shape
+        if isinstance(chunk_shape, (int, np.integer)) or chunk_shape is None:
+            chunk_shape = (chunk_shape,) * len(array_shape)
+        if len(chunk_shape) != len(array_shape):
+            raise ValueError("chunk_shape must have the same number of elements as "
+                             f"there are array axes ({len(array_shape)}).")
+        chunk_shape = [length if chunk in (None, -1) else chunk
+                       for chunk, length in zip(chunk_shape, array_shape)]
+        if any(chunk < 1 for chunk in chunk_shape):
+            raise ValueError("All elements of chunk_shape must be positive.")
+
+        starts = [range(0, length, chunk) for length, chunk in zip(array_shape, chunk_shape)]
+        for corner in itertools.product(*starts):
+            item = tuple(slice(start, min(start + chunk, length))
+                         for start, chunk, length in zip(corner, chunk_shape, array_shape))
+            array_indices = np.broadcast_arrays(
+                *np.meshgrid(*[np.arange(s.start, s.stop) for s in item], indexing='ij', sparse=True))
+            pixel_indices = array_indices[::-1]
+            world = wcs.pixel_to_world_values(*[pixel_indices[i] for i in mapping])
+            if wcs.world_n_dim == 1:
+                world = [world]
+            coords = [world[i] << u.Unit(wcs.world_axis_units[i]) for i in world_indices]
+            if dtype is not None:
+                coords = [coord.astype(dtype, copy=False) for coord in coords]
+            yield item, _coord_values_tuple(world_axis_physical_types, coords)
 
     def crop(self, *points, wcs=None):
         # The docstring is defined in NDCubeABC
@@ -551,21 +1122,51 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
         item = self._get_crop_item(*points, wcs=wcs)
         return self[item]
 
-    @utils.cube.sanitize_wcs
+    def crop_many(self, regions, wcs=None):
+        """
+        Crop to each of several regions using real world coordinates.
+
+        This is equivalent to calling :meth:`~ndcube.NDCube.crop` for each region,
+        but converts the points of all regions to array indices together,
+        which is much faster when there are many regions.
+
+        Parameters
+        ----------
+        regions: iterable of iterables
+            Each region is an iterable of points, as passed to
+            :meth:`~ndcube.NDCube.crop`.
+
+        wcs: `~astropy.wcs.wcsapi.BaseHighLevelWCS` or `~ndcube.ExtraCoordsABC`
+            The WCS to use to calculate the pixel coordinates based on the input.
+            Will default to the ``.wcs`` property if not given.
+
+        Returns
+        -------
+        `list` of `~ndcube.NDCube`
+            The cropped cube for each region.
+        """
+        return [self[item] for item in self._get_crop_items(regions, wcs=wcs)]
+
     def _get_crop_item(self, *points, wcs=None):
+        return self._get_crop_items([points], wcs=wcs)[0]
+
+    @utils.cube.sanitize_wcs
+    def _get_crop_items(self, regions, wcs=None):
         # Sanitize inputs.
-        no_op, points, wcs = utils.cube.sanitize_crop_inputs(points, wcs)
+        no_ops, regions, wcs = utils.cube.sanitize_crop_regions(regions, wcs)
         # Quit out early if we are no-op
-        if no_op:
-            return tuple([slice(None)] * wcs.pixel_n_dim)
-        else:
-            comp = [c[0] for c in wcs.world_axis_object_components]
-            # Trim to unique component names - `np.unique(..., return_index=True)
-            # keeps sorting alphabetically, set() seems just nondeterministic.
-            for k, c in enumerate(comp):
-                if comp.count(c) > 1:
-                    comp.pop(k)
-            classes = [wcs.world_axis_object_classes[c][0] for c in comp]
+        if all(no_ops):
+            return [tuple([slice(None)] * self.data.ndim)] * len(regions)
+        comp = [c[0] for c in wcs.world_axis_object_components]
+        # Trim to unique component names - `np.unique(..., return_index=True)
+        # keeps sorting alphabetically, set() seems just nondeterministic.
+        for k, c in enumerate(comp):
+            if comp.count(c) > 1:
+                comp.pop(k)
+        classes = [wcs.world_axis_object_classes[c][0] for c in comp]
+        for points, no_op in zip(regions, no_ops):
+            if no_op:
+                continue
             for i, point in enumerate(points):
                 if len(point) != len(comp):
                     raise ValueError(f"{len(point)} components in point {i} do not match "
@@ -575,7 +1176,7 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
                         raise TypeError(f"{type(value)} of component {j} in point {i} is "
                                         f"incompatible with WCS component {comp[j]} "
                                         f"{classes[j]}.")
-            return utils.cube.get_crop_item_from_points(points, wcs, False)
+        return self._crop_items_from_regions(regions, no_ops, wcs, False)
 
     def crop_by_values(self, *points, units=None, wcs=None):
         # The docstring is defined in NDCubeABC
@@ -583,41 +1184,87 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
         item = self._get_crop_by_values_item(*points, units=units, wcs=wcs)
         return self[item]
 
-    @utils.cube.sanitize_wcs
+    def crop_by_values_many(self, regions, units=None, wcs=None):
+        """
+        Crop to each of several regions using real world coordinate values.
+
+        This is equivalent to calling :meth:`~ndcube.NDCube.crop_by_values` for each
+        region, but converts the points of all regions to array indices together,
+        which is much faster when there are many regions.
+
+        Parameters
+        ----------
+        regions: iterable of iterables
+            Each region is an iterable of points, as passed to
+            :meth:`~ndcube.NDCube.crop_by_values`.
+
+        units: iterable of `str` or `~astropy.units.Unit`
+            The units of any coordinate values without units, in the same order
+            as the coordinates in each point. Applies to all regions.
+
+        wcs: `~astropy.wcs.wcsapi.BaseHighLevelWCS` or `~ndcube.ExtraCoordsABC`
+            The WCS to use to calculate the pixel coordinates based on the input.
+            Will default to the ``.wcs`` property if not given.
+
+        Returns
+        -------
+        `list` of `~ndcube.NDCube`
+            The cropped cube for each region.
+        """
+        return [self[item] for item in self._get_crop_by_values_items(regions, units=units, wcs=wcs)]
+
     def _get_crop_by_values_item(self, *points, units=None, wcs=None):
+        return self._get_crop_by_values_items([points], units=units, wcs=wcs)[0]
+
+    @utils.cube.sanitize_wcs
+    def _get_crop_by_values_items(self, regions, units=None, wcs=None):
         # Sanitize inputs.
-        no_op, points, wcs = utils.cube.sanitize_crop_inputs(points, wcs)
+        no_ops, regions, wcs = utils.cube.sanitize_crop_regions(regions, wcs)
         # Quit out early if we are no-op
-        if no_op:
-            return tuple([slice(None)] * wcs.pixel_n_dim)
-        # Convert float inputs to quantities using units.
-        n_coords = len(points[0])
-        if units is None:
-            units = [None] * n_coords
-        elif len(units) != n_coords:
-            raise ValueError(f"Units must be None or have same length {n_coords} as corner inputs.")
-        types_with_units = (u.Quantity, type(None))
-        for i, point in enumerate(points):
-            if len(point) != wcs.world_n_dim:
-                raise ValueError(f"{len(point)} dimensions in point {i} do not match "
-                                 f"WCS with {wcs.world_n_dim} world dimensions.")
-            for j, (value, unit) in enumerate(zip(point, units)):
-                value_is_float = not isinstance(value, types_with_units)
-                if value_is_float:
-                    if unit is None:
-                        raise TypeError(
-                            "If an element of a point is not a Quantity or None, "
-                            "the corresponding unit must be a valid astropy Unit or unit string."
-                            f"index: {i}; coord type: {type(value)}; unit: {unit}")
-                    points[i][j] = u.Quantity(value, unit=unit)
-                if value is not None:
-                    try:
-                        points[i][j] = points[i][j].to(wcs.world_axis_units[j])
-                    except UnitsError as err:
-                        raise UnitsError(f"Unit '{points[i][j].unit}' of coordinate object {j} in point {i} is "
-                                         f"incompatible with WCS unit '{wcs.world_axis_units[j]}'") from err
-
-        return utils.cube.get_crop_item_from_points(points, wcs, True)
+        if all(no_ops):
+            return [tuple([slice(None)] * self.data.ndim)] * len(regions)
+        world_axis_units = wcs.world_axis_units
+        for points, no_op in zip(regions, no_ops):
+            if no_op:
+                continue
+            # Convert float inputs to quantities using units.
+            n_coords = len(points[0])
+            if units is None:
+                point_units = [None] * n_coords
+            elif len(units) != n_coords:
+                raise ValueError(f"Units must be None or have same length {n_coords} as corner inputs.")
+            else:
+                point_units = units
+            types_with_units = (u.Quantity, type(None))
+            for i, point in enumerate(points):
+                if len(point) != wcs.world_n_dim:
+                    raise ValueError(f"{len(point)} dimensions in point {i} do not match "
+                                     f"WCS with {wcs.world_n_dim} world dimensions.")
+                for j, (value, unit) in enumerate(zip(point, point_units)):
+                    value_is_float = not isinstance(value, types_with_units)
+                    if value_is_float:
+                        if unit is None:
+                            raise TypeError(
+                                "If an element of a point is not a Quantity or None, "
+                                "the corresponding unit must be a valid astropy Unit or unit string."
+                                f"index: {i}; coord type: {type(value)}; unit: {unit}")
+                        points[i][j] = u.Quantity(value, unit=unit)
+                    if value is not None:
+                        try:
+                            points[i][j] = points[i][j].to(world_axis_units[j])
+                        except UnitsError as err:
+                            raise UnitsError(f"Unit '{points[i][j].unit}' of coordinate object {j} in point {i} is "
+                                             f"incompatible with WCS unit '{world_axis_units[j]}'") from err
+
+        return self._crop_items_from_regions(regions, no_ops, wcs, True)
+
+    def _crop_items_from_regions(self, regions, no_ops, wcs, crop_by_values):
+        # Regions which are no-op are not cropped, so only convert the others.
+        items = utils.cube.get_crop_items_from_regions(
+            [points for points, no_op in zip(regions, no_ops) if not no_op], wcs, crop_by_values)
+        items = iter(items)
+        full_item = tuple([slice(None)] * self.data.ndim)
+        return [full_item if no_op else next(items) for no_op in no_ops]
 
     def __str__(self):
         return textwrap.dedent(f"""\
@@ -631,15 +1278,28 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
     def __repr__(self):
         return f"{object.__repr__(self)}\n{str(self)}"
 
-    def explode_along_axis(self, axis):
+    def explode_along_axis(self, axis, cache=True):
         """
         Separates slices of NDCubes along a given axis into an NDCubeSequence of (N-1)DCubes.
 
+        The (N-1)D cubes are only sliced from this cube when they are accessed,
+        so exploding is fast however long the axis. Therefore, changes made to
+        this cube, e.g. to its ``extra_coords`` or ``wcs``, are seen in
+        the (N-1)D cubes not yet accessed. The ``data`` of the sequence is a
+        `~ndcube.utils.sequence.SlicedCubeList`, which slices all remaining cubes
+        the first time it is modified, e.g. by ``append``.
+
         Parameters
         ----------
         axis : `int`
             The array axis along which the data is to be changed.
 
+        cache : `bool`, optional
+            If True, each (N-1)D cube is created on first access and the same
+            object is returned thereafter. If False, a new cube is created on
+            every access so that iterating over a long axis does not retain
+            every slice in memory. Default is True.
+
         Returns
         -------
         result : `ndcube.NDCubeSequence`
@@ -647,21 +1307,8 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
         # If axis is -ve then calculate the axis from the length of the dimensions of one cube
         if axis < 0:
             axis = len(self.dimensions) + axis
-        # To store the resultant cube
-        result_cubes = []
-        # All slices are initially initialised as slice(None, None, None)
-        cube_slices = [slice(None, None, None)] * self.data.ndim
-        # Slicing the cube inside result_cube
-        for i in range(self.data.shape[axis]):
-            # Setting the slice value to the index so that the slices are done correctly.
-            cube_slices[axis] = i
-            # Set to None the metadata of sliced cubes.
-            item = tuple(cube_slices)
-            sliced_cube = self[item]
-            sliced_cube.meta = None
-            # Appending the sliced cubes in the result_cube list
-            result_cubes.append(sliced_cube)
-        # Creating a new NDCubeSequence with the result_cubes and common axis as axis
+        # Set to None the metadata of sliced cubes.
+        result_cubes = utils.sequence.SlicedCubeList([self], axis, cache=cache, drop_meta=True)
         return NDCubeSequence(result_cubes, meta=self.meta)
 
     def reproject_to(self, target_wcs, algorithm='interpolation', shape_out=None, return_footprint=False, **reproject_args):
@@ -768,7 +1415,8 @@ class NDCubeBase(NDCubeABC, astropy.nddata.NDData, NDCubeSlicingMixin):
             data, footprint = data
 
         resampled_cube = type(self)(data, wcs=target_wcs, meta=deepcopy(self.meta))
-        resampled_cube._global_coords = deepcopy(self.global_coords)
+        if self._existing_global_coords is not None:
+            resampled_cube._global_coords = deepcopy(self._existing_global_coords)
 
         if return_footprint:
             return resampled_cube, footprint
@@ -868,26 +1516,111 @@ class NDCube(NDCubeBase):
 
         return self.plotter.plot(*args, **kwargs)
 
-    def _new_instance_from_op(self, new_data, new_unit, new_uncertainty):
+    def _new_instance_from_op(self, new_data, new_unit, new_uncertainty=None,
+                              share_uncertainty=False, share_mask=True, new_mask=None):
         # This implicitly assumes that the arithmetic operation does not alter
-        # the WCS, mask, or metadata.
-        new_cube = type(self)(new_data,
-                              unit=new_unit,
-                              wcs=self.wcs,
-                              mask=deepcopy(self.mask),
-                              meta=deepcopy(self.meta),
-                              uncertainty=new_uncertainty)
-        if self.extra_coords is not None:
-            new_cube._extra_coords = deepcopy(self.extra_coords)
-        if self.global_coords is not None:
-            new_cube._global_coords = deepcopy(self.global_coords)
-        return new_cube
+        # the WCS or metadata, or the mask unless share_mask is False.
+        # The mask and, if share_uncertainty is True, the uncertainty array are
+        # copied into the new cube only if they are writeable numpy arrays;
+        # read-only arrays cannot be modified in place by either cube so are shared.
+        # The metadata is shallow copied. Coordinate containers are copied,
+        # but not the coordinates they hold. This cube is not modified.
+        if share_mask:
+            new_mask = _copy_if_writeable(self.mask)
+        if share_uncertainty and self.uncertainty is not None:
+            new_uncertainty = type(self.uncertainty)(_copy_if_writeable(self.uncertainty.array),
+                                                     copy=False, unit=self.uncertainty.unit)
+        extra_coords = self._existing_extra_coords
+        global_coords = self._existing_global_coords
+        return self._new_instance(new_data, self.wcs, uncertainty=new_uncertainty,
+                                  mask=new_mask, meta=copy(self.meta), unit=new_unit,
+                                  extra_coords=None if extra_coords is None else copy(extra_coords),
+                                  global_coords=None if global_coords is None else copy(global_coords))
 
     def __neg__(self):
-        return self._new_instance_from_op(-self.data, deepcopy(self.unit),
-                                          deepcopy(self.uncertainty))
+        return self._new_instance_from_op(-self.data, deepcopy(self.unit), share_uncertainty=True)
 
-    def __add__(self, value):
+    def _nddata_arithmetic(self, operation, other):
+        """
+        Apply an arithmetic operation between this cube and another NDData object, e.g. an NDCube.
+
+        The data of the operands must have the same shape and their WCS must be equal
+        as determined by `ndcube.utils.wcs.compare_wcs`. The new cube has the WCS, metadata
+        and coordinates of this cube. Masks are combined with `numpy.logical_or` and
+        uncertainties are propagated assuming they are uncorrelated.
+
+        Parameters
+        ----------
+        operation: `numpy.ufunc`
+            `numpy.add`, `numpy.subtract`, `numpy.multiply` or `numpy.true_divide`.
+        other: `astropy.nddata.NDData`
+            The other operand.
+        """
+        if other.wcs is None:
+            # Without a WCS, the pixel grids of the operands cannot be checked to be aligned.
+            return NotImplemented
+        if other.data.shape != self.data.shape:
+            raise ValueError("Cannot combine NDCube with data of a different shape: "
+                             f"{self.data.shape} and {other.data.shape}")
+        if not utils.wcs.compare_wcs(self.wcs, other.wcs, self.data.shape):
+            raise ValueError("Cannot combine NDCube with an object with a different WCS.")
+        self_unit = u.dimensionless_unscaled if self.unit is None else self.unit
+        other_unit = u.dimensionless_unscaled if other.unit is None else other.unit
+        other_data = other.data
+        other_uncertainty = other.uncertainty
+        if operation in {np.add, np.subtract}:
+            new_unit = deepcopy(self.unit)
+            factor = other_unit.to(self_unit)
+            if factor != 1:
+                other_data = other_data * factor
+                if other_uncertainty is not None and other_uncertainty.unit is None:
+                    # Give the uncertainty a unit so it is converted to the unit of the result.
+                    other_uncertainty = type(other_uncertainty)(
+                        other_uncertainty.array, copy=False,
+                        unit=other_uncertainty._data_unit_to_uncertainty_unit(other_unit))
+            # Only the unit of the result is used to propagate the uncertainties of sums.
+            result_data = u.Quantity(0, self_unit)
+        else:
+            new_unit = operation(self_unit, other_unit)
+            if self.unit is None and other.unit is None:
+                new_unit = None
+        new_data = operation(self.data, other_data)
+        if operation in {np.multiply, np.true_divide}:
+            result_data = new_data
+
+        # Propagate uncertainties. If one operand has no uncertainty,
+        # an empty uncertainty of the same type as the other is used in its place.
+        new_uncertainty = None
+        if self.uncertainty is not None or other_uncertainty is not None:
+            uncertainty_type = type(other_uncertainty if self.uncertainty is None
+                                    else self.uncertainty)
+            self_nddata = self
+            if self.uncertainty is None:
+                self_nddata = astropy.nddata.NDData(self.data, uncertainty=uncertainty_type(None),
+                                                    unit=self.unit)
+            other_nddata = astropy.nddata.NDData(
+                other.data, unit=other.unit,
+                uncertainty=uncertainty_type(None) if other_uncertainty is None else other_uncertainty)
+            new_uncertainty = self_nddata.uncertainty.propagate(operation, other_nddata,
+                                                                 result_data, correlation=0)
+
+        # Combine the masks.
+        other_mask = other.mask
+        share_mask = other_mask is None or other_mask is False
+        new_mask = None
+        if not share_mask:
+            if self.mask is None or self.mask is False:
+                new_mask = deepcopy(other_mask)
+            else:
+                new_mask = np.logical_or(self.mask, other_mask)
+
+        return self._new_instance_from_op(new_data, new_unit, new_uncertainty,
+                                          share_mask=share_mask, new_mask=new_mask)
+
+    def _addition_operand(self, value):
+        """
+        Return the value to add to the data of the cube, or NotImplemented if it cannot be added.
+        """
         if hasattr(value, 'unit'):
             if isinstance(value, u.Quantity):
                 # NOTE: if the cube does not have units, we cannot
@@ -895,43 +1628,93 @@ class NDCube(NDCubeBase):
                 # This forces a conversion to a dimensionless quantity
                 # so that an error is thrown if value is not dimensionless
                 cube_unit = u.Unit('') if self.unit is None else self.unit
-                new_data = self.data + value.to_value(cube_unit)
+                value = value.to_value(cube_unit)
+                if np.ndim(value) == 0:
+                    # As for multiplication, a Python float does not promote
+                    # single precision data to double precision under NEP 50.
+                    value = float(value)
+                return value
             else:
-                # NOTE: This explicitly excludes other NDCube objects and NDData objects
-                # which could carry a different WCS than the NDCube
+                # NOTE: NDCube and NDData objects, which could carry a different WCS
+                # than the NDCube, are handled separately by _nddata_arithmetic.
                 return NotImplemented
         elif self.unit not in (None, u.Unit("")):
             raise TypeError("Cannot add a unitless object to an NDCube with a unit.")
-        else:
-            new_data = self.data + value
-        return self._new_instance_from_op(new_data, deepcopy(self.unit), deepcopy(self.uncertainty))
+        return value
+
+    def _multiplication_operand(self, value):
+        """
+        Return the value by which to multiply the data of the cube and the resulting unit,
+        or NotImplemented if the cube cannot be multiplied by the value.
+        """
+        if hasattr(value, 'unit'):
+            if isinstance(value, u.Quantity):
+                # NOTE: if the cube does not have units, set the unit
+                # to dimensionless such that we can perform arithmetic
+                # between the two.
+                cube_unit = u.Unit('') if self.unit is None else self.unit
+                value_array = value.to_value()
+                if np.ndim(value_array) == 0:
+                    # A Python float, unlike a numpy float64 scalar, does not promote
+                    # single precision data to double precision under NEP 50.
+                    value_array = float(value_array)
+                return value_array, cube_unit * value.unit
+            else:
+                return NotImplemented
+        return value, self.unit
+
+    def __add__(self, value):
+        if isinstance(value, astropy.nddata.NDData):
+            return self._nddata_arithmetic(np.add, value)
+        value = self._addition_operand(value)
+        if value is NotImplemented:
+            return NotImplemented
+        new_data = self.data + value
+        return self._new_instance_from_op(new_data, deepcopy(self.unit), share_uncertainty=True)
 
     def __radd__(self, value):
         return self.__add__(value)
 
     def __sub__(self, value):
+        if isinstance(value, astropy.nddata.NDData):
+            return self._nddata_arithmetic(np.subtract, value)
         return self.__add__(-value)
 
     def __rsub__(self, value):
         return self.__neg__().__add__(value)
 
     def __mul__(self, value):
-        if hasattr(value, 'unit'):
-            if isinstance(value, u.Quantity):
-                # NOTE: if the cube does not have units, set the unit
-                # to dimensionless such that we can perform arithmetic
-                # between the two.
-                cube_unit = u.Unit('') if self.unit is None else self.unit
-                value_unit = value.unit
-                value = value.to_value()
-                new_unit = cube_unit * value_unit
-            else:
-                return NotImplemented
-        else:
-            new_unit = self.unit
-        new_data = self.data * value
-        new_uncertainty = (type(self.uncertainty)(self.uncertainty.array * value)
-                           if self.uncertainty is not None else None)
+        return self._multiply(value)
+
+    def _scaled_uncertainty_unit(self, new_unit):
+        """
+        Return the unit of the uncertainty once the unit of the cube is changed to ``new_unit``
+        by multiplication.
+        """
+        unit = self.uncertainty.unit
+        if unit is None or new_unit is None:
+            return unit
+        unit_factor = new_unit if self.unit is None else new_unit / self.unit
+        return (unit * utils.cube.uncertainty_scale_factor(self.uncertainty, 1 * unit_factor)).unit
+
+    def _multiply(self, value, dtype=None):
+        """
+        Multiply the cube by a value, optionally calculating the new data and uncertainty
+        with the given dtype.
+        """
+        if isinstance(value, astropy.nddata.NDData):
+            return self._nddata_arithmetic(np.multiply, value)
+        operand = self._multiplication_operand(value)
+        if operand is NotImplemented:
+            return NotImplemented
+        value, new_unit = operand
+        new_data = np.multiply(self.data, value, dtype=dtype)
+        new_uncertainty = None
+        if self.uncertainty is not None:
+            factor = utils.cube.uncertainty_scale_factor(self.uncertainty, value)
+            new_uncertainty = type(self.uncertainty)(
+                np.multiply(self.uncertainty.array, factor, dtype=dtype),
+                copy=False, unit=self._scaled_uncertainty_unit(new_unit))
         new_cube = self._new_instance_from_op(new_data, new_unit, new_uncertainty)
         return new_cube
 
@@ -939,9 +1722,54 @@ class NDCube(NDCubeBase):
         return self.__mul__(value)
 
     def __truediv__(self, value):
+        if isinstance(value, astropy.nddata.NDData):
+            return self._nddata_arithmetic(np.true_divide, value)
         return self.__mul__(1/value)
 
-    def to(self, new_unit, **kwargs):
+    # The in-place operators modify the data array in place where the array type
+    # supports it, e.g. numpy arrays. As for numpy arrays, an error is raised if
+    # the result cannot be cast to the dtype of the data, e.g. when multiplying
+    # integer data by a float. Other array types, e.g. dask arrays, are replaced
+    # by the result of the operation. The new uncertainty is calculated before
+    # the data are modified, so the cube is left unchanged if either fails.
+
+    def __iadd__(self, value):
+        value = self._addition_operand(value)
+        if value is NotImplemented:
+            return NotImplemented
+        self._data = operator.iadd(self._data, value)
+        return self
+
+    def __isub__(self, value):
+        return self.__iadd__(-value)
+
+    def __imul__(self, value):
+        operand = self._multiplication_operand(value)
+        if operand is NotImplemented:
+            return NotImplemented
+        value, new_unit = operand
+        new_uncertainty = None
+        if self.uncertainty is not None:
+            array = self.uncertainty.array
+            factor = utils.cube.uncertainty_scale_factor(self.uncertainty, value)
+            if isinstance(array, np.ndarray):
+                # Keep the dtype of the array, raising an error if the result
+                # cannot be cast to it as for the data.
+                array = np.multiply(array, factor, out=np.empty_like(array))
+            else:
+                array = array * factor
+            new_uncertainty = type(self.uncertainty)(array, copy=False,
+                                                     unit=self._scaled_uncertainty_unit(new_unit))
+        self._data = operator.imul(self._data, value)
+        self._unit = new_unit
+        if new_uncertainty is not None:
+            self.uncertainty = new_uncertainty
+        return self
+
+    def __itruediv__(self, value):
+        return self.__imul__(1/value)
+
+    def to(self, new_unit, copy=True, dtype=None, **kwargs):
         """Convert instance to another unit.
 
         Converts the data, uncertainty and unit and returns a new instance
@@ -951,6 +1779,17 @@ class NDCube(NDCubeBase):
         ----------
         new_unit: `astropy.units.Unit`
             The unit to convert to.
+        copy: `bool`
+            If False, the data, uncertainty and unit of this instance are converted,
+            as by the ``*=`` operator, and this instance is returned. The data array is
+            converted in place, so the converted values must be castable to the dtype of
+            the arrays, e.g. integer data cannot be converted. Default is True.
+        dtype: `numpy.dtype`, optional
+            The data type in which the converted data and uncertainty are calculated
+            and stored, e.g. ``numpy.float32`` to convert integer data without
+            promoting it to ``float64``. Default is `None`, i.e. the data type
+            resulting from multiplying the arrays by a Python `float`, which
+            preserves the precision of floating point data.
         kwargs:
             Passed to the unit conversion method, self.unit.to.
 
@@ -960,16 +1799,87 @@ class NDCube(NDCubeBase):
             A new instance with the new unit and data and uncertainties scales accordingly.
         """
         new_unit = u.Unit(new_unit)
-        return self * (self.unit.to(new_unit, **kwargs) * new_unit / self.unit)
+        factor = self.unit.to(new_unit, **kwargs) * new_unit / self.unit
+        if not copy:
+            if dtype is not None and np.dtype(dtype) != self.data.dtype:
+                raise ValueError("dtype cannot be changed if copy is False.")
+            self *= factor
+            return self
+        return self._multiply(factor, dtype=dtype)
+
+    def _prepare_rebin(self, bin_shape, operation_ignores_mask, trim, pad):
+        """
+        Validate the bin shape and prepare the arrays of the cube for rebinning.
+
+        Returns the shape of the rebinned arrays, the shape to which the arrays are reshaped
+        so that odd dimensions represent the pixels in each bin, the bin axes of that shape,
+        the rounding used to resample the coordinates, the data, mask and uncertainty arrays
+        trimmed or padded to a whole number of bins, and the mask of the pixels to exclude
+        from the operation, or `None` if no pixels are excluded.
+        """
+        # Ensure bin_size has right number of entries and each entry is an
+        # integer fraction of the array shape in each dimension.
+        data_shape = self.dimensions.value.astype(int)
+        naxes = len(data_shape)
+        if len(bin_shape) != naxes:
+            raise ValueError("bin_shape must have an entry for each array axis.")
+        if trim and pad:
+            raise ValueError("trim and pad cannot both be True.")
+        ragged = (np.mod(data_shape, bin_shape) != 0).any()
+        if ragged and not (trim or pad):
+            raise ValueError(
+                "bin shape must be an integer fraction of the data shape in each dimension "
+                "unless trim or pad is True. "
+                f"data shape: {data_shape};  bin shape: {bin_shape}")
+        # The rounding of the number of bins along each axis, as used to resample the coordinates.
+        rounding = None
+        new_shape = data_shape // bin_shape
+        if trim:
+            rounding = "floor"
+        elif pad:
+            rounding = "ceil"
+            new_shape = -(-data_shape // bin_shape)
+
+        # Trim or pad the arrays to a whole number of bins.
+        # Trimming only creates views. Pad pixels are excluded from the operation by masking them.
+        data = self.data
+        mask = self.mask
+        uncertainty = None if self.uncertainty is None else self.uncertainty.array
+        m = None if (self.mask is None or self.mask is False or operation_ignores_mask) else self.mask
+        if ragged and trim:
+            item = tuple(slice(0, n) for n in new_shape * bin_shape)
+            data = data[item]
+            if not isinstance(mask, (type(None), bool)):
+                mask = mask[item]
+                m = None if m is None else mask
+            if uncertainty is not None:
+                uncertainty = uncertainty[item]
+        elif ragged and pad:
+            padded_shape = tuple(new_shape * bin_shape)
+            data = _pad_to_shape(data, padded_shape)
+            if not isinstance(mask, (type(None), bool)):
+                # Repeat the edge values so the pad pixels do not alter the results
+                # of mask handling functions such as np.all and np.any.
+                mask = _pad_to_shape(mask, padded_shape, edge=True)
+            m = _pad_to_shape(np.broadcast_to(False if m is None else m, self.data.shape),
+                              padded_shape, constant_value=True)
+            if uncertainty is not None:
+                uncertainty = _pad_to_shape(uncertainty, padded_shape)
+
+        # Reshape array so odd dimensions represent pixels to be binned.
+        reshape, operation_axes = _bin_reshape(new_shape * bin_shape, bin_shape)
+        return new_shape, reshape, operation_axes, rounding, data, mask, uncertainty, m
 
     def rebin(self, bin_shape, operation=np.mean, operation_ignores_mask=False, handle_mask=np.all,
-              propagate_uncertainties=False, new_unit=None, **kwargs):
+              propagate_uncertainties=False, new_unit=None, trim=False, pad=False, dtype=None,
+              **kwargs):
         """
         Downsample array by combining contiguous pixels into bins.
 
         Values in bins are determined by applying a function to the pixel values within it.
         The number of pixels in each bin in each dimension is given by the bin_shape input.
-        This must be an integer fraction of the cube's array size in each dimension.
+        This must be an integer fraction of the cube's array size in each dimension,
+        unless ``trim`` or ``pad`` is set.
         If the NDCube instance has uncertainties attached, they are propagated
         depending on binning method chosen.
 
@@ -1000,6 +1910,20 @@ class NDCube(NDCubeBase):
         new_unit: `astropy.units.Unit`, optional
             If the rebinning operation alters the data unit, the new unit can be
             provided here.
+        trim: `bool`
+            If True, pixels at the end of an axis which do not fill a whole bin are discarded.
+            Default is False.
+        pad: `bool`
+            If True, pixels at the end of an axis which do not fill a whole bin are
+            combined into a partial bin. Padding pixels are added to fill the partial bins
+            and are excluded from the calculation of the bin values and uncertainties,
+            regardless of ``operation_ignores_mask``. Default is False.
+        dtype: `numpy.dtype`, optional
+            If given, the data and uncertainties are cast to this data type before
+            they are binned, e.g. ``numpy.float32`` to bin integer data without promoting
+            it to ``float64``. Default is `None`, in which case the data type of the
+            rebinned data is that returned by ``operation``. Sums and means of floating
+            point data keep their precision.
         kwargs
             All kwargs are passed to the error propagation function.
 
@@ -1041,6 +1965,13 @@ class NDCube(NDCubeBase):
                     [2, 0, 4],
                     [1, 2, 2]])
 
+        If the data are a dask array, they are instead rechunked so that each bin lies
+        within a single chunk and each chunk is reshaped and reduced independently
+        using `dask.array.map_blocks`. The data, mask and uncertainty of the new cube
+        are therefore also dask arrays which are not computed until required.
+        In this case, the ``operation``, ``handle_mask`` and ``propagate_uncertainties``
+        functions are applied to each chunk as numpy arrays.
+
         **Defining Custom Error Propagation**
         To perform custom uncertainty propagation, a function must be provided via the
         propgate_uncertainty kwarg. This function must accept, although doesn't have to
@@ -1087,48 +2018,39 @@ class NDCube(NDCubeBase):
         offsets = (bin_shape - 1) / 2
         if all(bin_shape == 1):
             return self
-        # Ensure bin_size has right number of entries and each entry is an
-        # integer fraction of the array shape in each dimension.
         data_shape = self.dimensions.value.astype(int)
         naxes = len(data_shape)
-        if len(bin_shape) != naxes:
-            raise ValueError("bin_shape must have an entry for each array axis.")
-        if (np.mod(data_shape, bin_shape) != 0).any():
-            raise ValueError(
-                "bin shape must be an integer fraction of the data shape in each dimension. "
-                f"data shape: {data_shape};  bin shape: {bin_shape}")
-
-        # Reshape array so odd dimensions represent pixels to be binned
-        # then apply function over those axes.
-        m = None if (self.mask is None or self.mask is False or operation_ignores_mask) else self.mask
-        data = self.data
-        if m is not None:
-            for array_type, masked_type in ARRAY_MASK_MAP.items():
-                if isinstance(self.data, array_type):
-                    break
+        (_, _, _, rounding,
+         data, mask, uncertainty, m) = self._prepare_rebin(bin_shape, operation_ignores_mask, trim, pad)
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+            if uncertainty is not None:
+                uncertainty = uncertainty.astype(dtype, copy=False)
+        # The bins are reduced with _map_bins so that dask arrays are reduced chunk by chunk.
+        if m is None:
+            new_data = _map_bins(operation, bin_shape, data)
+        else:
+            m = np.broadcast_to(m, data.shape)
+            if operation in {np.sum, np.mean, np.nansum, np.nanmean}:
+                # Calculate masked sums and means directly as reductions over masked
+                # arrays are much slower and the masked array types are not needed.
+                unmasked = np.logical_not(m)
+                if operation in {np.nansum, np.nanmean}:
+                    unmasked = unmasked & np.logical_not(np.isnan(data))
+                new_data = _map_bins(partial(_reduce_masked_bins, operation=operation),
+                                     bin_shape, data, unmasked)
             else:
-                masked_type = np.ma.masked_array
-                warn.warning("data and mask arrays of different or unrecognized types. "
-                             "Casting them into a numpy masked array.")
-            data = masked_type(self.data, m)
-
-        reshape = np.empty(data_shape.size + bin_shape.size, dtype=int)
-        new_shape = (data_shape / bin_shape).astype(int)
-        reshape[0::2] = new_shape
-        reshape[1::2] = bin_shape
-        reshape = tuple(reshape)
-        reshaped_data = data.reshape(reshape)
-        operation_axes = tuple(range(len(reshape) - 1, 0, -2))
-        new_data = operation(reshaped_data, axis=operation_axes)
-        if isinstance(new_data, ARRAY_MASK_MAP[np.ndarray]):
-            new_data = new_data.data
+                if not isinstance(data, tuple(ARRAY_MASK_MAP)):
+                    warnings.warn("data and mask arrays of different or unrecognized types. "
+                                 "Casting them into a numpy masked array.")
+                new_data = _map_bins(partial(_reduce_masked_array_bins, operation=operation),
+                                     bin_shape, data, m)
         if handle_mask is None:
             new_mask = None
-        elif isinstance(self.mask, (type(None), bool)):  # Preserve original mask type.
-            new_mask = self.mask
+        elif isinstance(mask, (type(None), bool)):  # Preserve original mask type.
+            new_mask = mask
         else:
-            reshaped_mask = self.mask.reshape(reshape)
-            new_mask = handle_mask(reshaped_mask, axis=operation_axes)
+            new_mask = _map_bins(handle_mask, bin_shape, mask)
 
         # Propagate uncertainties if propagate_uncertainties kwarg set.
         new_uncertainty = None
@@ -1154,39 +2076,155 @@ class NDCube(NDCubeBase):
                 # while the rest represent the shape of the new data. Then the elements
                 # in each bin can be iterated (all bins being treated in parallel) and
                 # their uncertainties propagated.
-                bin_size = bin_shape.prod()
-                flat_shape = [bin_size] + list(new_shape)
-                dummy_axes = tuple(range(1, len(reshape), 2))
-                flat_data = np.moveaxis(reshaped_data, dummy_axes, tuple(range(naxes)))
-                flat_data = flat_data.reshape(flat_shape)
-                reshaped_uncertainty = self.uncertainty.array.reshape(tuple(reshape))
-                flat_uncertainty = np.moveaxis(reshaped_uncertainty, dummy_axes, tuple(range(naxes)))
-                flat_uncertainty = flat_uncertainty.reshape(flat_shape)
-                flat_uncertainty = type(self.uncertainty)(flat_uncertainty)
-                if m is not None:
-                    reshaped_mask = self.mask.reshape(tuple(reshape))
-                    flat_mask = np.moveaxis(reshaped_mask, dummy_axes, tuple(range(naxes)))
-                    flat_mask = flat_mask.reshape(flat_shape)
-                else:
-                    flat_mask = None
-                # Propagate uncertainties.
-                new_uncertainty = propagate_uncertainties(
-                    flat_uncertainty, flat_data, flat_mask,
-                    operation=operation, operation_ignores_mask=operation_ignores_mask,
+                propagate = partial(
+                    _propagate_bin_uncertainties, propagate=propagate_uncertainties,
+                    uncertainty_type=type(self.uncertainty),
+                    # Pad pixels must be excluded even if the operation ignores the mask.
+                    operation=operation, operation_ignores_mask=operation_ignores_mask and m is None,
                     handle_mask=handle_mask, new_unit=new_unit, **kwargs)
+                arrays = (uncertainty, data) if m is None else (uncertainty, data, m)
+                new_uncertainty = _map_bins(propagate, bin_shape, *arrays)
 
         # Resample WCS
-        new_wcs = ResampledLowLevelWCS(self.wcs.low_level_wcs, bin_shape[::-1])
+        new_wcs = utils.wcs.resample_wcs(self.wcs.low_level_wcs, bin_shape[::-1], rounding=rounding)
 
         # Reform NDCube.
-        new_cube = type(self)(new_data, new_wcs, uncertainty=new_uncertainty, mask=new_mask,
-                              meta=self.meta, unit=new_unit)
-        new_cube._global_coords = self._global_coords
+        new_cube = self._new_instance(new_data, new_wcs, uncertainty=new_uncertainty, mask=new_mask,
+                                      meta=self.meta, unit=new_unit,
+                                      global_coords=self._existing_global_coords)
         # Reconstitute extra coords
-        if not self.extra_coords.is_empty:
+        extra_coords = self._existing_extra_coords
+        if extra_coords is not None and not extra_coords.is_empty:
             new_array_grids = [None if bin_shape[i] == 1 else
                                np.arange(offsets[i], data_shape[i] + offsets[i], bin_shape[i])
                                for i in range(naxes)]
-            new_cube._extra_coords = self.extra_coords.resample(bin_shape, ndcube=new_cube)
+            new_cube._extra_coords = extra_coords.resample(bin_shape, ndcube=new_cube,
+                                                           rounding=rounding)
 
         return new_cube
+
+    def rebin_stats(self, bin_shape, stats=("mean", "std", "min", "max", "count"),
+                    operation_ignores_mask=False, handle_mask=np.all, trim=False, pad=False,
+                    dtype=None):
+        """
+        Calculate multiple statistics of the pixels in each bin in a single call.
+
+        This is equivalent to calling :meth:`~ndcube.NDCube.rebin` once per statistic,
+        but the data are only trimmed or padded and reshaped once, the mask is only
+        handled once, the sum and mean are reused by the statistics which need them,
+        and all the output cubes share the same resampled WCS and extra coords.
+        Each reduction, e.g. the sum, the squared deviations, min and max, is still
+        a separate pass over the data.
+        Masked pixels are excluded unless ``operation_ignores_mask`` is True.
+        Uncertainties are not propagated.
+
+        Parameters
+        ----------
+        bin_shape : array-like
+            The number of pixels in a bin in each dimension.
+            See :meth:`~ndcube.NDCube.rebin`.
+        stats : iterable of `str`
+            The statistics to calculate. Supported statistics are
+            ``"sum"``, ``"mean"``, ``"std"``, ``"var"``, ``"min"``, ``"max"`` and ``"count"``,
+            the last being the number of pixels in each bin used to calculate the others.
+            Default is ``("mean", "std", "min", "max", "count")``.
+        operation_ignores_mask: `bool`
+            If False (default), masked values are excluded from the statistics.
+            If True, masked values are used.
+        handle_mask: `None` or function
+            Function to apply to each bin in the mask to calculate the mask of the
+            output cubes. If `None` resultant masks are `None`.
+            Default is `numpy.all`
+        trim: `bool`
+            If True, pixels at the end of an axis which do not fill a whole bin are discarded.
+            See :meth:`~ndcube.NDCube.rebin`.
+        pad: `bool`
+            If True, pixels at the end of an axis which do not fill a whole bin are
+            combined into a partial bin. See :meth:`~ndcube.NDCube.rebin`.
+        dtype: `numpy.dtype`, optional
+            If given, the data are cast to this data type before the statistics are
+            calculated. See :meth:`~ndcube.NDCube.rebin`.
+
+        Returns
+        -------
+        `~ndcube.NDCollection`
+            A collection of the rebinned cubes, keyed by statistic.
+            The statistics of bins in which all pixels are excluded are 0.
+
+        Examples
+        --------
+        >>> stats = cube.rebin_stats((2, 2), stats=("mean", "std"))  # doctest: +SKIP
+        >>> stats["std"]  # doctest: +SKIP
+        """
+        supported_stats = ("sum", "mean", "std", "var", "min", "max", "count")
+        stats = tuple(stats)
+        unsupported_stats = [stat for stat in stats if stat not in supported_stats]
+        if unsupported_stats:
+            raise ValueError(f"Unsupported statistics: {unsupported_stats}. "
+                             f"Supported statistics are {supported_stats}.")
+        bin_shape = np.rint(bin_shape).astype(int)
+        (new_shape, reshape, operation_axes, rounding,
+         data, mask, _, m) = self._prepare_rebin(bin_shape, operation_ignores_mask, trim, pad)
+        if dtype is not None:
+            data = data.astype(dtype, copy=False)
+        reshaped_data = data.reshape(reshape)
+        unmasked = None
+        if m is not None:
+            unmasked = np.logical_not(np.broadcast_to(m, data.shape).reshape(reshape))
+
+        # Calculate the statistics, reusing intermediate results between them.
+        if unmasked is None:
+            count = np.full(tuple(new_shape), bin_shape.prod())
+        else:
+            count = _reduce_bins(unmasked, operation_axes, dtype=np.intp)
+        values = {"count": count}
+        if set(stats) & {"sum", "mean", "std", "var"}:
+            values["sum"] = _reduce_bins(reshaped_data, operation_axes, where=unmasked)
+        if set(stats) & {"mean", "std", "var"}:
+            dtype = (values["sum"].dtype if np.issubdtype(values["sum"].dtype, np.inexact)
+                     else np.float64)
+            values["mean"] = (values["sum"] / np.clip(count, 1, None)).astype(dtype, copy=False)
+        if set(stats) & {"std", "var"}:
+            # Use the deviations from the mean rather than the mean of the squares
+            # to avoid catastrophic cancellation.
+            expanded_shape = np.array(reshape)
+            expanded_shape[1::2] = 1
+            deviations = reshaped_data - values["mean"].reshape(tuple(expanded_shape))
+            values["var"] = (_reduce_bins(deviations ** 2, operation_axes, where=unmasked)
+                             / np.clip(count, 1, None)).astype(values["mean"].dtype, copy=False)
+            values["std"] = np.sqrt(values["var"])
+        for reduction in {"min", "max"} & set(stats):
+            values[reduction] = _reduce_bins(reshaped_data, operation_axes, reduction, where=unmasked)
+            if unmasked is not None:
+                values[reduction] = np.where(count == 0, 0, values[reduction])
+
+        if handle_mask is None:
+            new_mask = None
+        elif isinstance(mask, (type(None), bool)):  # Preserve original mask type.
+            new_mask = mask
+        else:
+            new_mask = handle_mask(mask.reshape(reshape), axis=operation_axes)
+
+        # Build the output cubes, all sharing the same resampled WCS.
+        new_wcs = utils.wcs.resample_wcs(self.wcs.low_level_wcs, bin_shape[::-1], rounding=rounding)
+        units = {"count": None, "var": None if self.unit is None else self.unit ** 2}
+        extra_coords = self._existing_extra_coords
+        if extra_coords is not None and extra_coords.is_empty:
+            extra_coords = None
+        new_extra_coords = None
+        cubes = []
+        for stat in stats:
+            new_cube = self._new_instance(values[stat], new_wcs, mask=new_mask, meta=self.meta,
+                                          unit=units.get(stat, self.unit),
+                                          global_coords=self._existing_global_coords)
+            if extra_coords is not None:
+                # Resample the extra coords once and share the coordinates between the cubes.
+                if new_extra_coords is None:
+                    new_extra_coords = extra_coords.resample(bin_shape, ndcube=new_cube,
+                                                             rounding=rounding)
+                    new_cube._extra_coords = new_extra_coords
+                else:
+                    new_cube._extra_coords = copy(new_extra_coords)
+                    new_cube._extra_coords._ndcube = new_cube
+            cubes.append((stat, new_cube))
+        return NDCollection(cubes, aligned_axes="all")
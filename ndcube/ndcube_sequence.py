@@ -191,15 +191,26 @@ class NDCubeSequenceBase:
         return dict([(name, [cube.global_coords[name] for cube in self.data])
                      for name in global_names])
 
-    def explode_along_axis(self, axis):
+    def explode_along_axis(self, axis, cache=True):
         """
         Separates slices of N-D cubes along a given cube axis into (N-1)D cubes.
 
+        The (N-1)D cubes are only sliced from the cubes when they are accessed.
+        Therefore, changes made to the cubes of this sequence, e.g. to their ``meta``,
+        ``extra_coords`` or ``wcs``, are seen in the (N-1)D cubes not yet accessed.
+        The ``data`` of the new sequence is a `~ndcube.utils.sequence.SlicedCubeList`,
+        which slices all remaining cubes the first time it is modified, e.g. by ``append``.
+
         Parameters
         ----------
         axis : `int`
             The axis along which the data is to be changed.
 
+        cache : `bool`, optional
+            If True, each (N-1)D cube is created on first access and the same
+            object is returned thereafter. If False, a new cube is created on
+            every access. Default is True.
+
         Returns
         -------
         `ndcube.NDCubeSequence`
@@ -208,18 +219,9 @@ class NDCubeSequenceBase:
         # If axis is -ve then calculate the axis from the length of the dimensions of one cube.
         if axis < 0:
             axis = len(self.dimensions[1::]) + axis
-        # To store the resultant cube
-        result_cubes = []
-        # All slices are initially initialised as slice(None, None, None)
-        result_cubes_slice = [slice(None, None, None)] * len(self[0].data.shape)
-        # the range of the axis that needs to be sliced
-        range_of_axis = self[0].data.shape[axis]
-        for ndcube in self.data:
-            for index in range(range_of_axis):
-                # setting the slice value to the index so that the slices are done correctly.
-                result_cubes_slice[axis] = index
-                # appending the sliced cubes in the result_cube list
-                result_cubes.append(ndcube.__getitem__(tuple(result_cubes_slice)))
+        # Take a copy of the list of cubes so later changes to this sequence are not reflected.
+        cubes = self.data.copy() if isinstance(self.data, utils.sequence.SlicedCubeList) else list(self.data)
+        result_cubes = utils.sequence.SlicedCubeList(cubes, axis, cache=cache)
         # Determine common axis for new sequence.
         if self._common_axis is None or self._common_axis == axis:
             new_common_axis = None
@@ -108,6 +108,32 @@ def test_dropped_to_global_ec(ndcube_4d_ln_lt_l_t):
     assert isinstance(gc["test1"], u.Quantity)
 
 
+def test_dropped_to_global_cached(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    cube.global_coords.add("distance", "pos.distance", 1 * u.m)
+    sub = cube[0, 0, :, :]
+    gc = sub.global_coords
+    skycoord = gc["helioprojective"]
+    # The derived coordinates are only computed once.
+    assert gc["helioprojective"] is skycoord
+    filtered = gc.filter_by_physical_type(('custom:pos.helioprojective.lat',
+                                           'custom:pos.helioprojective.lon'))
+    assert list(filtered) == ["helioprojective"]
+    assert filtered["helioprojective"] is skycoord
+    assert len(gc.filter_by_physical_type("em.wl")) == 0
+    assert gc.filter_by_physical_type("pos.distance")["distance"] == 1 * u.m
+    # Coordinates stored on the original cube are shared with the slice.
+    cube.global_coords.remove("distance")
+    assert "distance" not in gc
+    cube.global_coords.add("distance", "pos.distance", 2 * u.m)
+    assert gc["distance"] == 2 * u.m
+    # The cache is invalidated when the WCS is replaced.
+    new_wcs = cube[0, 1, :, :].wcs
+    sub.wcs = None
+    sub.wcs = new_wcs
+    assert gc["helioprojective"] is not skycoord
+
+
 def test_dropped_to_global_ec_gwcs_fail(ndcube_4d_extra_coords):
     sub = ndcube_4d_extra_coords[0, 0, :, :]
     gc = sub.global_coords
@@ -1,3 +1,5 @@
+import copy
+import operator
 from inspect import signature
 from textwrap import dedent
 
@@ -8,16 +10,19 @@ import numpy as np
 import pytest
 from astropy.coordinates import SkyCoord, SpectralCoord
 from astropy.io import fits
-from astropy.nddata import UnknownUncertainty
+from astropy.nddata import NDData, NDDataRef, StdDevUncertainty, UnknownUncertainty
 from astropy.time import Time
 from astropy.units import UnitsError
 from astropy.wcs import WCS
 from astropy.wcs.utils import wcs_to_celestial_frame
-from astropy.wcs.wcsapi import BaseHighLevelWCS, BaseLowLevelWCS
+from astropy.wcs.wcsapi import BaseHighLevelWCS, BaseLowLevelWCS, HighLevelWCSWrapper
 from astropy.wcs.wcsapi.wrappers import SlicedLowLevelWCS
 
-from ndcube import ExtraCoords, NDCube
+from ndcube import ExtraCoords, NDCollection, NDCube
+from ndcube.mixins.ndslicing import PendingSlices
+from ndcube.ndcube import _pad_to_shape
 from ndcube.tests import helpers
+from ndcube.wcs.wrappers import ResampledLowLevelWCS
 
 
 def generate_data(shape):
@@ -147,6 +152,78 @@ def test_slicing_preserves_global_coords(ndcube_3d_ln_lt_l):
     assert sndc._global_coords._internal_coords == ndc._global_coords._internal_coords
 
 
+def test_new_instance(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    uncertainty = StdDevUncertainty(cube.data * 0.1)
+    kwargs = dict(uncertainty=uncertainty, mask=cube.mask, meta={"a": 1}, unit=u.ct)
+    new_cube = NDCube._new_instance(cube.data, cube.wcs.low_level_wcs,
+                                    extra_coords=cube.extra_coords[:], **kwargs)
+    expected = NDCube(cube.data, cube.wcs.low_level_wcs, **kwargs)
+
+    assert type(new_cube) is NDCube
+    assert new_cube.data is cube.data
+    assert isinstance(new_cube.wcs, BaseHighLevelWCS)
+    assert new_cube.wcs.low_level_wcs is expected.wcs.low_level_wcs
+    assert new_cube.uncertainty.parent_nddata is new_cube
+    assert new_cube.mask is cube.mask
+    assert new_cube.meta == expected.meta
+    assert new_cube.unit == u.ct
+    assert new_cube.extra_coords._ndcube is new_cube
+    assert new_cube.global_coords._ndcube is new_cube
+    assert len(new_cube.world_coords_cache) == 0
+
+    # Subclasses with their own __init__ are created through it.
+    class SubCube(NDCube):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.initialized = True
+
+    sub_cube = SubCube(cube.data, cube.wcs)
+    assert sub_cube[0].initialized
+
+
+def test_slicing_deferred(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    sliced_cube = cube[:, 1:][0]
+    # The WCS and extra coords are not sliced until they are accessed.
+    assert isinstance(sliced_cube._wcs, PendingSlices)
+    assert len(sliced_cube._wcs.items) == 2
+    assert isinstance(getattr(sliced_cube, "__extra_coords"), PendingSlices)
+    np.testing.assert_array_equal(sliced_cube.data, cube.data[0, 1:])
+
+    # Changes to the original cube after slicing are not reflected in the slice.
+    expected_keys = cube.extra_coords[0, 1:].keys()
+    cube.extra_coords.add("index", 2, np.arange(4) * u.pix)
+    expected = NDCube(cube.data, cube.wcs)[0, 1:]
+    assert isinstance(sliced_cube.wcs, BaseHighLevelWCS)
+    assert sliced_cube.wcs.world_axis_physical_types == expected.wcs.world_axis_physical_types
+    assert sliced_cube.wcs.low_level_wcs._slices_array == expected.wcs.low_level_wcs._slices_array
+    assert set(sliced_cube.extra_coords.keys()) == set(expected_keys)
+    assert sliced_cube.extra_coords._ndcube is sliced_cube
+
+    # Invalid WCS slices still raise when slicing.
+    with pytest.raises(ValueError, match="Slicing the WCS object"):
+        cube[0, 0, 0]
+
+
+def test_coords_created_lazily(ndcube_2d_ln_lt):
+    cube = ndcube_2d_ln_lt
+    # Extra and global coords are only created when first accessed.
+    derived_cubes = [cube[1:3], cube * 2, NDCube(cube), cube.rebin((2, 3))]
+    str(cube)
+    cube.axis_world_coords()
+    for new_cube in [cube] + derived_cubes:
+        assert getattr(new_cube, "__extra_coords", None) is None
+        assert getattr(new_cube, "__global_coords", None) is None
+    assert len(derived_cubes[0].global_coords) == 0
+    assert getattr(derived_cubes[0], "__extra_coords", None) is None
+    assert isinstance(cube.extra_coords, ExtraCoords)
+    assert cube.extra_coords._ndcube is cube
+    # Empty extra coords are not sliced.
+    assert getattr(cube[1:3], "__extra_coords", None) is None
+    assert cube[1:3].extra_coords.is_empty
+
+
 def test_slicing_removed_world_coords(ndcube_3d_ln_lt_l):
     ndc = ndcube_3d_ln_lt_l
     # Run this test without extra coords
@@ -391,6 +468,188 @@ def test_axis_world_coords_values_lat(ndcube_3d_ln_lt_l):
                                   [-0.00555556, -0.00416667, -0.00277778]] * u.deg)
 
 
+def test_generate_world_coords_needed_axes(ndcube_3d_ln_lt_l):
+    wcs = ndcube_3d_ln_lt_l.wcs.low_level_wcs
+    # Only the coupled group containing the wavelength axis should be evaluated.
+    coords = ndcube_3d_ln_lt_l._generate_world_coords(pixel_corners=False, wcs=wcs,
+                                                      needed_axes=[0])
+    assert u.allclose(coords[0], [1.02e-09, 1.04e-09, 1.06e-09, 1.08e-09] * u.m)
+    assert coords[1] is None
+    assert coords[2] is None
+
+    # Requesting one celestial axis evaluates both as they are coupled.
+    coords = ndcube_3d_ln_lt_l._generate_world_coords(pixel_corners=False, wcs=wcs,
+                                                      needed_axes=[2])
+    assert coords[0] is None
+    assert coords[1].shape == (2, 3)
+    assert coords[2].shape == (2, 3)
+
+
+@pytest.mark.parametrize("pixel_corners", (False, True))
+def test_axis_world_coords_values_broadcast(ndcube_3d_ln_lt_l, pixel_corners):
+    cube = ndcube_3d_ln_lt_l
+    shape = tuple(np.array(cube.data.shape) + int(pixel_corners))
+    expected = cube.axis_world_coords_values(pixel_corners=pixel_corners)
+    coords = cube.axis_world_coords_values(pixel_corners=pixel_corners, broadcast=True)
+    for coord, expected_coord in zip(coords, expected):
+        assert coord.shape == shape
+        assert not coord.flags.writeable
+        if expected_coord.ndim == 2:
+            expected_coord = expected_coord[..., np.newaxis]
+        assert u.allclose(coord, expected_coord)
+    # The wavelength coord only depends on the last array axis so is not stored for the others.
+    assert coords[2].strides[:2] == (0, 0)
+
+
+@pytest.mark.parametrize("broadcast", (False, True))
+def test_axis_world_coords_values_dtype(ndcube_3d_ln_lt_l, broadcast):
+    cube = ndcube_3d_ln_lt_l
+    expected = cube.axis_world_coords_values(broadcast=broadcast)
+    coords = cube.axis_world_coords_values(broadcast=broadcast, dtype=np.float32)
+    for coord, expected_coord in zip(coords, expected):
+        assert coord.dtype == np.float32
+        assert coord.shape == expected_coord.shape
+        assert coord.unit == expected_coord.unit
+        np.testing.assert_allclose(coord.value, expected_coord.value, rtol=1e-6)
+    if broadcast:
+        assert coords[2].strides[:2] == (0, 0)
+
+
+@pytest.mark.parametrize("broadcast", (False, True))
+def test_axis_world_coords_dtype(ndcube_3d_ln_lt_l, broadcast):
+    cube = ndcube_3d_ln_lt_l
+    expected = cube.axis_world_coords(broadcast=broadcast)
+    coords = cube.axis_world_coords(broadcast=broadcast, dtype=np.float32)
+    assert len(coords) == len(expected)
+    spectral, sky = coords
+    assert spectral.dtype == np.float32
+    assert sky.spherical.lon.dtype == np.float32
+    assert sky.spherical.lat.dtype == np.float32
+    assert spectral.shape == expected[0].shape
+    assert sky.shape == expected[1].shape
+    assert u.allclose(spectral, expected[0], rtol=1e-6)
+    assert u.allclose(sky.spherical.lon, expected[1].spherical.lon, rtol=1e-6)
+
+
+def test_axis_world_coords_broadcast(ndcube_3d_ln_lt_l):
+    coords = ndcube_3d_ln_lt_l.axis_world_coords(broadcast=True)
+    assert len(coords) == 2
+    assert coords[0].shape == ndcube_3d_ln_lt_l.data.shape
+    assert u.allclose(coords[0][0, 0], [1.02e-09, 1.04e-09, 1.06e-09, 1.08e-09] * u.m)
+    assert isinstance(coords[1], SkyCoord)
+    assert coords[1].shape == ndcube_3d_ln_lt_l.data.shape
+
+
+def test_axis_world_coords_broadcast_ec(ndcube_3d_l_ln_lt_ectime):
+    cube = ndcube_3d_l_ln_lt_ectime
+    coords = cube.axis_world_coords_values(wcs=cube.extra_coords, broadcast=True)
+    assert len(coords) == 1
+    assert coords[0].shape == cube.data.shape
+    expected, = cube.axis_world_coords_values(wcs=cube.extra_coords)
+    assert u.allclose(coords[0][0, :, 0], expected)
+    assert coords[0].strides[0] == coords[0].strides[2] == 0
+
+
+@pytest.mark.parametrize("n_workers", [2, 3, 100])
+def test_axis_world_coords_n_workers(ndcube_4d_ln_lt_l_t, n_workers):
+    cube = ndcube_4d_ln_lt_l_t
+    # Disable the cache so the coordinates are recalculated.
+    cube.world_coords_cache.max_bytes = 0
+    expected = cube.axis_world_coords_values(pixel_corners=True)
+    coords = cube.axis_world_coords_values(pixel_corners=True, n_workers=n_workers)
+    for coord, expected_coord in zip(coords, expected):
+        assert coord.unit == expected_coord.unit
+        np.testing.assert_array_equal(coord.value, expected_coord.value)
+    cube.extra_coords.add('time', 0, Time('2000-01-01') + np.arange(cube.data.shape[0]) * u.s)
+    expected, = cube.axis_world_coords(wcs=cube.extra_coords)
+    coords, = cube.axis_world_coords(wcs=cube.extra_coords, n_workers=n_workers)
+    assert (coords == expected).all()
+
+
+def test_axis_world_coords_bad_n_workers(ndcube_3d_ln_lt_l):
+    with pytest.raises(ValueError, match="n_workers"):
+        ndcube_3d_ln_lt_l.axis_world_coords(n_workers=0)
+
+
+@pytest.mark.parametrize("chunk_shape", [1, (2, 2, 3), (None, -1, 3)])
+def test_iter_world_coords(ndcube_3d_ln_lt_l, chunk_shape):
+    cube = ndcube_3d_ln_lt_l
+    expected = cube.axis_world_coords_values(broadcast=True)
+    n_chunks = 0
+    for item, coords in cube.iter_world_coords(chunk_shape):
+        n_chunks += 1
+        assert coords._fields == expected._fields
+        for coord, expected_coord in zip(coords, expected):
+            assert coord.shape == cube.data[item].shape
+            assert u.allclose(coord, expected_coord[item])
+    assert n_chunks == {1: 24, (2, 2, 3): 4, (None, -1, 3): 2}[chunk_shape]
+
+
+def test_iter_world_coords_axes_ec(ndcube_3d_l_ln_lt_ectime):
+    cube = ndcube_3d_l_ln_lt_ectime
+    expected, = cube.axis_world_coords_values(wcs=cube.extra_coords, broadcast=True)
+    for item, (coord,) in cube.iter_world_coords((3, 4, 2), wcs=cube.extra_coords):
+        assert u.allclose(coord, expected[item])
+    expected, = cube.axis_world_coords_values('em.wl', broadcast=True)
+    for item, (coord,) in cube.iter_world_coords(5, 'em.wl'):
+        assert u.allclose(coord, expected[item])
+
+
+def test_iter_world_coords_bad_chunk_shape(ndcube_3d_ln_lt_l):
+    with pytest.raises(ValueError, match="same number of elements"):
+        next(ndcube_3d_ln_lt_l.iter_world_coords((1, 1)))
+    with pytest.raises(ValueError, match="positive"):
+        next(ndcube_3d_ln_lt_l.iter_world_coords((1, 0, 1)))
+
+
+def test_world_coords_cache(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    cache = cube.world_coords_cache
+    coords = cube.axis_world_coords_values('em.wl')
+    assert cache.info().misses == 1
+    assert cache.info().hits == 0
+    again = cube.axis_world_coords_values('em.wl')
+    assert cache.info().hits == 1
+    assert u.allclose(coords[0], again[0])
+    # Returned coordinates are copies so modifying them doesn't corrupt the cache,
+    # whether they were calculated on a miss or retrieved on a hit.
+    expected = coords[0].copy()
+    coords[0][:] = 1 * u.m
+    again[0][:] = 0 * u.m
+    assert u.allclose(cube.axis_world_coords_values('em.wl')[0], expected)
+    # Objects and values share the same cache entries, and the objects are
+    # writeable copies of the cached values.
+    spectral, = cube.axis_world_coords('em.wl')
+    assert cache.info().hits == 3
+    assert spectral.flags.writeable
+    # The cache is invalidated when the WCS is replaced.
+    new_wcs = cube.wcs.deepcopy()
+    cube.wcs = None
+    cube.wcs = new_wcs
+    assert len(cube.world_coords_cache) == 0
+    cube.axis_world_coords_values('em.wl')
+    assert cache.info().misses == 2
+
+
+def test_world_coords_cache_max_bytes(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    cube.world_coords_cache.max_bytes = 0
+    coords = cube.axis_world_coords_values()
+    assert len(cube.world_coords_cache) == 0
+    # Coordinates which are not cached are returned writeable without being copied.
+    assert all(coord.flags.writeable for coord in coords)
+
+
+def test_world_coords_cache_extra_coords(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    n_coords = len(cube.axis_world_coords(wcs=cube.extra_coords))
+    assert len(cube.world_coords_cache) > 0
+    cube.extra_coords.add('index', 0, np.arange(cube.data.shape[0]) * u.pix)
+    assert len(cube.world_coords_cache) == 0
+    coords = cube.axis_world_coords(wcs=cube.extra_coords)
+    assert len(coords) == n_coords + 1
+
+
 def test_array_axis_physical_types(ndcube_3d_ln_lt_l):
     expected = [
         ('custom:pos.helioprojective.lon', 'custom:pos.helioprojective.lat', 'custom:PIXEL'),
@@ -401,6 +660,73 @@ def test_array_axis_physical_types(ndcube_3d_ln_lt_l):
         assert all([physical_type in expected[i] for physical_type in output[i]])
 
 
+def test_derived_coords_cache(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    combined_wcs = cube.combined_wcs
+    physical_types = cube.array_axis_physical_types
+    assert cube.combined_wcs is combined_wcs
+    assert cube.array_axis_physical_types == physical_types
+    # Modifying the returned physical types doesn't corrupt the cache.
+    physical_types.pop()
+    assert len(cube.array_axis_physical_types) == 3
+    # The cache is invalidated when the extra coords change.
+    cube.extra_coords.add('index', 0, np.arange(cube.data.shape[0]) * u.pix)
+    assert cube.combined_wcs is not combined_wcs
+    assert cube.combined_wcs.world_n_dim == combined_wcs.world_n_dim + 1
+    assert 'custom:PIXEL' in cube.array_axis_physical_types[0]
+    # The cache is invalidated when the WCS is replaced.
+    combined_wcs = cube.combined_wcs
+    new_wcs = cube.wcs.deepcopy()
+    cube.wcs = None
+    cube.wcs = new_wcs
+    assert cube.combined_wcs is not combined_wcs
+    # Copies of the cube do not share the cache.
+    combined_wcs = cube.combined_wcs
+    cube_copy = copy.copy(cube)
+    cube_copy._extra_coords = ExtraCoords()
+    assert cube_copy.combined_wcs is cube_copy.wcs
+    assert cube.combined_wcs is combined_wcs
+
+
+@pytest.mark.parametrize("axis", (0, -1))
+def test_explode_along_axis(ndcube_3d_ln_lt_l, axis):
+    cube = ndcube_3d_ln_lt_l
+    exploded = cube.explode_along_axis(axis)
+    n_frames = cube.data.shape[axis]
+    item = [slice(None)] * 3
+    item[axis] = 1
+    expected = cube[tuple(item)]
+
+    assert len(exploded) == n_frames
+    assert exploded.meta is cube.meta
+    assert exploded.dimensions[0] == n_frames * u.pix
+    assert u.allclose(exploded.dimensions[1:], expected.dimensions)
+    np.testing.assert_array_equal(exploded[1].data, expected.data)
+    assert not exploded[1].meta
+    assert exploded[-1] is exploded[n_frames - 1]
+    assert [frame.data.shape for frame in exploded] == [expected.data.shape] * n_frames
+    # Slicing the sequence shares the frames already created.
+    assert exploded[1:][0] is exploded[1]
+
+
+def test_explode_along_axis_no_cache(ndcube_3d_ln_lt_l):
+    exploded = ndcube_3d_ln_lt_l.explode_along_axis(0, cache=False)
+    assert exploded[0] is not exploded[0]
+    np.testing.assert_array_equal(exploded[0].data, exploded[0].data)
+
+
+def test_explode_along_axis_append(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    exploded = cube.explode_along_axis(0)
+    exploded_again = exploded.explode_along_axis(0)
+    # The cubes of the sequence can be appended to as for a list.
+    exploded.data.append(cube[0])
+    assert len(exploded.data) == cube.data.shape[0] + 1
+    assert exploded.data[-1].data.shape == cube[0].data.shape
+    # Sequences exploded from the sequence are not changed.
+    assert len(exploded_again.data) == cube.data.shape[0] * cube.data.shape[1]
+
+
 def test_crop(ndcube_4d_ln_lt_l_t):
     cube = ndcube_4d_ln_lt_l_t
     intervals = cube.wcs.array_index_to_world([1, 2], [0, 1], [0, 1], [0, 2])
@@ -655,6 +981,48 @@ def test_crop_by_extra_coords_values_shared_axis(ndcube_3d_ln_lt_l_ec_sharing_ax
     helpers.assert_cubes_equal(output, expected)
 
 
+def test_crop_many(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    intervals = cube.wcs.array_index_to_world([1, 2], [0, 1], [0, 1], [0, 2])
+    region1 = ([coord[0] for coord in intervals], [coord[-1] for coord in intervals])
+    region2 = ([intervals[0][0], None, None], [intervals[0][-1], None, None])
+    region3 = ([None] * 3,)
+    outputs = cube.crop_many([region1, region2, region3])
+    assert len(outputs) == 3
+    helpers.assert_cubes_equal(outputs[0], cube.crop(*region1))
+    helpers.assert_cubes_equal(outputs[1], cube.crop(*region2))
+    helpers.assert_cubes_equal(outputs[2], cube)
+
+
+def test_crop_by_values_many(ndcube_4d_ln_lt_l_t):
+    cube = ndcube_4d_ln_lt_l_t
+    intervals = cube.wcs.array_index_to_world_values([1, 2], [0, 1], [0, 1], [0, 2])
+    units = [u.min, u.m, u.deg, u.deg]
+    region1 = ([coord[0] for coord in intervals], [coord[-1] for coord in intervals])
+    region2 = ([0.5, None, None, None], [1.1, None, None, None])
+    outputs = cube.crop_by_values_many([region1, region2], units=units)
+    helpers.assert_cubes_equal(outputs[0], cube[1:3, 0:2, 0:2, 0:3])
+    helpers.assert_cubes_equal(outputs[1], cube[:, :, :, 0:3])
+
+
+def test_crop_by_values_many_extra_coords(ndcube_3d_ln_lt_l_ec_time):
+    cube = ndcube_3d_ln_lt_l_ec_time
+    regions = [((3 * 60 * 60 * u.s, 0 * u.pix), (8 * 60 * 60 * u.s, 2 * u.pix)),
+               ((None, None),)]
+    outputs = cube.crop_by_values_many(regions, wcs=cube.extra_coords)
+    helpers.assert_cubes_equal(outputs[0], cube[0])
+    helpers.assert_cubes_equal(outputs[1], cube)
+
+
+def test_crop_many_scalar_valueerror(ndcube_2d_ln_lt):
+    cube = ndcube_2d_ln_lt
+    intervals = cube.wcs.array_index_to_world_values([0, 3], [1, 6])
+    region1 = ([coord[0] * u.deg for coord in intervals], [coord[-1] * u.deg for coord in intervals])
+    region2 = ([coord[0] * u.deg for coord in intervals],)
+    with pytest.raises(ValueError, match=r'Input points causes cube to be cropped to a single pix'):
+        cube.crop_by_values_many([region1, region2])
+
+
 def test_crop_rotated_celestial(ndcube_4d_ln_lt_l_t):
     # This is a regression test for a highly rotated image where all 4 corners
     # of the spatial ROI have to be used.
@@ -839,6 +1207,30 @@ def test_rebin_dask(ndcube_2d_dask):
     assert isinstance(output.mask, dask_type)
 
 
+@pytest.mark.parametrize("operation", [np.mean, np.nansum, np.median])
+def test_rebin_dask_blockwise(ndcube_2d_ln_lt_mask_uncert, operation):
+    cube = ndcube_2d_ln_lt_mask_uncert
+    cube.mask[2:4, 4:8] = True
+    dask_cube = NDCube(dask.array.from_array(cube.data, chunks=(3, 5)), wcs=cube.wcs,
+                       mask=dask.array.from_array(cube.mask, chunks=(3, 5)),
+                       uncertainty=StdDevUncertainty(dask.array.from_array(cube.uncertainty.array,
+                                                                           chunks=(3, 5))))
+    bin_shape = (2, 4)
+    propagate = operation is not np.median
+    output = dask_cube.rebin(bin_shape, operation=operation, propagate_uncertainties=propagate)
+    expected = cube.rebin(bin_shape, operation=operation, propagate_uncertainties=propagate)
+
+    # Chunks are aligned to the bins so each is reduced separately.
+    assert output.data.chunks == ((1, 1, 1, 1, 1), (1, 1, 1))
+    np.testing.assert_allclose(output.data.compute(), expected.data)
+    assert isinstance(output.mask, dask.array.Array)
+    np.testing.assert_array_equal(output.mask.compute(), expected.mask)
+    if propagate:
+        assert type(output.uncertainty) is StdDevUncertainty
+        assert isinstance(output.uncertainty.array, dask.array.Array)
+        np.testing.assert_allclose(output.uncertainty.array.compute(), expected.uncertainty.array)
+
+
 def test_rebin_no_ec(ndcube_3d_l_ln_lt_ectime):
     # Confirm rebin does not try to handle extra coords when there aren't any.
     cube = ndcube_3d_l_ln_lt_ectime[:, 1:]
@@ -910,6 +1302,99 @@ def test_rebin_some_masked_uncerts_exclude_masked_values(ndcube_2d_ln_lt_mask_un
     assert (output.mask == expected_mask).all()
 
 
+@pytest.mark.parametrize("operation", [np.sum, np.mean, np.nansum, np.nanmean])
+@pytest.mark.parametrize("dtype", [float, np.float32, int])
+def test_rebin_masked_matches_masked_array(ndcube_2d_ln_lt_mask_uncert, operation, dtype):
+    cube = ndcube_2d_ln_lt_mask_uncert
+    data = cube.data.astype(dtype)
+    if dtype is not int:
+        data[0, 3] = np.nan
+        data[9, 11] = np.nan
+    mask = cube.mask.copy()
+    mask[2:4, 4:8] = True  # Fully masked bin.
+    cube = NDCube(data, wcs=cube.wcs, mask=mask)
+    bin_shape = (2, 4)
+    with np.errstate(invalid="ignore"):
+        expected = operation(np.ma.masked_array(data, mask).reshape(5, 2, 3, 4), axis=(3, 1)).data
+    if operation is np.nanmean:
+        # Masked arrays only give NaN for fully masked bins if the array contains NaNs.
+        expected[mask.reshape(5, 2, 3, 4).all(axis=(3, 1))] = np.nan
+    output = cube.rebin(bin_shape, operation=operation)
+    # The dtype is the same as for unmasked data, unlike for masked arrays.
+    assert output.data.dtype == operation(data.reshape(5, 2, 3, 4), axis=(3, 1)).dtype
+    np.testing.assert_allclose(output.data, expected)
+
+    dask_cube = NDCube(dask.array.from_array(data, chunks=4), wcs=cube.wcs, mask=mask)
+    dask_output = dask_cube.rebin(bin_shape, operation=operation)
+    assert isinstance(dask_output.data, dask.array.Array)
+    np.testing.assert_allclose(dask_output.data.compute(), expected)
+
+
+@pytest.mark.parametrize("operation", [np.mean, np.sum, np.max])
+def test_rebin_trim(ndcube_3d_l_ln_lt_ectime, operation):
+    cube = ndcube_3d_l_ln_lt_ectime
+    cube.mask[1, 1, 1] = True
+    bin_shape = (3, 2, 3)
+    output = cube.rebin(bin_shape, operation=operation, propagate_uncertainties=True, trim=True)
+    expected = cube[:9, :4, :6].rebin(bin_shape, operation=operation, propagate_uncertainties=True)
+
+    assert output.data.shape == (3, 2, 2)
+    helpers.assert_cubes_equal(output, expected)
+    assert output.wcs.low_level_wcs.pixel_shape == expected.wcs.low_level_wcs.pixel_shape
+    assert len(output.extra_coords._lookup_tables[0][1].table) == 2
+    assert (output.axis_world_coords(wcs=output.extra_coords)[0]
+            == expected.axis_world_coords(wcs=expected.extra_coords)[0]).all()
+
+
+def test_rebin_pad(ndcube_2d_ln_lt_mask_uncert):
+    cube = ndcube_2d_ln_lt_mask_uncert
+    cube.wcs.low_level_wcs.pixel_shape = cube.data.shape[::-1]
+    bin_shape = (4, 5)
+    output = cube.rebin(bin_shape, operation=np.mean, propagate_uncertainties=True, pad=True)
+
+    assert output.data.shape == (3, 3)
+    assert output.wcs.low_level_wcs.pixel_shape == (3, 3)
+    # Partial bins only include the unmasked pixels of the cube.
+    data = np.ma.masked_array(cube.data, cube.mask)
+    assert output.data[0, 0] == data[:4, :5].mean()
+    assert output.data[2, 2] == data[8:, 10:].mean()
+    assert output.data[1, 2] == data[4:8, 10:].mean()
+    assert np.isclose(output.uncertainty.array[2, 2],
+                      np.sqrt((cube.uncertainty.array[8:, 10:]**2).sum()) / 4)
+    expected_mask = np.zeros((3, 3), dtype=bool)
+    np.testing.assert_array_equal(output.mask, expected_mask)
+    # Pad pixels are excluded even if the mask is ignored.
+    output = cube.rebin(bin_shape, operation=np.sum, operation_ignores_mask=True,
+                        handle_mask=np.any, propagate_uncertainties=True, pad=True)
+    assert output.data[2, 2] == cube.data[8:, 10:].sum()
+    assert output.data[1, 0] == cube.data[4:8, :5].sum()
+    assert output.mask[1, 0]
+    assert not output.mask[2, 2]
+    assert np.isclose(output.uncertainty.array[2, 2],
+                      np.sqrt((cube.uncertainty.array[8:, 10:]**2).sum()))
+
+
+@pytest.mark.parametrize("edge", (False, True))
+def test_pad_to_shape(edge):
+    array = np.arange(24).reshape(2, 3, 4)
+    pad_width = ((0, 1), (0, 2), (0, 0))
+    if edge:
+        expected = np.pad(array, pad_width, mode="edge")
+    else:
+        expected = np.pad(array, pad_width, constant_values=-1)
+    output = _pad_to_shape(array, (3, 5, 4), constant_value=-1, edge=edge)
+    np.testing.assert_array_equal(output, expected)
+    output = _pad_to_shape(dask.array.from_array(array), (3, 5, 4), constant_value=-1, edge=edge)
+    np.testing.assert_array_equal(output.compute(), expected)
+
+
+def test_rebin_pad_dask(ndcube_2d_dask):
+    output = ndcube_2d_dask.rebin((3, 3), operation=np.sum, pad=True)
+    assert isinstance(output.data, dask.array.Array)
+    np.testing.assert_allclose(output.data[-1, -1].compute(),
+                               ndcube_2d_dask.data[6:, 3:].sum().compute())
+
+
 def test_rebin_errors(ndcube_3d_l_ln_lt_ectime):
     cube = ndcube_3d_l_ln_lt_ectime
     # Wrong number of axes in bin_shape)
@@ -920,6 +1405,9 @@ def test_rebin_errors(ndcube_3d_l_ln_lt_ectime):
     with pytest.raises(ValueError):
         cube.rebin((9, 2, 1))
 
+    with pytest.raises(ValueError, match="trim and pad"):
+        cube.rebin((9, 2, 1), trim=True, pad=True)
+
 
 def test_rebin_no_propagate(ndcube_2d_ln_lt_mask_uncert):
     # Execute rebin.
@@ -942,6 +1430,122 @@ def test_rebin_no_propagate(ndcube_2d_ln_lt_mask_uncert):
     assert output.uncertainty is None
 
 
+def test_rebin_dtype(ndcube_2d_ln_lt_mask_uncert):
+    cube = ndcube_2d_ln_lt_mask_uncert
+    bin_shape = (2, 4)
+    expected = cube.rebin(bin_shape, operation=np.mean, propagate_uncertainties=True)
+    output = cube.rebin(bin_shape, operation=np.mean, propagate_uncertainties=True,
+                        dtype=np.float32)
+
+    assert output.data.dtype == np.float32
+    assert output.uncertainty.array.dtype == np.float32
+    np.testing.assert_allclose(output.data, expected.data, rtol=1e-6)
+    np.testing.assert_allclose(output.uncertainty.array, expected.uncertainty.array, rtol=1e-6)
+
+    # Integer data are averaged in the requested precision.
+    cube = NDCube(np.arange(120).reshape(10, 12), wcs=cube.wcs)
+    output = cube.rebin(bin_shape, operation=np.mean, dtype=np.float32)
+    assert output.data.dtype == np.float32
+    np.testing.assert_allclose(output.data, cube.rebin(bin_shape, operation=np.mean).data, rtol=1e-6)
+
+
+def test_rebin_stats_dtype(ndcube_2d_ln_lt_mask_uncert):
+    cube = ndcube_2d_ln_lt_mask_uncert
+    output = cube.rebin_stats((2, 4), stats=("mean", "std", "count"), dtype=np.float32)
+    expected = cube.rebin_stats((2, 4), stats=("mean", "std"))
+    for stat in ("mean", "std"):
+        assert output[stat].data.dtype == np.float32
+        np.testing.assert_allclose(output[stat].data, expected[stat].data, rtol=1e-5)
+    assert np.issubdtype(output["count"].data.dtype, np.integer)
+
+
+def test_rebin_sliced_wcs_not_nested(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    output = cube
+    nested_wcs = cube.wcs.low_level_wcs
+    for _ in range(2):
+        output = output.rebin((1, 1, 2), pad=True)[:, 1:]
+        nested_wcs = SlicedLowLevelWCS(ResampledLowLevelWCS(nested_wcs, (2, 1, 1), rounding="ceil"),
+                                       (slice(None), slice(1, None)))
+    # Repeated slicing and rebinning results in one wrapper of each type around the original WCS.
+    assert isinstance(output.wcs.low_level_wcs, SlicedLowLevelWCS)
+    assert output.wcs.low_level_wcs._wcs._wcs is cube.wcs.low_level_wcs
+    assert output.wcs.low_level_wcs.pixel_shape == nested_wcs.pixel_shape
+    for coord, expected in zip(output.axis_world_coords_values(),
+                               output.axis_world_coords_values(wcs=HighLevelWCSWrapper(nested_wcs))):
+        assert u.allclose(coord, expected)
+
+
+def test_rebin_stats(ndcube_2d_ln_lt_mask_uncert):
+    cube = ndcube_2d_ln_lt_mask_uncert
+    mask = cube.mask.copy()
+    mask[2:4, 4:8] = True  # Fully masked bin.
+    cube = NDCube(cube.data, wcs=cube.wcs, mask=mask, unit=u.ct)
+    bin_shape = (2, 4)
+    output = cube.rebin_stats(bin_shape, stats=("sum", "mean", "var", "std", "min", "max", "count"))
+
+    assert isinstance(output, NDCollection)
+    assert list(output.keys()) == ["sum", "mean", "var", "std", "min", "max", "count"]
+    for stat in ("sum", "mean"):
+        expected = cube.rebin(bin_shape, operation=getattr(np, stat))
+        np.testing.assert_allclose(output[stat].data, expected.data)
+        np.testing.assert_array_equal(output[stat].mask, expected.mask)
+        assert output[stat].unit == u.ct
+    data = np.ma.masked_array(cube.data, mask).reshape(5, 2, 3, 4)
+    # Fully masked bins are 0 rather than the fill value of masked arrays.
+    np.testing.assert_allclose(output["min"].data, data.min(axis=(3, 1)).filled(0))
+    np.testing.assert_allclose(output["max"].data, data.max(axis=(3, 1)).filled(0))
+    np.testing.assert_allclose(output["var"].data, data.var(axis=(3, 1)).filled(0))
+    np.testing.assert_allclose(output["std"].data, data.std(axis=(3, 1)).filled(0))
+    np.testing.assert_array_equal(output["count"].data, data.count(axis=(3, 1)))
+    assert output["var"].unit == u.ct**2
+    assert output["count"].unit is None
+    # All statistics share the same resampled WCS.
+    assert output["mean"].wcs.low_level_wcs is output["count"].wcs.low_level_wcs
+
+
+def test_rebin_stats_extra_coords(ndcube_3d_l_ln_lt_ectime):
+    cube = ndcube_3d_l_ln_lt_ectime
+    bin_shape = (3, 2, 3)
+    output = cube.rebin_stats(bin_shape, stats=("mean", "std"), trim=True)
+    expected = cube.rebin(bin_shape, operation=np.mean, trim=True)
+
+    np.testing.assert_allclose(output["mean"].data, expected.data)
+    assert output["std"].data.shape == (3, 2, 2)
+    assert (output["std"].axis_world_coords(wcs=output["std"].extra_coords)[0]
+            == expected.axis_world_coords(wcs=expected.extra_coords)[0]).all()
+    # The extra coords are resampled once and their coordinates shared between the cubes.
+    assert output["std"].extra_coords is not output["mean"].extra_coords
+    assert output["std"].extra_coords._ndcube is output["std"]
+    assert (output["std"].extra_coords._lookup_tables[0][1]
+            is output["mean"].extra_coords._lookup_tables[0][1])
+
+
+def test_rebin_stats_bool(ndcube_2d_ln_lt):
+    data = ndcube_2d_ln_lt.data > ndcube_2d_ln_lt.data.mean()
+    mask = np.zeros(data.shape, dtype=bool)
+    mask[0, 0] = True
+    cube = NDCube(data, wcs=ndcube_2d_ln_lt.wcs, mask=mask)
+    output = cube.rebin_stats((2, 2), stats=("min", "max", "count"))
+    expected = np.ma.masked_array(data, mask).reshape(5, 2, 6, 2)
+    np.testing.assert_array_equal(output["min"].data, expected.min(axis=(3, 1)))
+    np.testing.assert_array_equal(output["max"].data, expected.max(axis=(3, 1)))
+
+
+def test_rebin_stats_dask(ndcube_2d_dask):
+    output = ndcube_2d_dask.rebin_stats((3, 3), stats=("mean", "std", "count"), pad=True)
+    assert isinstance(output["mean"].data, dask.array.Array)
+    expected = ndcube_2d_dask.data[6:, 3:].compute()
+    np.testing.assert_allclose(output["mean"].data[-1, -1].compute(), expected.mean())
+    np.testing.assert_allclose(output["std"].data[-1, -1].compute(), expected.std())
+    assert output["count"].data[-1, -1].compute() == expected.size
+
+
+def test_rebin_stats_errors(ndcube_2d_ln_lt):
+    with pytest.raises(ValueError, match="Unsupported statistics"):
+        ndcube_2d_ln_lt.rebin_stats((2, 2), stats=("mean", "median"))
+
+
 def test_reproject_adaptive(ndcube_2d_ln_lt, wcs_2d_lt_ln):
     shape_out = (10, 12)
     resampled_cube = ndcube_2d_ln_lt.reproject_to(wcs_2d_lt_ln, algorithm='adaptive',
@@ -1104,19 +1708,233 @@ def test_cube_arithmetic_neg(ndcube_2d_ln_lt_units):
     )
 
 
+def test_cube_arithmetic_copies_writeable(ndcube_3d_l_ln_lt_ectime):
+    cube = ndcube_3d_l_ln_lt_ectime
+    meta = {"instrument": "camera"}
+    cube.meta = meta
+    mask = cube.mask
+    uncertainty = cube.uncertainty
+    original_mask = mask.copy()
+    original_uncertainty = uncertainty.array.copy()
+    new_cube = -(cube + 1 * cube.unit)
+
+    # The original cube is not modified.
+    assert cube.mask is mask
+    assert cube.meta is meta
+    assert cube.uncertainty is uncertainty
+    assert mask.flags.writeable
+    assert uncertainty.array.flags.writeable
+
+    # The writeable mask and unchanged uncertainty are copied.
+    assert not np.shares_memory(new_cube.mask, mask)
+    assert not np.shares_memory(new_cube.uncertainty.array, uncertainty.array)
+    assert type(new_cube.uncertainty) is type(cube.uncertainty)
+    assert new_cube.uncertainty.parent_nddata is new_cube
+
+    # Modifying either cube's arrays in place does not modify the other's.
+    new_cube.mask[0] = True
+    new_cube.uncertainty.array[0] = 0
+    np.testing.assert_array_equal(cube.mask, original_mask)
+    np.testing.assert_array_equal(cube.uncertainty.array, original_uncertainty)
+    new_cube = -(cube + 1 * cube.unit)
+    cube.mask[0] = ~original_mask[0]
+    cube.uncertainty.array[0] = -1
+    np.testing.assert_array_equal(new_cube.mask, original_mask)
+    np.testing.assert_array_equal(new_cube.uncertainty.array, original_uncertainty)
+    cube.mask[0] = original_mask[0]
+    cube.uncertainty.array[0] = original_uncertainty[0]
+
+    # Read-only arrays are shared, and remain read-only, rather than copied.
+    mask.flags.writeable = False
+    uncertainty.array.flags.writeable = False
+    new_cube = -(cube + 1 * cube.unit)
+    assert new_cube.mask is mask
+    assert new_cube.uncertainty.array is uncertainty.array
+    with pytest.raises(ValueError, match="read-only"):
+        new_cube.mask[0] = True
+    # Slicing the new cube does not copy the shared arrays.
+    assert np.shares_memory(new_cube[0:1].mask, mask)
+
+    # The metadata is shallow copied.
+    new_cube.meta["instrument"] = "telescope"
+    assert cube.meta["instrument"] == "camera"
+    meta["instrument"] = "telescope"
+    assert cube.meta["instrument"] == "telescope"
+    assert (cube * 2).meta == meta
+
+    # Coordinate containers are copied, but not the coordinates they hold.
+    assert new_cube.extra_coords._lookup_tables[0][1] is cube.extra_coords._lookup_tables[0][1]
+    assert new_cube.extra_coords._ndcube is new_cube
+    assert new_cube.global_coords._ndcube is new_cube
+    new_cube.extra_coords.add("time2", 0, np.arange(cube.data.shape[0]) * u.s)
+    new_cube.global_coords.add("distance", "pos.distance", 1 * u.m)
+    assert len(cube.extra_coords._lookup_tables) == 1
+    assert len(cube.global_coords) == 0
+
+
+@pytest.mark.parametrize("operator_name, value", [("__iadd__", 2 * u.ct), ("__isub__", 2 * u.ct),
+                                                   ("__imul__", 2), ("__imul__", 2 * u.s),
+                                                   ("__itruediv__", 2 * u.s)])
+def test_cube_arithmetic_inplace(ndcube_2d_ln_lt_uncert, operator_name, value):
+    cube = ndcube_2d_ln_lt_uncert
+    cube = NDCube(cube.data.astype(float), wcs=cube.wcs, uncertainty=cube.uncertainty, unit=u.ct)
+    expected = getattr(cube, operator_name.replace("__i", "__"))(value)
+    data = cube.data
+    uncertainty = cube.uncertainty.array
+
+    output = getattr(cube, operator_name)(value)
+    assert output is cube
+    # The data are updated in place.
+    assert cube.data is data
+    if operator_name in ("__iadd__", "__isub__"):
+        assert cube.uncertainty.array is uncertainty
+    assert cube.uncertainty.parent_nddata is cube
+    np.testing.assert_allclose(cube.data, expected.data)
+    np.testing.assert_allclose(cube.uncertainty.array, expected.uncertainty.array)
+    assert cube.unit == expected.unit
+
+
+@pytest.mark.parametrize("uncertainty_type, power", [(astropy.nddata.StdDevUncertainty, 1),
+                                                      (astropy.nddata.VarianceUncertainty, 2),
+                                                      (astropy.nddata.InverseVariance, -2)])
+@pytest.mark.parametrize("inplace", [False, True])
+def test_cube_arithmetic_multiply_uncertainty_type(ndcube_2d_ln_lt, uncertainty_type, power, inplace):
+    data = np.arange(1, 1 + np.prod(ndcube_2d_ln_lt.data.shape), dtype=float).reshape(
+        ndcube_2d_ln_lt.data.shape)
+    # The uncertainty has a different unit from that derived from the data unit, so it is kept.
+    uncertainty_unit = u.mct ** power
+    cube = NDCube(data.copy(), wcs=ndcube_2d_ln_lt.wcs, unit=u.ct,
+                  uncertainty=uncertainty_type(data.copy(), unit=uncertainty_unit))
+    if inplace:
+        new_cube = cube
+        new_cube *= -3 * u.s
+    else:
+        new_cube = cube * (-3 * u.s)
+    assert type(new_cube.uncertainty) is uncertainty_type
+    np.testing.assert_allclose(new_cube.uncertainty.array, data * 3.0 ** power)
+    assert new_cube.unit == u.ct * u.s
+    assert new_cube.uncertainty.unit == (u.mct * u.s) ** power
+
+
+def test_cube_arithmetic_inplace_shared_uncertainty(ndcube_2d_ln_lt_uncert):
+    cube = ndcube_2d_ln_lt_uncert
+    cube = NDCube(cube.data.astype(float), wcs=cube.wcs, uncertainty=cube.uncertainty, unit=u.ct)
+    uncertainty = cube.uncertainty.array.copy()
+    cube.uncertainty.array.flags.writeable = False
+    new_cube = cube + 1 * u.ct
+    assert new_cube.uncertainty.array is cube.uncertainty.array
+    new_cube *= 2
+    # The read-only uncertainty shared with the original cube is replaced, not modified.
+    np.testing.assert_allclose(cube.uncertainty.array, uncertainty)
+    np.testing.assert_allclose(new_cube.uncertainty.array, uncertainty * 2)
+
+
+def test_cube_arithmetic_inplace_casting(ndcube_2d_ln_lt_uncert):
+    cube = NDCube(ndcube_2d_ln_lt_uncert.data.astype(int), wcs=ndcube_2d_ln_lt_uncert.wcs)
+    data = cube.data.copy()
+    with pytest.raises(TypeError):
+        cube *= 1.5
+    np.testing.assert_array_equal(cube.data, data)
+    cube *= 2
+    np.testing.assert_array_equal(cube.data, data * 2)
+
+
+def test_cube_arithmetic_inplace_uncertainty_casting(ndcube_2d_ln_lt_uncert):
+    # If the uncertainty cannot be updated, neither the data nor the uncertainty are changed.
+    cube = ndcube_2d_ln_lt_uncert
+    uncertainty = type(cube.uncertainty)(np.ones(cube.data.shape, dtype=int))
+    cube = NDCube(cube.data.astype(float), wcs=cube.wcs, uncertainty=uncertainty, unit=u.ct)
+    data = cube.data.copy()
+    with pytest.raises(TypeError):
+        cube *= 1.5
+    np.testing.assert_array_equal(cube.data, data)
+    np.testing.assert_array_equal(cube.uncertainty.array, 1)
+    assert cube.unit == u.ct
+
+
+def test_cube_arithmetic_inplace_dask(ndcube_2d_dask):
+    cube = ndcube_2d_dask
+    expected = (cube * 2).data.compute()
+    cube *= 2
+    assert isinstance(cube.data, dask.array.Array)
+    assert isinstance(cube.uncertainty.array, dask.array.Array)
+    np.testing.assert_allclose(cube.data.compute(), expected)
+
+
 def test_add_unitless_cube_typeerror(ndcube_2d_ln_lt_units):
     with pytest.raises(TypeError):
         _ = ndcube_2d_ln_lt_units + 10.0
 
 
 def test_cube_arithmetic_add_notimplementederror(ndcube_2d_ln_lt_units):
+    # NDData without a WCS cannot be checked to be aligned with the cube.
     with pytest.raises(TypeError):
-        _ = ndcube_2d_ln_lt_units + ndcube_2d_ln_lt_units
+        _ = ndcube_2d_ln_lt_units + NDData(ndcube_2d_ln_lt_units.data, unit=u.ct)
 
 
 def test_cube_arithmetic_multiply_notimplementederror(ndcube_2d_ln_lt_units):
     with pytest.raises(TypeError):
-        _ = ndcube_2d_ln_lt_units * ndcube_2d_ln_lt_units
+        _ = ndcube_2d_ln_lt_units * NDData(ndcube_2d_ln_lt_units.data)
+
+
+@pytest.mark.parametrize("method, operation", [("add", operator.add), ("subtract", operator.sub),
+                                               ("multiply", operator.mul),
+                                               ("divide", operator.truediv)])
+def test_cube_arithmetic_cube(ndcube_2d_ln_lt_mask_uncert, method, operation):
+    cube = ndcube_2d_ln_lt_mask_uncert
+    cube = NDCube(cube.data + 1., wcs=cube.wcs, mask=cube.mask,
+                  uncertainty=StdDevUncertainty(cube.uncertainty.array), unit=u.J)
+    other_mask = np.zeros(cube.data.shape, dtype=bool)
+    other_mask[0] = True
+    # The WCS is equal to, but not the same object as, that of the cube.
+    other = NDCube(np.full(cube.data.shape, 2000.), wcs=cube.wcs.deepcopy(), mask=other_mask,
+                   uncertainty=StdDevUncertainty(np.full(cube.data.shape, 100.)), unit=u.mJ)
+    output = operation(cube, other)
+
+    # Compare with astropy's NDData arithmetic.
+    nddata = NDDataRef(cube.data, uncertainty=StdDevUncertainty(cube.uncertainty.array),
+                       mask=cube.mask, unit=cube.unit)
+    other_nddata = NDDataRef(other.data, uncertainty=StdDevUncertainty(other.uncertainty.array),
+                             mask=other.mask, unit=other.unit)
+    expected = getattr(nddata, method)(other_nddata)
+    expected_quantity = u.Quantity(expected.data, expected.unit)
+    np.testing.assert_allclose(u.Quantity(output.data, output.unit).to_value(expected.unit),
+                               expected_quantity.value)
+    expected_uncertainty = u.Quantity(expected.uncertainty.array, expected.unit)
+    np.testing.assert_allclose(
+        u.Quantity(output.uncertainty.array, output.unit).to_value(expected.unit),
+        expected_uncertainty.value)
+    np.testing.assert_array_equal(output.mask, cube.mask | other_mask)
+    assert output.wcs is cube.wcs
+    if method in {"add", "subtract"}:
+        assert output.unit == u.J
+
+
+def test_cube_arithmetic_cube_missing_attributes(ndcube_2d_ln_lt_units):
+    cube = ndcube_2d_ln_lt_units
+    other = NDCube(np.ones(cube.data.shape), wcs=cube.wcs, unit=u.ct,
+                   uncertainty=StdDevUncertainty(np.full(cube.data.shape, 0.5)),
+                   mask=np.ones(cube.data.shape, dtype=bool))
+    output = cube + other
+    np.testing.assert_allclose(output.data, cube.data + 1)
+    np.testing.assert_allclose(output.uncertainty.array, 0.5)
+    assert output.mask.all()
+    assert output.mask is not other.mask
+    output = other * cube
+    np.testing.assert_allclose(output.uncertainty.array, 0.5 * cube.data)
+    assert output.unit == u.ct**2
+
+
+def test_cube_arithmetic_cube_mismatch(ndcube_2d_ln_lt_units):
+    cube = ndcube_2d_ln_lt_units
+    wcs = cube.wcs.deepcopy()
+    wcs.wcs.crval = [1, 1]
+    with pytest.raises(ValueError, match="different WCS"):
+        _ = cube + NDCube(cube.data, wcs=wcs, unit=cube.unit)
+    with pytest.raises(ValueError, match="different shape"):
+        _ = cube * cube[1:]
+    with pytest.raises(u.UnitConversionError):
+        _ = cube - NDCube(cube.data, wcs=cube.wcs, unit=u.s)
 
 
 @pytest.mark.parametrize('new_unit', [u.mJ, 'mJ'])
@@ -1129,6 +1947,67 @@ def test_to(ndcube_1d_l, new_unit):
     assert output.unit == u.Unit(new_unit)
 
 
+def test_to_no_copy(ndcube_1d_l):
+    cube = NDCube(ndcube_1d_l.data.astype(float), wcs=ndcube_1d_l.wcs, unit=ndcube_1d_l.unit)
+    data = cube.data.copy()
+    output = cube.to(u.mJ, copy=False)
+    assert output is cube
+    np.testing.assert_allclose(cube.data, data * 1000)
+    assert cube.unit == u.mJ
+
+
+def test_to_dtype(ndcube_1d_l):
+    cube = ndcube_1d_l
+    output = cube.to(u.mJ, dtype=np.float32)
+    assert output.data.dtype == np.float32
+    assert output.uncertainty.array.dtype == np.float32
+    np.testing.assert_allclose(output.data, cube.data * 1000, rtol=1e-6)
+    np.testing.assert_allclose(output.uncertainty.array, cube.uncertainty.array * 1000, rtol=1e-6)
+
+    with pytest.raises(ValueError, match="dtype cannot be changed"):
+        cube.to(u.mJ, copy=False, dtype=np.float32)
+
+
+@pytest.fixture(params=["legacy", "weak"])
+def numpy_promotion_state(request):
+    """
+    Run a test with numpy's legacy value-based promotion rules and those of NEP 50.
+    """
+    if not hasattr(np, "_set_promotion_state"):
+        # numpy versions without the option always follow NEP 50 (numpy >= 2),
+        # or never do (numpy < 1.24).
+        if (request.param == "weak") != (np.lib.NumpyVersion(np.__version__) >= "2.0.0"):
+            pytest.skip(f"numpy {np.__version__} does not support {request.param} promotion.")
+        yield request.param
+        return
+    state = np._get_promotion_state()
+    np._set_promotion_state(request.param)
+    try:
+        yield request.param
+    finally:
+        np._set_promotion_state(state)
+
+
+def test_to_float32(ndcube_1d_l, numpy_promotion_state):
+    # Scalar conversion factors and offsets do not promote single precision data.
+    cube = ndcube_1d_l
+    uncertainty = type(cube.uncertainty)(cube.uncertainty.array.astype(np.float32))
+    cube = NDCube(cube.data.astype(np.float32), wcs=cube.wcs, uncertainty=uncertainty,
+                  unit=cube.unit)
+    for output in (cube.to(u.mJ), cube * (2 * u.s), cube / (2 * u.s),
+                   cube + 1 * u.J, cube - 1 * u.mJ):
+        assert output.data.dtype == np.float32
+        assert output.uncertainty.array.dtype == np.float32
+    np.testing.assert_allclose(cube.to(u.mJ).data, cube.data * 1000, rtol=1e-6)
+    cube += 1 * u.mJ
+    assert cube.data.dtype == np.float32
+    cube -= 1 * u.J
+    assert cube.data.dtype == np.float32
+    cube *= 1 * u.s
+    assert cube.data.dtype == np.float32
+    assert cube.uncertainty.array.dtype == np.float32
+
+
 def test_to_dask(ndcube_2d_dask):
     output = ndcube_2d_dask.to(u.mJ)
     dask_type = dask.array.core.Array
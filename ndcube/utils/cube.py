@@ -1,15 +1,28 @@
 import inspect
 from functools import wraps
 from itertools import chain
+from collections import OrderedDict, namedtuple
 
 import astropy.nddata
 import numpy as np
 from astropy.wcs.wcsapi import BaseHighLevelWCS, HighLevelWCSWrapper, SlicedLowLevelWCS
 
 from ndcube.utils import wcs as wcs_utils
+from ndcube.utils.wcs_high_level_conversion import high_level_objects_to_values
 
-__all__ = ["sanitize_wcs", "sanitize_crop_inputs", "get_crop_item_from_points",
-           "propagate_rebin_uncertainties"]
+__all__ = ["sanitize_wcs", "sanitize_crop_inputs", "sanitize_crop_regions",
+           "get_crop_item_from_points", "get_crop_items_from_regions",
+           "propagate_rebin_uncertainties", "uncertainty_scale_factor", "WorldCoordsCache"]
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Functions converting uncertainty types to and from variance, for which
+# uncertainty propagation through sums and means can be vectorized.
+_VARIANCE_CONVERTERS = {
+    astropy.nddata.StdDevUncertainty: (np.square, np.sqrt),
+    astropy.nddata.VarianceUncertainty: (lambda x: x, lambda x: x),
+    astropy.nddata.InverseVariance: (lambda x: 1 / x, lambda x: 1 / x),
+}
 
 
 def sanitize_wcs(func):
@@ -60,43 +73,63 @@ def sanitize_crop_inputs(points, wcs):
     First arg returned signifies whether the inputs imply that cropping
     should be performed or not.
     """
-    points = list(points)
-    n_points = len(points)
-    n_coords = [None] * n_points
-    values_are_none = [False] * n_points
-    for i, point in enumerate(points):
-        # Ensure each point is a list
-        if isinstance(point, (tuple, list)):
-            points[i] = list(point)
-        else:
-            points[i] = [point]
-        # Record number of objects in each point.
-        # Later we will ensure all points have same number of objects.
-        n_coords[i] = len(points[i])
-        # Confirm whether point contains at least one None entry.
-        if all([coord is None for coord in points[i]]):
-            values_are_none[i] = True
-    # If no points contain a coord, i.e. if all entries in all points are None,
-    # set no-op flag to True and exit.
-    if all(values_are_none):
-        return True, points, wcs
-    # Not not all points are of same length, error.
-    if len(set(n_coords)) != 1:
-        raise ValueError("All points must have same number of coordinate objects."
-                         f"Number of objects in each point: {n_coords}")
+    no_ops, regions, wcs = sanitize_crop_regions([points], wcs)
+    return no_ops[0], regions[0], wcs
+
+
+def sanitize_crop_regions(regions, wcs):
+    """Sanitize inputs to NDCube methods that crop to multiple regions.
+
+    Each region is an iterable of points, as passed to the NDCube crop methods.
+    First arg returned is a list signifying whether each region implies that
+    cropping should be performed or not.
+    """
+    no_ops = []
+    sanitized_regions = []
+    for points in regions:
+        points = list(points)
+        n_points = len(points)
+        n_coords = [None] * n_points
+        values_are_none = [False] * n_points
+        for i, point in enumerate(points):
+            # Ensure each point is a list
+            if isinstance(point, (tuple, list)):
+                points[i] = list(point)
+            else:
+                points[i] = [point]
+            # Record number of objects in each point.
+            # Later we will ensure all points have same number of objects.
+            n_coords[i] = len(points[i])
+            # Confirm whether point contains at least one None entry.
+            if all([coord is None for coord in points[i]]):
+                values_are_none[i] = True
+        # If no points contain a coord, i.e. if all entries in all points are None,
+        # set no-op flag to True for this region.
+        no_op = all(values_are_none)
+        # Not not all points are of same length, error.
+        if not no_op and len(set(n_coords)) != 1:
+            raise ValueError("All points must have same number of coordinate objects."
+                             f"Number of objects in each point: {n_coords}")
+        no_ops.append(no_op)
+        sanitized_regions.append(points)
+    # Exit early if no region requires cropping.
+    if all(no_ops):
+        return no_ops, sanitized_regions, wcs
     # Import must be here to avoid circular import.
     from ndcube.extra_coords.extra_coords import ExtraCoords
     if isinstance(wcs, ExtraCoords):
         # Determine how many dummy axes are needed
         n_dummy_axes = len(wcs._cube_array_axes_without_extra_coords)
         if n_dummy_axes > 0:
-            points = [point + [None] * n_dummy_axes for point in points]
+            sanitized_regions = [points if no_op else
+                                 [point + [None] * n_dummy_axes for point in points]
+                                 for no_op, points in zip(no_ops, sanitized_regions)]
         # Convert extra coords to WCS describing whole cube.
         wcs = wcs.cube_wcs
     # Ensure WCS is low level.
     if isinstance(wcs, BaseHighLevelWCS):
         wcs = wcs.low_level_wcs
-    return False, points, wcs
+    return no_ops, sanitized_regions, wcs
 
 
 def get_crop_item_from_points(points, wcs, crop_by_values):
@@ -127,78 +160,126 @@ def get_crop_item_from_points(points, wcs, crop_by_values):
         will return the minimum cube in array-index-space that contains all the
         input world points.
     """
-    # Define a list of lists to hold the array indices of the points
-    # where each inner list gives the index of all points for that array axis.
-    combined_points_array_idx = [[]] * wcs.pixel_n_dim
-    # For each point compute the corresponding array indices.
-    for point in points:
-        # Get the arrays axes associated with each element in point.
-        if crop_by_values:
-            point_inputs_array_axes = []
-            for i in range(wcs.world_n_dim):
-                pix_axes = np.array(
-                    wcs_utils.world_axis_to_pixel_axes(i, wcs.axis_correlation_matrix))
-                point_inputs_array_axes.append(tuple(
-                    wcs_utils.convert_between_array_and_pixel_axes(pix_axes, wcs.pixel_n_dim)))
-            point_inputs_array_axes = tuple(point_inputs_array_axes)
-        else:
-            point_inputs_array_axes = wcs_utils.array_indices_for_world_objects(
-                HighLevelWCSWrapper(wcs))
+    return get_crop_items_from_regions([points], wcs, crop_by_values)[0]
+
+
+def get_crop_items_from_regions(regions, wcs, crop_by_values):
+    """
+    Find the slice items that crop to the minimum cubes containing each of several regions.
+
+    The points of all regions are converted to array indices together, so cropping
+    to many regions costs little more than cropping to one.
+
+    Parameters
+    ----------
+    regions : iterable of iterables of iterables
+        Each region is an iterable of points, as accepted by
+        `~ndcube.utils.cube.get_crop_item_from_points`.
+
+    wcs : `~astropy.wcs.wcsapi.BaseHighLevelWCS`, `~astropy.wcs.wcsapi.BaseLowLevelWCS`
+        The WCS to use to convert the world coordinates to array indices.
+
+    crop_by_values : `bool`
+        Denotes whether cropping is done using high-level objects or "values",
+        i.e. low-level objects.
+
+    Returns
+    -------
+    items : `list` of `tuple` of `slice`
+        The slice item for each region.
+    """
+    # Get the arrays axes associated with each element in a point.
+    if crop_by_values:
+        point_inputs_array_axes = []
+        for i in range(wcs.world_n_dim):
+            pix_axes = np.array(
+                wcs_utils.world_axis_to_pixel_axes(i, wcs.axis_correlation_matrix))
+            point_inputs_array_axes.append(tuple(
+                wcs_utils.convert_between_array_and_pixel_axes(pix_axes, wcs.pixel_n_dim)))
+        point_inputs_array_axes = tuple(point_inputs_array_axes)
+    else:
+        point_inputs_array_axes = wcs_utils.array_indices_for_world_objects(
+            HighLevelWCSWrapper(wcs))
+    # Group the points of all regions by which of their elements are None
+    # so that the points in each group can be converted with a single WCS call.
+    point_groups = OrderedDict()
+    n_regions = 0
+    for region_index, points in enumerate(regions):
+        n_regions += 1
+        for point in points:
+            point_groups.setdefault(tuple(coord is not None for coord in point),
+                                    []).append((region_index, point))
+    # Define arrays to hold the minimum and maximum array index of each region
+    # along each array axis and whether the region has a point along that axis.
+    min_indices = np.zeros((wcs.pixel_n_dim, n_regions), dtype=int)
+    max_indices = np.zeros((wcs.pixel_n_dim, n_regions), dtype=int)
+    has_indices = np.zeros((wcs.pixel_n_dim, n_regions), dtype=bool)
+    for has_input, group in point_groups.items():
         # Get indices of array axes which correspond to only None inputs in point
         # as well as those that correspond to a coord.
-        point_indices_with_inputs = []
-        array_axes_with_input = []
-        for i, coord in enumerate(point):
-            if coord is not None:
-                point_indices_with_inputs.append(i)
-                array_axes_with_input.append(point_inputs_array_axes[i])
-        array_axes_with_input = set(chain.from_iterable(array_axes_with_input))
+        point_indices_with_inputs = [i for i, with_input in enumerate(has_input) if with_input]
+        array_axes_with_input = set(chain.from_iterable(
+            point_inputs_array_axes[i] for i in point_indices_with_inputs))
         array_axes_without_input = set(range(wcs.pixel_n_dim)) - array_axes_with_input
         # Slice out the axes that do not correspond to a coord
-        # from the WCS and the input point.
+        # from the WCS and the input points.
         wcs_slice = np.array([slice(None)] * wcs.pixel_n_dim)
         if len(array_axes_without_input):
             wcs_slice[np.array(list(array_axes_without_input))] = 0
         sliced_wcs = SlicedLowLevelWCS(wcs, slices=tuple(wcs_slice))
-        sliced_point = np.array(point, dtype=object)[np.array(point_indices_with_inputs)]
-        # Derive the array indices of the input point and place each index
-        # in the list corresponding to its axis.
-        if crop_by_values:
-            point_array_indices = sliced_wcs.world_to_array_index_values(*sliced_point)
-            # If returned value is a 0-d array, convert to a length-1 tuple.
-            if isinstance(point_array_indices, np.ndarray) and point_array_indices.ndim == 0:
-                point_array_indices = (point_array_indices.item(),)
-            else:
-                # Convert from scalar arrays to scalars
-                point_array_indices = tuple(a.item() for a in point_array_indices)
-        else:
-            point_array_indices = HighLevelWCSWrapper(sliced_wcs).world_to_array_index(
-                *sliced_point)
-            # If returned value is a 0-d array, convert to a length-1 tuple.
-            if isinstance(point_array_indices, np.ndarray) and point_array_indices.ndim == 0:
-                point_array_indices = (point_array_indices.item(),)
-        for axis, index in zip(array_axes_with_input, point_array_indices):
-            combined_points_array_idx[axis] = combined_points_array_idx[axis] + [index]
-    # Define slice item with which to slice cube.
-    item = []
-    result_is_scalar = True
-    for axis_indices in combined_points_array_idx:
-        if axis_indices == []:
-            result_is_scalar = False
-            item.append(slice(None))
-        else:
-            min_idx = min(axis_indices)
-            max_idx = max(axis_indices) + 1
-            if max_idx - min_idx == 1:
-                item.append(min_idx)
-            else:
-                item.append(slice(min_idx, max_idx))
+        # Concatenate the values of the points for each world axis of the sliced WCS,
+        # recording which region each value belongs to.
+        point_arrays = []
+        point_regions = []
+        for region_index, point in group:
+            point = [point[i] for i in point_indices_with_inputs]
+            if not crop_by_values:
+                point = high_level_objects_to_values(*point, low_level_wcs=sliced_wcs)
+            # Broadcasting also strips the units of values.
+            point = [values.ravel() for values in np.broadcast_arrays(*point)]
+            point_arrays.append(point)
+            point_regions.append(np.full(len(point[0]), region_index))
+        world_arrays = [np.concatenate(arrays) for arrays in zip(*point_arrays)]
+        point_regions = np.concatenate(point_regions)
+        group_regions = np.unique(point_regions)
+        # Derive the array indices of all the points in the group and
+        # update the bounds of each region along each axis.
+        points_array_indices = sliced_wcs.world_to_array_index_values(*world_arrays)
+        # If there is only one array axis, a single array is returned.
+        if isinstance(points_array_indices, np.ndarray):
+            points_array_indices = (points_array_indices,)
+        for axis, indices in zip(sorted(array_axes_with_input), points_array_indices):
+            indices = np.asarray(indices).ravel()
+            # Initialize the bounds of regions without indices along this axis yet.
+            new_regions = group_regions[~has_indices[axis, group_regions]]
+            min_indices[axis, new_regions] = np.iinfo(int).max
+            max_indices[axis, new_regions] = np.iinfo(int).min
+            has_indices[axis, group_regions] = True
+            np.minimum.at(min_indices[axis], point_regions, indices)
+            np.maximum.at(max_indices[axis], point_regions, indices)
+    # Define slice item with which to slice cube for each region.
+    items = []
+    for region_index in range(n_regions):
+        item = []
+        result_is_scalar = True
+        for axis in range(wcs.pixel_n_dim):
+            if not has_indices[axis, region_index]:
                 result_is_scalar = False
-    # If item will result in a scalar cube, raise an error as this is not currently supported.
-    if result_is_scalar:
-        raise ValueError("Input points causes cube to be cropped to a single pixel. "
-                         "This is not supported.")
-    return tuple(item)
+                item.append(slice(None))
+            else:
+                min_idx = int(min_indices[axis, region_index])
+                max_idx = int(max_indices[axis, region_index]) + 1
+                if max_idx - min_idx == 1:
+                    item.append(min_idx)
+                else:
+                    item.append(slice(min_idx, max_idx))
+                    result_is_scalar = False
+        # If item will result in a scalar cube, raise an error as this is not currently supported.
+        if result_is_scalar:
+            raise ValueError("Input points causes cube to be cropped to a single pixel. "
+                             "This is not supported.")
+        items.append(tuple(item))
+    return items
 
 
 def propagate_rebin_uncertainties(uncertainty, data, mask, operation, operation_ignores_mask=False,
@@ -211,6 +292,12 @@ def propagate_rebin_uncertainties(uncertainty, data, mask, operation, operation_
     must have the same shape as the rebinned data. The operation input is the
     function used to aggregate elements in the first dimension, e.g. `numpy.sum`.
 
+    For uncorrelated `~astropy.nddata.StdDevUncertainty`, `~astropy.nddata.VarianceUncertainty`
+    and `~astropy.nddata.InverseVariance` uncertainties aggregated by `numpy.sum`, `numpy.mean`,
+    `numpy.nansum` or `numpy.nanmean`, the propagation is calculated for all bins at once.
+    Otherwise, the uncertainties of the pixels in each bin are propagated iteratively using
+    `astropy.nddata.NDUncertainty.propagate`.
+
     Parameters
     ----------
     uncertainty: `astropy.nddata.NDUncertainty`
@@ -256,6 +343,14 @@ def propagate_rebin_uncertainties(uncertainty, data, mask, operation, operation_
             propagation_operation = np.multiply
         else:
             raise ValueError("propagation_operation not recognized.")
+    # Sums and means of uncorrelated uncertainties have closed forms which
+    # can be calculated for all pixels at once.
+    if (propagation_operation is np.add
+            and operation in {np.sum, np.nansum, np.mean, np.nanmean}
+            and type(uncertainty) in _VARIANCE_CONVERTERS
+            and np.isscalar(correlation) and correlation == 0):
+        return _propagate_rebin_uncertainties_add(uncertainty, data, mask, operation_is_mean,
+                                                  operation_is_nantype, operation_ignores_mask)
     # Build mask if not provided.
     new_uncertainty = uncertainty[0]  # Define uncertainty for initial iteration step.
     if operation_ignores_mask or mask is None:
@@ -303,8 +398,229 @@ def propagate_rebin_uncertainties(uncertainty, data, mask, operation, operation_
     # number of unmasked pixels in each bin.
     if operation_is_mean and propagation_operation is np.add:
         if mask is False:
-            new_uncertainty.array /= n_pix_per_bin
+            n_unmasked = n_pix_per_bin
         else:
             unmasked_per_bin = np.logical_not(mask).astype(int).sum(axis=flat_axis)
-            new_uncertainty.array /= np.clip(unmasked_per_bin, 1, None)
+            n_unmasked = np.clip(unmasked_per_bin, 1, None)
+        if type(new_uncertainty) in _VARIANCE_CONVERTERS:
+            # The variance of a mean is the summed variance divided by the number
+            # of pixels squared, so scale in variance space.
+            to_variance, from_variance = _VARIANCE_CONVERTERS[type(new_uncertainty)]
+            with np.errstate(divide="ignore"):
+                new_uncertainty.array = from_variance(
+                    to_variance(new_uncertainty.array) / np.square(n_unmasked))
+        else:
+            new_uncertainty.array /= n_unmasked
     return new_uncertainty
+
+
+def uncertainty_scale_factor(uncertainty, value):
+    """
+    Calculate the factor by which an uncertainty array scales when its data are multiplied by a value.
+
+    Standard deviations scale by the absolute value, variances by its square
+    and inverse variances by its inverse square. Uncertainties of other
+    types are assumed to scale linearly with the value.
+
+    Parameters
+    ----------
+    uncertainty: `astropy.nddata.NDUncertainty`
+        The uncertainty of the data.
+    value: `float` or array-like
+        The value by which the data are multiplied.
+
+    Returns
+    -------
+    factor: `float` or array-like
+        The factor by which to multiply the uncertainty array. A Python `float`
+        is returned for a scalar value, other than a `~astropy.units.Quantity`,
+        so that it does not change the precision of the uncertainty array.
+    """
+    if type(uncertainty) not in _VARIANCE_CONVERTERS:
+        return value
+    to_variance, from_variance = _VARIANCE_CONVERTERS[type(uncertainty)]
+    # The conversions are powers of their inputs, so the factor is that of a unit uncertainty.
+    with np.errstate(divide="ignore"):
+        factor = from_variance(to_variance(1.0) * np.square(value))
+    if np.ndim(factor) == 0 and not isinstance(factor, np.ndarray):
+        factor = float(factor)
+    return factor
+
+
+def _propagate_rebin_uncertainties_add(uncertainty, data, mask, operation_is_mean,
+                                       operation_is_nantype, operation_ignores_mask):
+    """
+    Vectorized propagation of uncorrelated uncertainties for sum and mean rebinning.
+
+    Inputs are as for `~ndcube.utils.cube.propagate_rebin_uncertainties`.
+    The variances of the unmasked pixels in each bin are summed and, if the
+    operation is a mean, divided by the square of the number of unmasked pixels.
+    """
+    to_variance, from_variance = _VARIANCE_CONVERTERS[type(uncertainty)]
+    # Determine which pixels are excluded from the propagation.
+    excluded = None
+    if mask is not None and mask is not False and not operation_ignores_mask:
+        excluded = np.asarray(mask, dtype=bool)
+    if operation_is_nantype:
+        nan_mask = np.isnan(np.ma.getdata(data))
+        excluded = nan_mask if excluded is None else excluded | nan_mask
+    with np.errstate(divide="ignore"):
+        variance = to_variance(uncertainty.array)
+        if excluded is None:
+            variance = variance.sum(axis=0)
+        else:
+            variance = np.where(excluded, 0, variance).sum(axis=0)
+        if operation_is_mean:
+            if excluded is None:
+                n_unmasked = data.shape[0]
+            else:
+                n_unmasked = np.clip(np.logical_not(excluded).sum(axis=0), 1, None)
+            # Keep the precision of floating point uncertainties.
+            dtype = variance.dtype if np.issubdtype(variance.dtype, np.inexact) else np.float64
+            variance = (variance / np.square(n_unmasked, dtype=dtype)).astype(dtype, copy=False)
+        new_uncertainty = from_variance(variance)
+    return type(uncertainty)(new_uncertainty, unit=uncertainty.unit, copy=False)
+
+
+class WorldCoordsCache:
+    """
+    A least-recently-used cache of world coordinate arrays bounded by their size in bytes.
+
+    Used by `~ndcube.NDCube` to avoid recalculating the world coordinates returned by
+    :meth:`~ndcube.NDCube.axis_world_coords` and :meth:`~ndcube.NDCube.axis_world_coords_values`.
+    Entries are keyed on the identity of the WCS object used to calculate them, so
+    a WCS object which is modified in place after the coordinates have been calculated
+    will not be detected. In such cases `~ndcube.utils.cube.WorldCoordsCache.clear`
+    should be called.
+
+    Parameters
+    ----------
+    max_bytes: `int`, optional
+        The maximum total size of the cached arrays in bytes. When exceeded, the least
+        recently used entries are discarded. Entries larger than this are never cached.
+        Setting to 0 disables the cache.
+        Default is `~ndcube.utils.cube.WorldCoordsCache.default_max_bytes`.
+    """
+    default_max_bytes = 128 * 2**20
+
+    def __init__(self, max_bytes=None):
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self.max_bytes = self.default_max_bytes if max_bytes is None else max_bytes
+
+    @property
+    def max_bytes(self):
+        """
+        The maximum total size of the cached arrays in bytes.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+        self._max_bytes = int(max_bytes)
+        self._evict()
+
+    @property
+    def nbytes(self):
+        """
+        The total size of the cached arrays in bytes.
+        """
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _memory_size(arrays):
+        # Count the memory actually held by the arrays, following views such as
+        # broadcast arrays back to the array owning the memory, and counting
+        # memory shared between arrays only once.
+        owners = {}
+        for array in arrays:
+            while isinstance(getattr(array, "base", None), np.ndarray):
+                array = array.base
+            owners[id(array)] = getattr(array, "nbytes", 0)
+        return sum(owners.values())
+
+    def get(self, key, wcs):
+        """
+        Return the arrays cached under ``key`` for ``wcs`` or `None` if there are none.
+
+        Parameters
+        ----------
+        key: hashable
+            The key under which the arrays were cached.
+        wcs: `object`
+            The WCS object with which the arrays were calculated.
+        """
+        entry = self._entries.get((id(wcs), key))
+        # The WCS is stored alongside the arrays so the identity check
+        # cannot be fooled by the id of a deleted object being reused.
+        if entry is None or entry[0] is not wcs:
+            self._misses += 1
+            return None
+        self._entries.move_to_end((id(wcs), key))
+        self._hits += 1
+        return entry[1]
+
+    def put(self, key, wcs, arrays):
+        """
+        Cache arrays calculated with ``wcs`` under ``key``.
+
+        The arrays are made read-only so they cannot be altered by consumers of the cache.
+
+        Parameters
+        ----------
+        key: hashable
+            The key under which the arrays are cached.
+        wcs: `object`
+            The WCS object with which the arrays were calculated.
+        arrays: `tuple` of array-like
+            The arrays to cache.
+        """
+        nbytes = self._memory_size(arrays)
+        if nbytes > self._max_bytes:
+            return
+        for array in arrays:
+            array.flags.writeable = False
+        full_key = (id(wcs), key)
+        if full_key in self._entries:
+            self._nbytes -= self._entries.pop(full_key)[2]
+        self._entries[full_key] = (wcs, tuple(arrays), nbytes)
+        self._nbytes += nbytes
+        self._evict()
+
+    def _evict(self):
+        while self._nbytes > self._max_bytes and self._entries:
+            self._nbytes -= self._entries.popitem(last=False)[1][2]
+
+    def clear(self):
+        """
+        Remove all entries from the cache. Hit and miss statistics are retained.
+        """
+        self._entries.clear()
+        self._nbytes = 0
+
+    def info(self):
+        """
+        Report cache statistics.
+
+        Returns
+        -------
+        `collections.namedtuple`
+            Named tuple with fields ``hits`` and ``misses`` giving the number of
+            cache hits and misses, ``maxsize`` giving the maximum size of the cache
+            in bytes and ``currsize`` giving the current size in bytes.
+        """
+        return CacheInfo(self._hits, self._misses, self._max_bytes, self._nbytes)
+
+    def __deepcopy__(self, memo):
+        # Cached arrays are cheap to regenerate relative to deep copying them.
+        return type(self)(max_bytes=self._max_bytes)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.info()}>"
@@ -3,12 +3,14 @@
 Utilities for ndcube sequence.
 """
 
-from copy import deepcopy
+from copy import copy, deepcopy
 from collections import namedtuple
+from collections.abc import MutableSequence
 
 import numpy as np
 
 __all__ = ['SequenceItem',
+           'SlicedCubeList',
            'cube_like_index_to_sequence_and_common_axis_indices',
            'cube_like_tuple_item_to_sequence_items']
 
@@ -140,3 +142,109 @@ def cube_like_tuple_item_to_sequence_items(item, common_axis, common_axis_length
         first_cube_item[common_axis] = slice(start_common_axis_index, None)
         sequence_items.insert(0, SequenceItem(start_sequence_index, first_cube_item))
     return sequence_items
+
+
+class SlicedCubeList(MutableSequence):
+    """
+    A lazily evaluated list of the slices of cubes along an array axis.
+
+    Element ``i`` of the list is the slice at index ``i % n`` along ``axis``
+    of cube ``i // n``, where ``n`` is the length of the cubes along ``axis``.
+    The slices are only created when accessed, so the cost of creating the
+    list and of taking its length does not depend on the number of slices.
+    As a result, changes made to the cubes, e.g. to their ``meta``,
+    ``extra_coords`` or ``wcs``, after the list is created are seen in
+    the slices which have not yet been accessed.
+
+    The list can be modified like a `list`, e.g. with ``append``. The first
+    modification creates all the slices not yet accessed, after which the
+    list holds the slices and no longer depends on the cubes.
+
+    Parameters
+    ----------
+    cubes: sequence of `ndcube.NDCube`
+        The cubes to slice. All must have the same length along ``axis``.
+
+    axis: `int`
+        The non-negative array axis along which to slice the cubes.
+
+    cache: `bool`
+        If True, each slice is created once and the same object is returned on
+        later accesses. Otherwise a new cube is created on every access so that
+        no memory is retained when iterating through a long list.
+        Default is True.
+
+    drop_meta: `bool`
+        If True, the meta of the sliced cubes is set to None. Default is False.
+    """
+
+    def __init__(self, cubes, axis, cache=True, drop_meta=False):
+        self._cubes = cubes
+        self._axis = axis
+        self._axis_length = cubes[0].data.shape[axis] if len(cubes) else 0
+        self._indices = range(len(cubes) * self._axis_length)
+        self._cache = {} if cache else None
+        self._drop_meta = drop_meta
+        # The list of slices, once it has been created by modifying this list.
+        self._list = None
+
+    def _view(self, indices):
+        view = copy(self)
+        view._indices = indices
+        return view
+
+    def _slice_cube(self, index):
+        if self._cache is not None and index in self._cache:
+            return self._cache[index]
+        cube_index, axis_index = divmod(index, self._axis_length)
+        item = [slice(None)] * self._axis + [axis_index]
+        sliced_cube = self._cubes[cube_index][tuple(item)]
+        if self._drop_meta:
+            sliced_cube.meta = None
+        if self._cache is not None:
+            self._cache[index] = sliced_cube
+        return sliced_cube
+
+    def _materialize(self):
+        if self._list is None:
+            self._list = list(self)
+        return self._list
+
+    def copy(self):
+        """
+        Return a shallow copy of the list, sharing the slices already created.
+        """
+        view = self._view(self._indices)
+        if self._list is not None:
+            view._list = list(self._list)
+        return view
+
+    def __getitem__(self, item):
+        if self._list is not None:
+            return self._list[item]
+        if isinstance(item, slice):
+            # Slices share the cache of this list.
+            return self._view(self._indices[item])
+        return self._slice_cube(self._indices[item])
+
+    def __setitem__(self, item, value):
+        self._materialize()[item] = value
+
+    def __delitem__(self, item):
+        del self._materialize()[item]
+
+    def insert(self, index, value):
+        self._materialize().insert(index, value)
+
+    def __len__(self):
+        if self._list is not None:
+            return len(self._list)
+        return len(self._indices)
+
+    def __iter__(self):
+        if self._list is not None:
+            return iter(self._list)
+        return (self._slice_cube(index) for index in self._indices)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} of {len(self)} cubes sliced along array axis {self._axis}>"
@@ -1,9 +1,11 @@
 
 import numpy as np
 import pytest
-from astropy.nddata import StdDevUncertainty
+from astropy.coordinates import SkyCoord
+from astropy.nddata import InverseVariance, StdDevUncertainty, VarianceUncertainty
 
-from ndcube.utils.cube import propagate_rebin_uncertainties
+from ndcube.utils.cube import (WorldCoordsCache, get_crop_item_from_points,
+                               propagate_rebin_uncertainties)
 
 
 @pytest.fixture
@@ -97,3 +99,114 @@ def test_propagate_rebin_uncertainties_nan(stacked_pixel_data):
                                            np.nanmean, operation_ignores_mask=False)
     assert type(output) is type(expected)
     assert np.allclose(output.array, expected.array)
+
+
+@pytest.mark.parametrize("operation", [np.sum, np.mean, np.nansum, np.nanmean])
+@pytest.mark.parametrize("uncertainty_type", [StdDevUncertainty, VarianceUncertainty])
+@pytest.mark.parametrize("masked", [False, True])
+@pytest.mark.parametrize("operation_ignores_mask", [False, True])
+def test_propagate_rebin_uncertainties_vectorized(stacked_pixel_data, operation, uncertainty_type,
+                                                  masked, operation_ignores_mask):
+    data = stacked_pixel_data
+    data[1, 1, 2] = np.nan
+    mask = data < 0
+    if masked:
+        mask[3, 0, 0] = True
+        mask[:, 1, 1] = True
+    else:
+        mask = None
+    uncertainty = uncertainty_type(data * 0.1)
+    # The iterative algorithm only ignores the uncertainties of NaN data
+    # when applying a mask, so give them no weight for nan-type operations.
+    uncertainty.array[1, 1, 2] = 0 if operation in {np.nansum, np.nanmean} else 1
+
+    output = propagate_rebin_uncertainties(uncertainty, data, mask, operation,
+                                           operation_ignores_mask=operation_ignores_mask)
+    # An array correlation forces the iterative algorithm to be used.
+    expected = propagate_rebin_uncertainties(
+        uncertainty_type(uncertainty.array.copy()), data.copy(),
+        None if mask is None else mask.copy(), operation,
+        operation_ignores_mask=operation_ignores_mask, correlation=np.zeros(()))
+
+    assert type(output) is uncertainty_type
+    np.testing.assert_allclose(output.array, expected.array)
+
+
+def test_propagate_rebin_uncertainties_inverse_variance(stacked_pixel_data):
+    data = stacked_pixel_data
+    mask = data < 0
+    mask[3, 0, 0] = True
+    uncertainty = InverseVariance(1 / (data * 0.1)**2)
+
+    # Masked pixels do not contribute to the summed variance, and the
+    # variance of a mean is divided by the number of pixels squared.
+    variance = np.where(mask, 0, (data * 0.1)**2).sum(axis=0)
+    n_unmasked = np.logical_not(mask).sum(axis=0)
+    expected = n_unmasked**2 / variance
+    output = propagate_rebin_uncertainties(uncertainty, data, mask, np.mean)
+
+    assert type(output) is InverseVariance
+    np.testing.assert_allclose(output.array, expected)
+
+
+@pytest.mark.parametrize("uncertainty_type, scale", [(StdDevUncertainty, 1),
+                                                     (VarianceUncertainty, 2),
+                                                     (InverseVariance, -2)])
+def test_propagate_rebin_uncertainties_mean_scaling(stacked_pixel_data, uncertainty_type, scale):
+    # The uncertainty of the mean of n pixels of equal uncertainty is
+    # that uncertainty divided by sqrt(n), expressed in the uncertainty type.
+    data = stacked_pixel_data
+    n = data.shape[0]
+    uncertainty = uncertainty_type(np.full(data.shape, 0.5**scale))
+    expected = (0.5 / np.sqrt(n))**scale
+    output = propagate_rebin_uncertainties(uncertainty, data, None, np.mean)
+    np.testing.assert_allclose(output.array, expected)
+    output = propagate_rebin_uncertainties(uncertainty_type(uncertainty.array.copy()), data, None,
+                                           np.mean, correlation=np.zeros(()))
+    np.testing.assert_allclose(output.array, expected)
+
+
+@pytest.mark.parametrize("crop_by_values", (True, False))
+def test_get_crop_item_from_points_batched(wcs_3d_l_lt_ln, crop_by_values):
+    wcs = wcs_3d_l_lt_ln
+    # Array indices of the points. Only some components of the 2nd and 3rd points are given.
+    indices = [(1, 2, 0), (3, 6, 7), (5, 4, 3), (5, 4, 7)]
+    if crop_by_values:
+        points = [list(wcs.array_index_to_world_values(*index)) for index in indices]
+        # World values are ordered wavelength, latitude, longitude.
+        points[1][0] = None
+        points[2][1:] = None, None
+    else:
+        points = [list(wcs.array_index_to_world(*index)) for index in indices]
+        sky_index = [isinstance(obj, SkyCoord) for obj in points[0]].index(True)
+        points[1][1 - sky_index] = None
+        points[2][sky_index] = None
+
+    item = get_crop_item_from_points(points, wcs, crop_by_values)
+    assert item == (slice(1, 6), slice(2, 7), slice(0, 8))
+
+
+def test_world_coords_cache_lru():
+    wcs = object()
+    arrays = [np.zeros(10)]
+    cache = WorldCoordsCache(max_bytes=2 * arrays[0].nbytes)
+    cache.put("a", wcs, arrays)
+    cache.put("b", wcs, [np.zeros(10)])
+    assert cache.get("a", wcs) is not None
+    cache.put("c", wcs, [np.zeros(10)])
+    # "b" was the least recently used entry.
+    assert cache.get("b", wcs) is None
+    assert cache.get("a", wcs) is not None
+    assert cache.get("c", wcs) is not None
+    assert not arrays[0].flags.writeable
+    assert cache.info() == (3, 1, 2 * arrays[0].nbytes, 2 * arrays[0].nbytes)
+    # Entries are keyed on the identity of the WCS.
+    assert cache.get("a", object()) is None
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_world_coords_cache_max_bytes():
+    with pytest.raises(ValueError):
+        WorldCoordsCache(max_bytes=-1)
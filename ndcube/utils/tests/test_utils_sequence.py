@@ -1,8 +1,9 @@
 
+import numpy as np
 import pytest
 
 from ndcube import utils
-from ndcube.utils.sequence import SequenceItem
+from ndcube.utils.sequence import SequenceItem, SlicedCubeList
 
 # sample data for tests
 tuple_item0 = (0, slice(0, 3))
@@ -55,3 +56,44 @@ def test_cube_like_tuple_item_to_sequence_items_error2():
 def test_cube_like_tuple_item_to_sequence_items_error3():
     with pytest.raises(TypeError):
         utils.sequence.cube_like_tuple_item_to_sequence_items((1, 1), 1, [2, 2], 3)
+
+
+def test_sliced_cube_list(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    cubes = SlicedCubeList([cube, cube[1:]], 2)
+    assert len(cubes) == 2 * cube.data.shape[2]
+    assert cubes._cache == {}
+    np.testing.assert_array_equal(cubes[5].data, cube.data[1:, :, 1])
+    assert list(cubes._cache) == [5]
+    assert cubes[5].meta is not None
+    assert len(cubes[1::2]) == cube.data.shape[2]
+    assert cubes[1::2][2] is cubes[5]
+    with pytest.raises(IndexError):
+        cubes[len(cubes)]
+
+
+def test_sliced_cube_list_mutation(ndcube_3d_ln_lt_l):
+    cube = ndcube_3d_ln_lt_l
+    n_frames = cube.data.shape[0]
+    cubes = SlicedCubeList([cube], 0)
+    first = cubes[0]
+    copied = cubes.copy()
+    # Slices not yet accessed reflect changes to the cube.
+    cube.meta = {"changed": True}
+    assert cubes[1].meta == {"changed": True}
+    # Modifying the list creates the remaining slices, after which it behaves as a list.
+    cubes.append(first)
+    assert len(cubes) == n_frames + 1
+    assert cubes[-1] is first
+    assert cubes[0] is first
+    assert isinstance(cubes[1:], list)
+    cube.meta = {"changed": False}
+    assert cubes[n_frames - 1].meta == {"changed": True}
+    del cubes[0]
+    cubes[0] = first
+    cubes.insert(1, first)
+    assert len(cubes) == n_frames + 1
+    assert cubes[0] is cubes[1] is first
+    # Copies are not modified.
+    assert len(copied) == n_frames
+    assert copied[0] is first
@@ -1,9 +1,15 @@
 
+from unittest import mock
+
+import astropy.units as u
 import numpy as np
 import pytest
 from astropy.wcs import WCS
+from astropy.wcs.wcsapi import SlicedLowLevelWCS
 
 from ndcube import utils
+from ndcube.extra_coords import QuantityTableCoordinate
+from ndcube.wcs.wrappers import ResampledLowLevelWCS
 
 ht_with_celestial = {
     'CTYPE4': 'HPLN-TAN', 'CUNIT4': 'deg', 'CDELT4': 1, 'CRPIX4': 0, 'CRVAL4': 0, 'NAXIS4': 1,
@@ -159,6 +165,121 @@ def test_compare_wcs_physical_types(wcs_4d_t_l_lt_ln, wcs_3d_l_lt_ln):
     assert utils.wcs.compare_wcs_physical_types(wcs_4d_t_l_lt_ln, wcs_3d_l_lt_ln) is False
 
 
+def test_compare_wcs(wcs_3d_l_lt_ln, wcs_4d_t_l_lt_ln):
+    wcs = wcs_3d_l_lt_ln
+    shape = (4, 4, 4)
+    assert utils.wcs.compare_wcs(wcs, wcs, shape) is True
+    assert utils.wcs.compare_wcs(wcs, wcs.deepcopy(), shape) is True
+    assert utils.wcs.compare_wcs(SlicedLowLevelWCS(wcs, 1), SlicedLowLevelWCS(wcs.deepcopy(), 1),
+                                 shape[1:]) is True
+    # A different slice of the same WCS.
+    assert utils.wcs.compare_wcs(SlicedLowLevelWCS(wcs, 1), SlicedLowLevelWCS(wcs, 2),
+                                 shape[1:]) is False
+    assert utils.wcs.compare_wcs(wcs, wcs_4d_t_l_lt_ln, shape) is False
+
+    # Different parameters which give the same world coordinates.
+    header = wcs.to_header()
+    header['CDELT1'] /= 2
+    header['PC1_1'] = 2
+    equivalent_wcs = WCS(header=header)
+    assert not wcs.wcs.compare(equivalent_wcs.wcs)
+    assert utils.wcs.compare_wcs(wcs, equivalent_wcs, shape) is True
+
+    header['CRVAL1'] += 1
+    assert utils.wcs.compare_wcs(wcs, WCS(header=header), shape) is False
+
+
+@pytest.mark.parametrize("max_block_size", (2**20, 10))
+def test_compare_wcs_lookup_table(max_block_size):
+    tables = [np.arange(8) * u.m, np.arange(10, 17) * u.m]
+    shape = (7, 8)
+    wcs = QuantityTableCoordinate(*tables).wcs
+    assert utils.wcs.compare_wcs(wcs, QuantityTableCoordinate(*tables).wcs, shape,
+                                 max_block_size=max_block_size) is True
+    # Tables which differ only at an interior pixel.
+    changed_tables = [tables[0].copy(), tables[1].copy()]
+    changed_tables[0][2] += 0.5 * u.m
+    assert utils.wcs.compare_wcs(wcs, QuantityTableCoordinate(*changed_tables).wcs, shape,
+                                 max_block_size=max_block_size) is False
+    changed_tables = [tables[0], tables[1].copy()]
+    changed_tables[1][5] += 0.5 * u.m
+    assert utils.wcs.compare_wcs(wcs, QuantityTableCoordinate(*changed_tables).wcs, shape,
+                                 max_block_size=max_block_size) is False
+
+
+def test_compare_wcs_samples_pixels(wcs_3d_l_lt_ln):
+    wcs = wcs_3d_l_lt_ln
+    header = wcs.to_header()
+    header['CDELT1'] /= 2
+    header['PC1_1'] = 2
+    equivalent_wcs = WCS(header=header)
+    shape = (200, 300, 400)
+    max_samples = 1000
+    with mock.patch.object(equivalent_wcs, "pixel_to_world_values",
+                           wraps=equivalent_wcs.pixel_to_world_values) as pixel_to_world_values:
+        assert utils.wcs.compare_wcs(wcs, equivalent_wcs, shape, max_samples=max_samples) is True
+    # Only a sample of the 24 million pixels, including the corners, is evaluated.
+    n_evaluated = sum(args[0].size for args, _ in pixel_to_world_values.call_args_list)
+    assert n_evaluated <= max_samples
+    evaluated = [np.concatenate([args[i].ravel() for args, _ in pixel_to_world_values.call_args_list])
+                 for i in range(3)]
+    for pixels, n in zip(evaluated, shape[::-1]):
+        assert pixels.min() == 0
+        assert pixels.max() == n - 1
+
+
+@pytest.mark.parametrize("max_block_size", (2**20, 10))
+def test_compare_wcs_full_grid(max_block_size):
+    table = np.arange(100) * u.m
+    changed_table = table.copy()
+    changed_table[51] += 0.5 * u.m
+    wcs = QuantityTableCoordinate(table).wcs
+    changed_wcs = QuantityTableCoordinate(changed_table).wcs
+    # A change at a single pixel is only guaranteed to be found by comparing the full grid.
+    assert utils.wcs.compare_wcs(wcs, changed_wcs, (100,), max_samples=10) is True
+    assert utils.wcs.compare_wcs(wcs, changed_wcs, (100,), full_grid=True,
+                                 max_block_size=max_block_size) is False
+
+
+def test_compare_wcs_gwcs_parameters():
+    table = np.array([0, 1, 3, 4]) * u.m
+    wcs = QuantityTableCoordinate(table).wcs
+    equal_wcs = QuantityTableCoordinate(table).wcs
+    # Equal transforms are compared without calculating any world coordinates.
+    with mock.patch.object(wcs, "pixel_to_world_values") as pixel_to_world_values:
+        assert utils.wcs.compare_wcs(wcs, equal_wcs, (10**6,)) is True
+    pixel_to_world_values.assert_not_called()
+    changed_wcs = QuantityTableCoordinate(table + 1 * u.m).wcs
+    assert utils.wcs.compare_wcs(wcs, changed_wcs, (4,)) is False
+
+
+def test_resample_wcs(wcs_3d_l_lt_ln):
+    wcs = wcs_3d_l_lt_ln.deepcopy()
+    wcs.pixel_shape = (40, 30, 20)
+    # Resampling an unsliced WCS is not wrapped further.
+    assert isinstance(utils.wcs.resample_wcs(wcs, 2), ResampledLowLevelWCS)
+
+    nested_wcs = flat_wcs = wcs
+    for item, factor, rounding in [((slice(2, 18), 3, slice(1, None)), (2, 3), "floor"),
+                                   ((slice(1, 5), slice(2, None)), (2, 1), "ceil"),
+                                   ((slice(1, None), slice(None)), (1, 2), "floor")]:
+        nested_wcs = ResampledLowLevelWCS(SlicedLowLevelWCS(nested_wcs, item), factor,
+                                          rounding=rounding)
+        flat_wcs = utils.wcs.resample_wcs(SlicedLowLevelWCS(flat_wcs, item), factor,
+                                          rounding=rounding)
+        # The result is always a single slicing of a single resampling of the original WCS.
+        assert isinstance(flat_wcs, SlicedLowLevelWCS)
+        assert isinstance(flat_wcs._wcs, ResampledLowLevelWCS)
+        assert flat_wcs._wcs._wcs is wcs
+        assert flat_wcs.pixel_shape == nested_wcs.pixel_shape
+        assert flat_wcs.world_axis_physical_types == nested_wcs.world_axis_physical_types
+        pixel = [np.linspace(-1, n, 7) for n in nested_wcs.pixel_shape]
+        world = nested_wcs.pixel_to_world_values(*pixel)
+        np.testing.assert_allclose(flat_wcs.pixel_to_world_values(*pixel), world)
+        np.testing.assert_allclose(flat_wcs.world_to_pixel_values(*world),
+                                   nested_wcs.world_to_pixel_values(*world), atol=1e-10)
+
+
 def test_identify_invariant_axes(wcs_3d_l_lt_ln):
     source_wcs = wcs_3d_l_lt_ln
 
@@ -5,9 +5,16 @@ Miscellaneous WCS utilities.
 import numbers
 from collections import UserDict
 
+import gwcs
 import numpy as np
+from astropy.modeling import CompoundModel
+from astropy.modeling.mappings import Identity, Mapping
+from astropy.modeling.tabular import _Tabular
+from astropy.wcs import WCS
 from astropy.wcs.utils import pixel_to_pixel
-from astropy.wcs.wcsapi import BaseHighLevelWCS, BaseLowLevelWCS, low_level_api
+from astropy.wcs.wcsapi import BaseHighLevelWCS, BaseLowLevelWCS, SlicedLowLevelWCS, low_level_api
+
+from ndcube.wcs.wrappers import ResampledLowLevelWCS
 
 __all__ = ['array_indices_for_world_objects', 'convert_between_array_and_pixel_axes',
            'calculate_world_indices_from_axes', 'wcs_ivoa_mapping',
@@ -16,7 +23,7 @@ __all__ = ['array_indices_for_world_objects', 'convert_between_array_and_pixel_a
            'physical_type_to_world_axis', 'get_dependent_pixel_axes',
            'get_dependent_array_axes', 'get_dependent_world_axes',
            'get_dependent_physical_types', 'array_indices_for_world_objects',
-           'validate_physical_types']
+           'validate_physical_types', 'resample_wcs']
 
 
 class TwoWayDict(UserDict):
@@ -511,3 +518,224 @@ def identify_invariant_axes(source_wcs, target_wcs, input_shape, atol=1e-6, rtol
 
     return [np.allclose(input_coord, output_coord, atol=atol, rtol=rtol)
             for input_coord, output_coord in zip(input_pixel_coords, output_pixel_coords)]
+
+
+def compare_wcs(source_wcs, target_wcs, array_shape, atol=1e-6, rtol=1e-6,
+                full_grid=False, max_samples=2**12, max_block_size=2**20):
+    """
+    Checks whether two WCS objects give the same world coordinates for a pixel grid.
+
+    The checks are performed from cheapest to most expensive. WCS objects are
+    equal if they are the same object, if they are FITS WCS objects without
+    distortions with the same parameters, if they are `gwcs.wcs.WCS` objects
+    whose transforms are built from the same models with the same parameters,
+    or if they are slices or resamplings of equal WCS objects.
+    Otherwise, the world coordinates of both WCS objects are compared at
+    a regularly spaced sample of pixels including the corners of the grid,
+    or at every pixel of the grid if ``full_grid`` is `True`.
+
+    Parameters
+    ----------
+    source_wcs: `astropy.wcs.wcsapi.BaseHighLevelWCS` or `astropy.wcs.wcsapi.BaseLowLevelWCS`
+
+    target_wcs: `astropy.wcs.wcsapi.BaseHighLevelWCS` or `astropy.wcs.wcsapi.BaseLowLevelWCS`
+
+    array_shape: `tuple`
+        The array shape of the data.
+
+    atol: `float`
+        The absolute tolerance parameter for comparing world coordinates.
+
+    rtol: `float`
+        The relative tolerance parameter for comparing world coordinates.
+
+    full_grid: `bool`
+        If `True`, compare the world coordinates at every pixel rather than at a sample
+        of pixels. This detects differences confined to unsampled pixels, e.g. in lookup
+        tables, at the cost of calculating the world coordinates of the whole grid
+        for both WCS objects. Default is `False`.
+
+    max_samples: `int`
+        The approximate maximum number of pixels sampled if ``full_grid`` is `False`.
+        The first and last pixels along each axis are always sampled, so at least
+        ``2**len(array_shape)`` pixels are compared.
+
+    max_block_size: `int`
+        The maximum number of pixels whose world coordinates are calculated at once.
+
+    Returns
+    -------
+    result : `bool`
+    """
+    source_wcs = get_low_level_wcs(source_wcs, 'source_wcs')
+    target_wcs = get_low_level_wcs(target_wcs, 'target_wcs')
+    if _wcs_parameters_equal(source_wcs, target_wcs):
+        return True
+    if (source_wcs.pixel_n_dim != target_wcs.pixel_n_dim
+            or source_wcs.world_n_dim != target_wcs.world_n_dim
+            or source_wcs.world_axis_physical_types != target_wcs.world_axis_physical_types
+            or source_wcs.world_axis_units != target_wcs.world_axis_units):
+        return False
+    pixel_shape = tuple(array_shape[::-1])
+    if full_grid:
+        pixel_points = [np.arange(n) for n in pixel_shape]
+    else:
+        # Sample evenly spaced pixels along each axis, including the first and last.
+        n_samples = max(2, int(max_samples ** (1 / max(1, len(pixel_shape)))))
+        pixel_points = [np.unique(np.linspace(0, n - 1, min(n, n_samples)).round().astype(int))
+                        for n in pixel_shape]
+    # Compare the world coordinates in blocks along the last pixel axis.
+    block_length = max(1, max_block_size // max(1, int(np.prod([len(p) for p in pixel_points[:-1]]))))
+    for start in range(0, len(pixel_points[-1]), block_length):
+        block_points = pixel_points[:-1] + [pixel_points[-1][start:start + block_length]]
+        pixel_grid = np.meshgrid(*block_points, indexing="ij")
+        source_world = source_wcs.pixel_to_world_values(*pixel_grid)
+        target_world = target_wcs.pixel_to_world_values(*pixel_grid)
+        if source_wcs.world_n_dim == 1:
+            source_world, target_world = [source_world], [target_world]
+        if not all(np.allclose(source_coord, target_coord, atol=atol, rtol=rtol, equal_nan=True)
+                   for source_coord, target_coord in zip(source_world, target_world)):
+            return False
+    return True
+
+
+def _wcs_parameters_equal(source_wcs, target_wcs):
+    """
+    Checks whether two low level WCS objects are the same or have the same parameters.
+
+    Returns False if equality cannot be determined from the parameters.
+    """
+    if source_wcs is target_wcs:
+        return True
+    if type(source_wcs) is not type(target_wcs):
+        return False
+    if isinstance(source_wcs, WCS):
+        return (not source_wcs.has_distortion and not target_wcs.has_distortion
+                and source_wcs.wcs.compare(target_wcs.wcs))
+    if isinstance(source_wcs, gwcs.WCS):
+        return (source_wcs.world_axis_physical_types == target_wcs.world_axis_physical_types
+                and source_wcs.world_axis_units == target_wcs.world_axis_units
+                and source_wcs.bounding_box == target_wcs.bounding_box
+                and _models_equal(source_wcs.forward_transform, target_wcs.forward_transform))
+    if isinstance(source_wcs, SlicedLowLevelWCS):
+        return (source_wcs._slices_array == target_wcs._slices_array
+                and _wcs_parameters_equal(source_wcs._wcs, target_wcs._wcs))
+    if isinstance(source_wcs, ResampledLowLevelWCS):
+        return (np.array_equal(source_wcs._factor, target_wcs._factor)
+                and np.array_equal(source_wcs._offset, target_wcs._offset)
+                and _wcs_parameters_equal(source_wcs._wcs, target_wcs._wcs))
+    return False
+
+
+def _models_equal(source_model, target_model):
+    """
+    Checks whether two astropy models are built from the same models with the same parameters.
+
+    Returns False if equality cannot be determined from the structure of the models.
+    """
+    if source_model is target_model:
+        return True
+    if (type(source_model) is not type(target_model)
+            or source_model.n_inputs != target_model.n_inputs
+            or source_model.n_outputs != target_model.n_outputs):
+        return False
+    if isinstance(source_model, CompoundModel):
+        return (source_model.op == target_model.op and source_model.op != "fix_inputs"
+                and _models_equal(source_model.left, target_model.left)
+                and _models_equal(source_model.right, target_model.right))
+    if isinstance(source_model, Mapping):
+        return source_model.mapping == target_model.mapping
+    if isinstance(source_model, Identity):
+        return True
+    if isinstance(source_model, _Tabular):
+        return (source_model.method == target_model.method
+                and source_model.bounds_error == target_model.bounds_error
+                and np.array_equal(source_model.fill_value, target_model.fill_value, equal_nan=True)
+                and len(source_model.points) == len(target_model.points)
+                and all(_quantities_equal(source_points, target_points)
+                        for source_points, target_points in zip(source_model.points,
+                                                                target_model.points))
+                and _quantities_equal(source_model.lookup_table, target_model.lookup_table))
+    # Other models are only compared if they are fully described by their parameters.
+    if not source_model.param_names or source_model.param_names != target_model.param_names:
+        return False
+    return all(_quantities_equal(getattr(source_model, name), getattr(target_model, name))
+               for name in source_model.param_names)
+
+
+def _quantities_equal(source, target):
+    """
+    Checks whether two arrays, quantities or model parameters have the same values and units.
+    """
+    return (getattr(source, "unit", None) == getattr(target, "unit", None)
+            and np.array_equal(np.asanyarray(getattr(source, "value", source)),
+                               np.asanyarray(getattr(target, "value", target))))
+
+
+def resample_wcs(wcs, factor, offset=0, rounding=None):
+    """
+    Resample the pixel grid of a low level WCS without nesting wrappers.
+
+    A `~ndcube.wcs.wrappers.ResampledLowLevelWCS` around a
+    `~astropy.wcs.wcsapi.SlicedLowLevelWCS`, and/or around another
+    `~ndcube.wcs.wrappers.ResampledLowLevelWCS`, is equivalent to a single
+    `~astropy.wcs.wcsapi.SlicedLowLevelWCS` of a single
+    `~ndcube.wcs.wrappers.ResampledLowLevelWCS` of the original WCS.
+    Returning this form means that alternately slicing and resampling
+    a WCS, which astropy composes into one slicing wrapper, never builds
+    a chain of wrappers that slows every transformation.
+
+    Parameters
+    ----------
+    wcs: `astropy.wcs.wcsapi.BaseLowLevelWCS`
+        The WCS to resample.
+
+    factor: `int` or `float` or iterable of the same
+        The factor by which to increase the pixel size of each pixel axis.
+        See `~ndcube.wcs.wrappers.ResampledLowLevelWCS`.
+
+    offset: `int` or `float` or iterable of the same
+        The location on the input pixel grid which corresponds to zero on the
+        resampled grid.
+
+    rounding: `str`, optional
+        How the ``pixel_shape`` is rounded when the input pixel shape is not
+        a multiple of ``factor``. See `~ndcube.wcs.wrappers.ResampledLowLevelWCS`.
+
+    Returns
+    -------
+    `astropy.wcs.wcsapi.BaseLowLevelWCS`
+        The resampled WCS.
+    """
+    resampled_wcs = ResampledLowLevelWCS(wcs, factor, offset=offset, rounding=rounding)
+    pixel_shape = resampled_wcs.pixel_shape
+    if pixel_shape is not None and not all(isinstance(n, numbers.Integral) for n in pixel_shape):
+        # A fractional pixel shape cannot be represented by slicing.
+        return resampled_wcs
+    if isinstance(wcs, SlicedLowLevelWCS):
+        inner_wcs = wcs._wcs
+        inner_slices = list(wcs._slices_pixel)
+    else:
+        inner_wcs = wcs
+        inner_slices = [slice(None)] * wcs.pixel_n_dim
+    kept_axes = [i for i, item in enumerate(inner_slices) if not isinstance(item, numbers.Integral)]
+    if ((inner_wcs is wcs and not isinstance(wcs, ResampledLowLevelWCS))
+            or any((inner_slices[i].start or 0) < 0 for i in kept_axes)):
+        return resampled_wcs
+    # Express the resampling in the pixel grid of the inner WCS.
+    # Pixel axes dropped by slicing are left unresampled.
+    inner_factor = np.ones(inner_wcs.pixel_n_dim)
+    inner_offset = np.zeros(inner_wcs.pixel_n_dim)
+    inner_factor[kept_axes] = resampled_wcs._factor
+    inner_offset[kept_axes] = resampled_wcs._offset + [inner_slices[i].start or 0 for i in kept_axes]
+    if isinstance(inner_wcs, ResampledLowLevelWCS):
+        inner_offset = inner_wcs._offset + inner_wcs._factor * inner_offset
+        inner_factor = inner_wcs._factor * inner_factor
+        inner_wcs = inner_wcs._wcs
+    # The pixel shape is set by slicing so the inner rounding only has to keep it integer.
+    inner_wcs = ResampledLowLevelWCS(inner_wcs, inner_factor, offset=inner_offset,
+                                     rounding=rounding if pixel_shape is None else "ceil")
+    new_slices = list(inner_slices)
+    for i, axis in enumerate(kept_axes):
+        new_slices[axis] = slice(None) if pixel_shape is None else slice(0, pixel_shape[i])
+    return SlicedLowLevelWCS(inner_wcs, new_slices[::-1])
@@ -22,9 +22,18 @@ class ResampledLowLevelWCS(BaseWCSWrapper):
         The location on the underlying pixel grid which corresponds
         to zero on the top level pixel grid. If a scalar, the grid will be
         shifted by the same amount in all dimensions.
+
+    rounding: `str`, optional
+        How the ``pixel_shape`` is rounded when the underlying pixel shape is not
+        a multiple of ``factor``. ``"floor"`` discards the pixels which do not fill a
+        whole resampled pixel, while ``"ceil"`` includes them in a partial pixel.
+        If `None` (default), such elements of ``pixel_shape`` are returned as floats.
     """
 
-    def __init__(self, wcs, factor, offset=0):
+    def __init__(self, wcs, factor, offset=0, rounding=None):
+        if rounding not in (None, "floor", "ceil"):
+            raise ValueError(f"rounding must be None, 'floor' or 'ceil', not {rounding!r}.")
+        self._rounding = rounding
         self._wcs = wcs
         if np.isscalar(factor):
             factor = [factor] * self.pixel_n_dim
@@ -75,6 +84,10 @@ class ResampledLowLevelWCS(BaseWCSWrapper):
         int_elements = np.isclose(np.mod(underlying_shape, self._factor), 0,
                                   atol=np.finfo(float).resolution)
         pixel_shape = underlying_shape / self._factor
+        if self._rounding is not None:
+            rounded_shape = np.floor(pixel_shape) if self._rounding == "floor" else np.ceil(pixel_shape)
+            pixel_shape = np.where(int_elements, np.rint(pixel_shape), rounded_shape)
+            int_elements[:] = True
         return tuple(int(np.rint(i)) if is_int else i
                      for i, is_int in zip(pixel_shape, int_elements))
 
@@ -157,3 +157,18 @@ def test_int_fraction_pixel_shape(celestial_wcs):
     assert wcs.pixel_shape == (18, 21)
     for dim in wcs.pixel_shape:
         assert isinstance(dim, numbers.Integral)
+
+
+@pytest.mark.parametrize(('rounding', 'expected_shape'),
+                         [(None, (1.5, 1.75)), ('floor', (1, 1)), ('ceil', (2, 2))])
+def test_pixel_shape_rounding(celestial_2d_fitswcs, rounding, expected_shape):
+    wcs = ResampledLowLevelWCS(celestial_2d_fitswcs, 4, rounding=rounding)
+    assert wcs.pixel_shape == expected_shape
+    if rounding is not None:
+        for dim in wcs.pixel_shape:
+            assert isinstance(dim, numbers.Integral)
+
+
+def test_bad_rounding_error(celestial_2d_fitswcs):
+    with pytest.raises(ValueError, match="rounding"):
+        ResampledLowLevelWCS(celestial_2d_fitswcs, 4, rounding="round")